@@ -0,0 +1,193 @@
+# arsip.py
+"""Arsip tugas selesai (hot/cold) dan pemeliharaan database.
+
+Tugas berstatus Complete yang deadline-nya lebih lama dari `ARSIP_UMUR_HARI`
+dipindah dari `tugas_data` ke `tugas_arsip_data` (migrasi 8 dan 9; view `tugas`
+dan `tugas_arsip` menampilkan keduanya dengan nama kolom lama), sehingga tabel, indeks,
+rekap dan indeks teks penuh yang dipakai setiap halaman tetap kecil. Data arsip
+tetap bisa dibaca lewat argumen `sertakan_arsip=True` di `ManajerTugas`.
+
+Pemeliharaan menjalankan `PRAGMA optimize`, `ANALYZE`, optimasi indeks FTS5,
+kompaksi log perubahan, `PRAGMA incremental_vacuum` dan checkpoint WAL.
+Jadwalnya dicatat di tabel `meta` sehingga beberapa proses tidak menjalankannya
+bersamaan.
+
+Contoh:
+    python arsip.py --arsipkan --umur-hari 120
+    python arsip.py --pemeliharaan
+    python arsip.py --terjadwal                  # Untuk cron: hanya jalan jika sudah jatuh tempo
+    python arsip.py --pulihkan 12 15
+    python arsip.py --aktifkan-incremental-vacuum  # Sekali untuk file database lama (VACUUM penuh)
+"""
+
+import argparse
+import datetime
+import sqlite3
+import time
+import database
+from model import nomor_hari
+from pencatatan import get_logger
+from konfigurasi import ARSIP_UMUR_HARI, ARSIP_UKURAN_CHUNK, PEMELIHARAAN_INTERVAL_JAM, PERUBAHAN_SISAKAN
+
+_log = get_logger("arsip")
+
+_KOLOM = "id, matkul, deskripsi, hari, kode_prioritas, kode_status"  # Kolom berkode, sama di kedua tabel
+_KUNCI_JADWAL = "pemeliharaan_terakhir"
+
+def batas_arsip(umur_hari: int = ARSIP_UMUR_HARI, hari_ini: datetime.date | None = None) -> str:
+    """Tanggal (YYYY-MM-DD) sebelum mana tugas Complete boleh diarsipkan."""
+    hari_ini = hari_ini or datetime.date.today()
+    return (hari_ini - datetime.timedelta(days=umur_hari)).strftime("%Y-%m-%d")
+
+def arsipkan(conn: sqlite3.Connection, umur_hari: int = ARSIP_UMUR_HARI,
+             ukuran_chunk: int = ARSIP_UKURAN_CHUNK) -> int:
+    """Pindahkan tugas Complete yang deadline-nya lebih lama dari `umur_hari` ke `tugas_arsip_data`.
+    Setiap chunk satu transaksi tulis (pilih, salin lalu hapus) agar kunci tulis tidak ditahan lama.
+    Trigger pada `tugas_data` ikut memperbarui rekap harian, indeks FTS dan log perubahan.
+    Return jumlah tugas yang diarsipkan."""
+    batas = batas_arsip(umur_hari)
+    pilih = ("SELECT id FROM tugas_data WHERE kode_status = (SELECT kode FROM status_tugas WHERE nama = 'Complete')"
+             " AND hari < ? ORDER BY id LIMIT ?")
+    hari_batas = nomor_hari(datetime.date.fromisoformat(batas))
+    total = 0
+    while True:
+        # BEGIN IMMEDIATE sebelum SELECT: sqlite3 baru membuka transaksi di INSERT, sehingga tanpa ini
+        # tugas yang dibuka kembali di antara SELECT dan INSERT tetap ikut disalin lalu dihapus
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            daftar_id = [row[0] for row in conn.execute(pilih, (hari_batas, ukuran_chunk))]
+            if daftar_id:
+                tanda = ", ".join("?" * len(daftar_id))
+                conn.execute(f"INSERT OR REPLACE INTO tugas_arsip_data ({_KOLOM}) "
+                             f"SELECT {_KOLOM} FROM tugas_data WHERE id IN ({tanda})", daftar_id)
+                conn.execute(f"DELETE FROM tugas_data WHERE id IN ({tanda})", daftar_id)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        if not daftar_id:
+            break
+        total += len(daftar_id)
+    if total:
+        _log.info("Tugas diarsipkan", extra={"kv": {"jumlah": total, "deadline_sebelum": batas}})
+    return total
+
+def pulihkan(conn: sqlite3.Connection, daftar_id: list[int]) -> int:
+    """Kembalikan tugas dari arsip ke tabel `tugas_data` (ID tetap sama). Return jumlah yang dipulihkan."""
+    total = 0
+    with conn:
+        for awal in range(0, len(daftar_id), 500):
+            potongan = daftar_id[awal:awal + 500]
+            tanda = ", ".join("?" * len(potongan))
+            conn.execute(f"INSERT INTO tugas_data ({_KOLOM}) SELECT {_KOLOM} FROM tugas_arsip_data WHERE id IN ({tanda})",
+                         potongan)
+            total += conn.execute(f"DELETE FROM tugas_arsip_data WHERE id IN ({tanda})", potongan).rowcount
+    return total
+
+def pemeliharaan(conn: sqlite3.Connection, sisakan_perubahan: int = PERUBAHAN_SISAKAN) -> dict[str, float]:
+    """Jalankan pekerjaan pemeliharaan. Return durasi (detik) tiap langkah plus halaman kosong sebelum/sesudah."""
+    hasil: dict[str, float] = {"halaman_kosong_awal": conn.execute("PRAGMA freelist_count").fetchone()[0]}
+
+    def langkah(nama: str, fungsi) -> None:
+        mulai = time.perf_counter()
+        fungsi()
+        hasil[nama] = time.perf_counter() - mulai
+
+    def kompaksi_perubahan():
+        with conn:
+            conn.execute("DELETE FROM tugas_perubahan WHERE seq <= "
+                         "(SELECT seq FROM sqlite_sequence WHERE name = 'tugas_perubahan') - ?", (sisakan_perubahan,))
+
+    def optimasi_fts():
+        with conn:
+            conn.execute("INSERT INTO tugas_fts (tugas_fts) VALUES ('optimize')")  # Gabungkan segmen b-tree FTS5
+
+    langkah("kompaksi_perubahan", kompaksi_perubahan)
+    langkah("optimasi_fts", optimasi_fts)
+    langkah("analyze", lambda: conn.execute("ANALYZE"))
+    langkah("optimize", lambda: conn.execute("PRAGMA optimize").fetchall())
+    # Tanpa auto_vacuum = INCREMENTAL pragma ini tidak melakukan apa-apa (lihat aktifkan_incremental_vacuum).
+    # executescript menjalankan statement sampai selesai; execute() hanya satu langkah = satu halaman.
+    langkah("incremental_vacuum", lambda: conn.executescript("PRAGMA incremental_vacuum"))
+    langkah("checkpoint_wal", lambda: conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall())
+    hasil["halaman_kosong_akhir"] = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    _log.info("Pemeliharaan selesai", extra={"kv": {k: round(v, 4) for k, v in hasil.items()}})
+    return hasil
+
+def aktifkan_incremental_vacuum(conn: sqlite3.Connection) -> bool:
+    """Ubah file database lama ke auto_vacuum INCREMENTAL. Butuh satu VACUUM penuh (menyalin seluruh file).
+    Return True jika VACUUM dijalankan, False jika mode sudah INCREMENTAL."""
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        return False
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("VACUUM")
+    return True
+
+def klaim_jadwal(conn: sqlite3.Connection, interval_jam: float = PEMELIHARAAN_INTERVAL_JAM) -> bool:
+    """Return True (dan catat waktu sekarang) jika pemeliharaan terakhir sudah lebih dari `interval_jam` lalu.
+    Dibaca dan ditulis dalam satu transaksi tulis, jadi hanya satu proses yang mendapat giliran."""
+    sekarang = datetime.datetime.now()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT nilai FROM meta WHERE kunci = ?", (_KUNCI_JADWAL,)).fetchone()
+        if row and sekarang - datetime.datetime.fromisoformat(row[0]) < datetime.timedelta(hours=interval_jam):
+            conn.rollback()
+            return False
+        conn.execute("INSERT OR REPLACE INTO meta (kunci, nilai) VALUES (?, ?)",
+                     (_KUNCI_JADWAL, sekarang.isoformat(timespec="seconds")))
+        conn.commit()
+        return True
+    except BaseException:
+        conn.rollback()
+        raise
+
+def jalankan_terjadwal(conn: sqlite3.Connection, interval_jam: float = PEMELIHARAAN_INTERVAL_JAM,
+                       umur_hari: int | None = ARSIP_UMUR_HARI) -> dict | None:
+    """Arsipkan lalu jalankan pemeliharaan jika sudah jatuh tempo (`umur_hari=None`: tanpa arsip).
+    Return ringkasan, atau None jika belum waktunya."""
+    if not klaim_jadwal(conn, interval_jam):
+        return None
+    jumlah = arsipkan(conn, umur_hari) if umur_hari is not None else 0
+    return {"diarsipkan": jumlah, **pemeliharaan(conn)}
+
+def status(conn: sqlite3.Connection) -> dict:
+    """Keadaan arsip dan pemeliharaan untuk halaman diagnostik."""
+    row = conn.execute("SELECT nilai FROM meta WHERE kunci = ?", (_KUNCI_JADWAL,)).fetchone()
+    return {
+        "jumlah_arsip": conn.execute("SELECT COUNT(*) FROM tugas_arsip_data").fetchone()[0],
+        "pemeliharaan_terakhir": row[0] if row else None,
+        "auto_vacuum": {0: "NONE", 1: "FULL", 2: "INCREMENTAL"}.get(conn.execute("PRAGMA auto_vacuum").fetchone()[0]),
+        "halaman_kosong": conn.execute("PRAGMA freelist_count").fetchone()[0],
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Arsip tugas selesai dan pemeliharaan database.")
+    parser.add_argument("--arsipkan", action="store_true", help="Pindahkan tugas Complete lama ke arsip")
+    parser.add_argument("--umur-hari", type=int, default=ARSIP_UMUR_HARI, help="Umur deadline minimal untuk diarsipkan")
+    parser.add_argument("--pemeliharaan", action="store_true", help="ANALYZE, optimize, incremental vacuum, dll.")
+    parser.add_argument("--terjadwal", action="store_true", help="Arsip + pemeliharaan, hanya jika sudah jatuh tempo")
+    parser.add_argument("--pulihkan", type=int, nargs="+", metavar="ID", help="Kembalikan tugas dari arsip")
+    parser.add_argument("--aktifkan-incremental-vacuum", action="store_true",
+                        help="Ubah file lama ke auto_vacuum INCREMENTAL (VACUUM penuh sekali)")
+    args = parser.parse_args(argv)
+
+    if not database.setup_database_initial():
+        print("Setup database GAGAL.")
+        return 1
+    with database.koneksi() as conn:
+        if args.aktifkan_incremental_vacuum:
+            print("VACUUM penuh selesai." if aktifkan_incremental_vacuum(conn) else "auto_vacuum sudah INCREMENTAL.")
+        if args.pulihkan:
+            print(f"{pulihkan(conn, args.pulihkan)} tugas dipulihkan dari arsip.")
+        if args.arsipkan:
+            print(f"{arsipkan(conn, args.umur_hari)} tugas diarsipkan.")
+        if args.pemeliharaan:
+            for nama, nilai in pemeliharaan(conn).items():
+                print(f"{nama:<22} {nilai}")
+        if args.terjadwal:
+            hasil = jalankan_terjadwal(conn, umur_hari=args.umur_hari)
+            print("Belum jatuh tempo." if hasil is None else hasil)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
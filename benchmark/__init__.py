@@ -0,0 +1,10 @@
+# benchmark/__init__.py
+"""Pengukuran performa penyimpanan tugas.
+
+    python -m benchmark dataset bench.db --jumlah 1000000
+    python -m benchmark jalankan bench.db --keluaran hasil.json
+    python -m benchmark bandingkan hasil_lama.json hasil.json
+
+Skrip khusus per topik juga bisa dijalankan sendiri, misalnya
+`python -m benchmark.rekap_harian` dan `python -m benchmark.model`.
+"""
@@ -0,0 +1,50 @@
+# benchmark/__main__.py
+"""Titik masuk `python -m benchmark`: buat dataset, jalankan suite, bandingkan hasil."""
+
+import argparse
+from benchmark import dataset, suite
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description="Benchmark penyimpanan tugas.")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+
+    p_dataset = sub.add_parser("dataset", help="Buat file database berisi tugas sintetis")
+    p_dataset.add_argument("file", help="Path file database baru")
+    p_dataset.add_argument("--jumlah", type=int, default=100_000, help="Jumlah tugas (10k sampai 10M)")
+    p_dataset.add_argument("--seed", type=int, default=42)
+
+    p_jalankan = sub.add_parser("jalankan", help="Jalankan suite pada sebuah dataset")
+    p_jalankan.add_argument("file", help="Path dataset (tidak diubah; suite memakai salinan)")
+    p_jalankan.add_argument("--keluaran", help="Simpan hasil JSON ke file ini")
+    p_jalankan.add_argument("--ulang", type=int, default=30, help="Pengulangan per kasus")
+    p_jalankan.add_argument("--pemanasan", type=int, default=3, help="Putaran pemanasan per kasus")
+    p_jalankan.add_argument("--kasus", help="Regex nama kasus yang dijalankan")
+    p_jalankan.add_argument("--dengan-cache", action="store_true", help="Aktifkan cache query ManajerTugas")
+
+    p_banding = sub.add_parser("bandingkan", help="Bandingkan dua hasil JSON dan tandai regresi")
+    p_banding.add_argument("lama")
+    p_banding.add_argument("baru")
+    p_banding.add_argument("--ambang", type=float, default=0.15, help="Kenaikan relatif yang dianggap regresi")
+
+    args = parser.parse_args(argv)
+    if args.perintah == "dataset":
+        dataset.buat_dataset(args.file, args.jumlah, args.seed)
+        return 0
+
+    if args.perintah == "jalankan":
+        hasil = suite.jalankan(args.file, ulang=args.ulang, pemanasan=args.pemanasan,
+                               pola=args.kasus, dengan_cache=args.dengan_cache)
+        if args.keluaran:
+            suite.simpan_json(hasil, args.keluaran)
+            print(f"\nHasil disimpan ke '{args.keluaran}'.")
+        return 0
+
+    regresi = suite.bandingkan(suite.baca_json(args.lama), suite.baca_json(args.baru), args.ambang)
+    for r in regresi:
+        print(f"REGRESI {r['kasus']:<36} {r['metrik']}: {r['lama']:.3f} -> {r['baru']:.3f} ms ({r['perubahan']:+.0%})")
+    if not regresi:
+        print(f"Tidak ada regresi di atas {args.ambang:.0%}.")
+    return 1 if regresi else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+# benchmark/dataframe.py
+"""Bandingkan DataFrame tugas tanpa tipe (object) dengan DataFrame bertipe: waktu baca, memori dan format tanggal.
+
+    python -m benchmark.dataframe --jumlah 200000 --ulang 5
+"""
+
+import argparse
+import datetime
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+import pandas as pd
+import migrasi
+from benchmark.dataset import isi_tugas
+from model import tipekan_dataframe, format_tanggal_kolom
+
+SQL = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas ORDER BY hari, id"
+
+def format_tanggal_per_baris(tanggal):
+    """Cara lama di main_app: dipanggil lewat `Series.apply`, satu strptime/strftime per baris."""
+    if isinstance(tanggal, str):
+        return datetime.datetime.strptime(tanggal, "%Y-%m-%d").date().strftime("%d-%m-%Y")
+    return tanggal.strftime("%d-%m-%Y")
+
+def median_ms(fungsi, ulang: int) -> float:
+    waktu = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        waktu.append((time.perf_counter() - mulai) * 1000)
+    return statistics.median(waktu)
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jumlah", type=int, default=100_000, help="Jumlah tugas sintetis")
+    parser.add_argument("--ulang", type=int, default=5, help="Pengulangan per kasus")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as folder:
+        conn = sqlite3.connect(os.path.join(folder, "bench.db"), detect_types=sqlite3.PARSE_DECLTYPES)
+        migrasi.jalankan_migrasi(conn)
+        isi_tugas(conn, args.jumlah)
+
+        mentah = pd.read_sql_query(SQL, conn)
+        print(f"{args.jumlah} tugas, pandas {pd.__version__}, baca SQL {median_ms(lambda: pd.read_sql_query(SQL, conn), args.ulang):.1f} ms")
+        jalur = {
+            "object (tanpa tipe)": lambda: mentah.copy(),
+            "bertipe": lambda: tipekan_dataframe(mentah.copy(), pyarrow=False),
+            "bertipe + pyarrow": lambda: tipekan_dataframe(mentah.copy(), pyarrow=True),
+        }
+        print(f"{'jalur':<22}{'konversi (ms)':>15}{'memori (MiB)':>14}{'format per baris (ms)':>24}{'format vektor (ms)':>20}")
+        for nama, buat in jalur.items():
+            df = buat()
+            memori = df.memory_usage(deep=True).sum() / 1024 / 1024
+            konversi = median_ms(buat, args.ulang)
+            per_baris = median_ms(lambda: df["deadline"].apply(format_tanggal_per_baris), args.ulang)
+            vektor = median_ms(lambda: format_tanggal_kolom(df["deadline"]), args.ulang)
+            print(f"{nama:<22}{konversi:>15.1f}{memori:>14.2f}{per_baris:>24.1f}{vektor:>20.1f}")
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmark/dataset.py
+"""Pembuat dataset tugas sintetis yang bisa direproduksi (seed tetap = data sama).
+
+Distribusinya dibuat mirip pemakaian nyata: beberapa mata kuliah jauh lebih
+sering muncul, deadline menumpuk di hari kerja dan di sekitar UTS/UAS, tugas
+yang deadline-nya sudah lewat sebagian besar sudah Complete, dan prioritas
+Medium paling banyak.
+
+    python -m benchmark dataset bench.db --jumlah 1000000
+"""
+
+import datetime
+import itertools
+import random
+import sqlite3
+import time
+from typing import Iterator
+import migrasi
+from konfigurasi import DAFTAR_PRIORITAS
+from model import nomor_hari
+
+DAFTAR_MATKUL = [
+    "Pemrograman Berorientasi Objek", "Basis Data II", "Jaringan Komputer I", "Statistika",
+    "Kecerdasan Buatan", "Teknik Digital dan Sistem Tertanam", "Bahasa Inggris", "Matematika Diskrit",
+    "Sistem Operasi", "Struktur Data", "Algoritma dan Pemrograman", "Rekayasa Perangkat Lunak",
+    "Pemrograman Web", "Pemrograman Mobile", "Keamanan Informasi", "Interaksi Manusia dan Komputer",
+    "Kalkulus", "Aljabar Linear", "Arsitektur Komputer", "Komputasi Awan",
+    "Data Mining", "Pendidikan Pancasila", "Kewarganegaraan", "Bahasa Indonesia",
+    "Manajemen Proyek TI", "Etika Profesi", "Grafika Komputer", "Sistem Informasi",
+    "Pengolahan Citra Digital", "Metodologi Penelitian",
+]
+JENIS_TUGAS = [
+    "Laporan Praktikum Jobsheet {n}", "Latihan Soal sebanyak {n} soal", "Kuis {n}",
+    "Tugas Besar tahap {n}", "Resume materi pertemuan {n}", "Presentasi kelompok {n}",
+]
+BOBOT_PRIORITAS = {"Urgent": 10, "High": 25, "Medium": 45, "Low": 20}
+UKURAN_CHUNK_ISI = 50_000
+
+def baris_tugas(jumlah: int, seed: int = 42,
+                awal: datetime.date = datetime.date(2025, 2, 3),
+                hari_ini: datetime.date = datetime.date(2025, 5, 15)) -> Iterator[tuple[str, str, str, str, str]]:
+    """Hasilkan `jumlah` baris (matkul, deskripsi, deadline, prioritas, status) secara deterministik."""
+    acak = random.Random(seed)
+    bobot_matkul = [1 / (i + 1) ** 0.8 for i in range(len(DAFTAR_MATKUL))]  # Distribusi mirip Zipf
+    prioritas = list(BOBOT_PRIORITAS)
+    bobot_prioritas = [BOBOT_PRIORITAS[p] for p in prioritas]
+    puncak = [awal + datetime.timedelta(days=56), awal + datetime.timedelta(days=126)]  # UTS dan UAS
+
+    for i in range(jumlah):
+        matkul = acak.choices(DAFTAR_MATKUL, bobot_matkul)[0]
+        deskripsi = acak.choice(JENIS_TUGAS).format(n=acak.randint(1, 14))
+        if acak.random() < 0.3:
+            deadline = acak.choice(puncak) + datetime.timedelta(days=round(acak.gauss(0, 4)))
+        else:
+            deadline = awal + datetime.timedelta(days=acak.randrange(140))
+        if deadline.weekday() >= 5 and acak.random() < 0.7:
+            deadline -= datetime.timedelta(days=deadline.weekday() - 4)  # Geser akhir pekan ke Jumat
+
+        if deadline < hari_ini:
+            status = acak.choices(["Complete", "Need Approval", "In Progress", "Pending"], [85, 7, 5, 3])[0]
+        else:
+            status = acak.choices(["Pending", "In Progress", "Need Approval", "Complete"], [50, 30, 8, 12])[0]
+        yield matkul, f"{deskripsi} ({i})", deadline.isoformat(), acak.choices(prioritas, bobot_prioritas)[0], status
+
+def isi_tugas(conn: sqlite3.Connection, jumlah: int, seed: int = 42, ukuran_chunk: int = UKURAN_CHUNK_ISI) -> None:
+    """Masukkan `jumlah` tugas sintetis ke database yang skemanya sudah dimigrasi."""
+    sql = """
+    INSERT INTO tugas_data (matkul, deskripsi, hari, kode_prioritas, kode_status)
+    VALUES (?, ?, ?, (SELECT kode FROM prioritas_tugas WHERE nama = ?), (SELECT kode FROM status_tugas WHERE nama = ?))
+    """
+    sumber = ((matkul, deskripsi, nomor_hari(datetime.date.fromisoformat(deadline)), prioritas, status)
+              for matkul, deskripsi, deadline, prioritas, status in baris_tugas(jumlah, seed))
+    while True:
+        chunk = list(itertools.islice(sumber, ukuran_chunk))
+        if not chunk:
+            break
+        with conn:
+            conn.executemany(sql, chunk)
+
+def buat_dataset(path: str, jumlah: int, seed: int = 42) -> None:
+    """Buat file database baru berisi `jumlah` tugas sintetis (skema terbaru + ANALYZE)."""
+    assert set(BOBOT_PRIORITAS) == set(DAFTAR_PRIORITAS)
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = OFF")  # Hanya untuk pengisian data uji
+        migrasi.jalankan_migrasi(conn)
+        if conn.execute("SELECT COUNT(*) FROM tugas_data").fetchone()[0]:
+            raise ValueError(f"Database '{path}' sudah berisi tugas; gunakan file baru.")
+        mulai = time.perf_counter()
+        isi_tugas(conn, jumlah, seed)
+        conn.execute("ANALYZE")
+        print(f"{jumlah} tugas sintetis ditulis ke '{path}' dalam {time.perf_counter() - mulai:.1f} detik.")
+    finally:
+        conn.close()
@@ -0,0 +1,66 @@
+# benchmark/model.py
+"""Ukur memori dan waktu hidrasi objek tugas untuk hasil query besar.
+
+    python -m benchmark.model --jumlah 200000
+"""
+
+import argparse
+import datetime
+import time
+import tracemalloc
+from model import Tugas, TugasBatch
+from benchmark.dataset import baris_tugas
+
+class TugasDenganDict:
+    """Tata letak Tugas lama (tanpa __slots__), hanya sebagai pembanding."""
+
+    def __init__(self, matkul, deskripsi, deadline, prioritas, status, id_tugas=None):
+        self.id = id_tugas
+        self.matkul = matkul.strip() if matkul else "Umum"
+        self.deskripsi = deskripsi.strip() if deskripsi else "Tanpa Deskripsi"
+        self.prioritas = prioritas if prioritas else "Medium"
+        self.status = status if status else "Pending"
+        if isinstance(deadline, datetime.date):
+            self.deadline = deadline
+        else:
+            self.deadline = datetime.datetime.strptime(deadline, "%Y-%m-%d").date()
+
+def buat_rows(jumlah: int, seed: int = 42) -> list[tuple]:
+    """Baris seperti hasil SELECT dengan PARSE_DECLTYPES (deadline sudah berupa date)."""
+    return [
+        (i, matkul, deskripsi, datetime.date.fromisoformat(deadline), prioritas, status)
+        for i, (matkul, deskripsi, deadline, prioritas, status) in enumerate(baris_tugas(jumlah, seed), start=1)
+    ]
+
+def ukur(nama: str, fungsi, rows: list[tuple]) -> None:
+    """Waktu diukur tanpa tracemalloc (overhead-nya besar); memori diukur pada putaran kedua."""
+    mulai = time.perf_counter()
+    hasil = fungsi(rows)
+    durasi = time.perf_counter() - mulai
+    del hasil
+
+    tracemalloc.start()
+    hasil = fungsi(rows)
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del hasil
+    print(f"{nama:<34}{durasi * 1000:>12.1f}{puncak / 1024 / 1024:>14.2f}{puncak / len(rows):>12.0f}")
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jumlah", type=int, default=100_000, help="Jumlah baris sintetis")
+    args = parser.parse_args(argv)
+
+    rows = buat_rows(args.jumlah)
+    rows_teks = [(*row[:3], row[3].isoformat(), *row[4:]) for row in rows]
+    print(f"{args.jumlah} baris")
+    print(f"{'jalur':<34}{'waktu (ms)':>12}{'puncak (MiB)':>14}{'byte/baris':>12}")
+    ukur("TugasDenganDict(...) [lama]", lambda rs: [TugasDenganDict(r[1], r[2], r[3], r[4], r[5], r[0]) for r in rs], rows)
+    ukur("TugasDenganDict(...) deadline teks", lambda rs: [TugasDenganDict(r[1], r[2], r[3], r[4], r[5], r[0]) for r in rs], rows_teks)
+    ukur("Tugas(...) [slots, validasi]", lambda rs: [Tugas(r[1], r[2], r[3], r[4], r[5], r[0]) for r in rs], rows)
+    ukur("Tugas.dari_db(*row)", lambda rs: [Tugas.dari_db(*r) for r in rs], rows)
+    ukur("Tugas.dari_db(*row) deadline teks", lambda rs: [Tugas.dari_db(*r) for r in rs], rows_teks)
+    ukur("TugasBatch.dari_rows(rows)", TugasBatch.dari_rows, rows)
+
+if __name__ == "__main__":
+    main()
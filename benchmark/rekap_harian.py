@@ -0,0 +1,67 @@
+# benchmark/rekap_harian.py
+"""Bandingkan agregasi langsung atas tabel `tugas_data` dengan membaca `rekap_harian`.
+
+    python -m benchmark.rekap_harian --jumlah 200000 --ulang 20
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+import migrasi
+from benchmark.dataset import isi_tugas
+
+KASUS = {
+    "total": (
+        "SELECT COUNT(*) FROM tugas_data",
+        "SELECT COALESCE(SUM(jumlah), 0) FROM rekap_harian",
+        (),
+    ),
+    "ringkasan": (
+        "SELECT status, prioritas, COUNT(*) FROM tugas GROUP BY kode_status, kode_prioritas ORDER BY status, prioritas",
+        "SELECT status, prioritas, SUM(jumlah) FROM rekap_harian GROUP BY status, prioritas",
+        (),
+    ),
+    "total satu hari": (
+        "SELECT COUNT(*) FROM tugas_data WHERE hari >= CAST(strftime('%s', ?) AS INTEGER) / 86400"
+        " AND hari < CAST(strftime('%s', ?) AS INTEGER) / 86400",
+        "SELECT COALESCE(SUM(jumlah), 0) FROM rekap_harian WHERE tanggal >= ? AND tanggal < ?",
+        ("2025-03-31", "2025-04-01"),
+    ),
+}
+
+def ukur(conn: sqlite3.Connection, sql: str, params: tuple, ulang: int) -> float:
+    """Median waktu eksekusi dalam milidetik."""
+    waktu = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        waktu.append((time.perf_counter() - mulai) * 1000)
+    return statistics.median(waktu)
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jumlah", type=int, default=100_000, help="Jumlah tugas sintetis")
+    parser.add_argument("--ulang", type=int, default=20, help="Pengulangan per query")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as folder:
+        conn = sqlite3.connect(os.path.join(folder, "bench.db"))
+        migrasi.jalankan_migrasi(conn)
+        mulai = time.perf_counter()
+        isi_tugas(conn, args.jumlah)
+        print(f"{args.jumlah} tugas diisi dalam {time.perf_counter() - mulai:.2f} detik "
+              f"({conn.execute('SELECT COUNT(*) FROM rekap_harian').fetchone()[0]} baris rekap)")
+
+        print(f"{'kasus':<18}{'langsung (ms)':>15}{'rekap (ms)':>13}{'percepatan':>12}")
+        for nama, (sql_langsung, sql_rekap, params) in KASUS.items():
+            assert conn.execute(sql_langsung, params).fetchall() == conn.execute(sql_rekap, params).fetchall()
+            langsung = ukur(conn, sql_langsung, params, args.ulang)
+            rekap = ukur(conn, sql_rekap, params, args.ulang)
+            print(f"{nama:<18}{langsung:>15.3f}{rekap:>13.3f}{langsung / rekap:>11.1f}x")
+        conn.close()
+
+if __name__ == "__main__":
+    main()
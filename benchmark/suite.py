@@ -0,0 +1,206 @@
+# benchmark/suite.py
+"""Ukur setiap method publik `ManajerTugas`, `database.get_dataframe` dan jalur data
+setiap halaman Streamlit pada sebuah dataset, lalu simpan hasilnya sebagai JSON.
+
+    python -m benchmark jalankan bench.db --keluaran hasil.json
+    python -m benchmark bandingkan lama.json baru.json --ambang 0.15
+"""
+
+import datetime
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import re
+import shutil
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+import database
+from manajer_tugas import ManajerTugas
+from model import Tugas, format_tanggal_kolom
+
+def persentil(data: list[float], p: float) -> float:
+    """Persentil dengan metode nearest-rank (data tidak perlu terurut)."""
+    urut = sorted(data)
+    indeks = max(0, min(len(urut) - 1, math.ceil(p / 100 * len(urut)) - 1))
+    return urut[indeks]
+
+class Konteks:
+    """Nilai acuan dari dataset yang dipakai kasus benchmark (ID, tanggal, kunci halaman)."""
+
+    def __init__(self, conn: sqlite3.Connection, seed: int):
+        self.acak = random.Random(seed)
+        self.id_min, self.id_maks = conn.execute("SELECT MIN(id), MAX(id) FROM tugas_data").fetchone()
+        # Tanggal dengan tugas terbanyak = kasus terburuk untuk filter per hari
+        tanggal = conn.execute("SELECT tanggal FROM rekap_harian GROUP BY tanggal ORDER BY SUM(jumlah) DESC LIMIT 1").fetchone()[0]
+        self.tanggal = datetime.date.fromisoformat(tanggal)
+        baris = conn.execute("SELECT deadline, id FROM tugas ORDER BY hari DESC, id DESC LIMIT 1 OFFSET 100").fetchone()
+        self.kunci_dalam = (str(baris[0]), baris[1]) if baris else None
+        self.id_hapus = itertools.count(self.id_maks, -1)  # Hapus dari ujung agar tiap putaran kena ID yang ada
+        self.status_bergilir = itertools.cycle(["In Progress", "Pending"])  # Agar setiap putaran benar-benar mengubah baris
+
+    def id_acak(self) -> int:
+        return self.acak.randint(self.id_min, self.id_maks)
+
+def tugas_baru(i: int = 0) -> Tugas:
+    return Tugas("Benchmark", f"Tugas benchmark {i}", datetime.date(2025, 4, 1), "Medium", "Pending")
+
+# Method publik ManajerTugas tanpa kasus sendiri, beserta alasannya (dicek tests/test_benchmark.py)
+DIKECUALIKAN = {
+    "generasi": "properti penghitung di memori, tanpa query",
+    "kosongkan_cache": "hanya mengosongkan struktur di memori",
+}
+
+def daftar_kasus(m: ManajerTugas, k: Konteks) -> dict[str, Callable[[], object]]:
+    """Nama kasus -> fungsi tanpa argumen. Jalur halaman meniru panggilan di main_app.py.
+    Kasus arsip/pemeliharaan diletakkan paling akhir karena memindahkan tugas Complete keluar dari tabel tugas."""
+    return {
+        # ---- ManajerTugas: tulis ----
+        "tambah_tugas": lambda: m.tambah_tugas(tugas_baru()),
+        "tambah_tugas_batch[100]": lambda: m.tambah_tugas_batch(tugas_baru(i) for i in range(100)),
+        "update_tugas": lambda: m.update_tugas(Tugas("Benchmark", "Diubah", k.tanggal, "High", "In Progress", k.id_acak())),
+        "tandai_selesai": lambda: m.tandai_selesai(k.id_acak()),
+        "hapus_tugas": lambda: m.hapus_tugas(next(k.id_hapus)),
+        "tandai_selesai_banyak[100]": lambda: m.tandai_selesai_banyak(k.id_acak() for _ in range(100)),
+        "hapus_banyak[20]": lambda: m.hapus_banyak(next(k.id_hapus) for _ in range(20)),
+        "update_banyak[100]": lambda: m.update_banyak(
+            [Tugas("Benchmark", "Diubah massal", k.tanggal, "Low", "In Progress", k.id_acak()) for _ in range(100)]),
+        "ubah_status_dengan_filter[tanggal]": lambda: m.ubah_status_dengan_filter(next(k.status_bergilir),
+                                                                                  {"tanggal": k.tanggal}),
+        # ---- ManajerTugas: baca ----
+        "get_tugas": lambda: m.get_tugas(k.id_acak()),
+        "get_tugas_many[100]": lambda: m.get_tugas_many(k.id_acak() for _ in range(100)),
+        "get_semua_tugas_obj": m.get_semua_tugas_obj,
+        "get_tugas_batch": m.get_tugas_batch,
+        "get_dataframe_tugas": m.get_dataframe_tugas,
+        "get_dataframe_tugas[status]": lambda: m.get_dataframe_tugas(status_filter="Pending"),
+        "get_dataframe_tugas[tanggal]": lambda: m.get_dataframe_tugas(tanggal=k.tanggal),
+        "get_halaman_tugas[awal]": lambda: m.get_halaman_tugas(),
+        "get_halaman_tugas[dalam]": lambda: m.get_halaman_tugas(setelah=k.kunci_dalam),
+        "get_halaman_tugas[status+mundur]": lambda: m.get_halaman_tugas(status_filter="Complete", sebelum=k.kunci_dalam),
+        "iter_tugas[1000]": lambda: list(itertools.islice(m.iter_tugas(), 1000)),
+        "iter_dataframe_tugas[1 chunk]": lambda: next(iter(m.iter_dataframe_tugas())),
+        "get_chunk_tugas[1000]": lambda: m.get_chunk_tugas(ukuran_chunk=1000),
+        "get_chunk_tugas[status]": lambda: m.get_chunk_tugas({"status_filter": "Pending"}, ukuran_chunk=1000),
+        "get_dataframe_tugas[rentang 7 hari]": lambda: m.get_dataframe_tugas(rentang=(k.tanggal, k.tanggal + datetime.timedelta(days=6))),
+        "perubahan_sejak[100 terakhir]": lambda: m.perubahan_sejak(max(0, m.seq_terakhir() - 100)),
+        "seq_terakhir": m.seq_terakhir,
+        "berikutnya[10]": lambda: m.berikutnya(10, dari=k.tanggal),
+        "hitung_total_tugas[terlambat]": lambda: m.hitung_total_tugas(terlambat=True),
+        "cari[prefix]": lambda: m.cari("lap"),
+        "cari[2 kata+status]": lambda: m.cari("laporan praktikum", {"status_filter": "Pending"}),
+        "get_dataframe_tugas[arsip]": lambda: m.get_dataframe_tugas(status_filter="Complete", sertakan_arsip=True),
+        "hitung_total_tugas[arsip]": lambda: m.hitung_total_tugas(sertakan_arsip=True),
+        "ringkasan[arsip]": lambda: m.ringkasan(sertakan_arsip=True),
+        "ringkasan": m.ringkasan,
+        "ringkasan[tanggal]": lambda: m.ringkasan(tanggal=k.tanggal),
+        "hitung_total_tugas": m.hitung_total_tugas,
+        "hitung_total_tugas[tanggal]": lambda: m.hitung_total_tugas(k.tanggal),
+        # ---- database ----
+        "database.get_dataframe[limit 1000]": lambda: database.get_dataframe(
+            "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas ORDER BY hari, id LIMIT 1000"),
+        # ---- Jalur data per halaman Streamlit ----
+        "halaman_tambah": lambda: m.tambah_tugas(tugas_baru()),
+        "halaman_daftar": lambda: (format_tanggal_kolom(m.get_halaman_tugas().data["deadline"]), m.get_tugas(k.id_acak())),
+        "halaman_daftar[cari]": lambda: m.cari("kuis"),
+        "halaman_ringkasan": lambda: (m.ringkasan(), m.berikutnya(), m.hitung_total_tugas(terlambat=True)),
+        "halaman_ringkasan[hari ini]": lambda: m.ringkasan(tanggal=k.tanggal),
+        # ---- ManajerTugas: pemeliharaan (mengubah isi tabel tugas, jadi paling akhir) ----
+        "kompaksi_perubahan": m.kompaksi_perubahan,
+        # Putaran pertama memindahkan semua tugas lama (terserap pemanasan); sisanya biaya pemeriksaan rutin
+        "arsipkan_selesai": m.arsipkan_selesai,
+        "pemeliharaan_terjadwal[jatuh tempo]": lambda: m.pemeliharaan_terjadwal(interval_jam=0),
+        "pemeliharaan_terjadwal[dilewati]": m.pemeliharaan_terjadwal,
+    }
+
+def ukur_kasus(fungsi: Callable[[], object], ulang: int, pemanasan: int) -> dict:
+    for _ in range(pemanasan):
+        fungsi()
+    waktu = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        waktu.append((time.perf_counter() - mulai) * 1000)
+
+    # Memori puncak diukur terpisah karena tracemalloc memperlambat eksekusi
+    tracemalloc.start()
+    fungsi()
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "n": ulang,
+        "rata_ms": sum(waktu) / len(waktu),
+        "p50_ms": persentil(waktu, 50),
+        "p95_ms": persentil(waktu, 95),
+        "p99_ms": persentil(waktu, 99),
+        "maks_ms": max(waktu),
+        "memori_puncak_kib": puncak / 1024,
+    }
+
+def jalankan(path_dataset: str, ulang: int = 30, pemanasan: int = 3, pola: str | None = None,
+             dengan_cache: bool = False, seed: int = 7) -> dict:
+    """Jalankan semua kasus (atau yang cocok dengan regex `pola`) pada salinan dataset."""
+    with tempfile.TemporaryDirectory() as folder:
+        salinan = os.path.join(folder, "bench.db")
+        shutil.copyfile(path_dataset, salinan)  # Kasus tulis tidak boleh mengubah dataset asli
+        database.ganti_database(salinan)
+        try:
+            database.setup_database_initial()
+            if dengan_cache:
+                manajer = ManajerTugas()
+            else:
+                manajer = ManajerTugas(ukuran_peta_identitas=0, ukuran_cache=0)
+            with database.koneksi() as conn:
+                jumlah = conn.execute("SELECT COUNT(*) FROM tugas_data").fetchone()[0]
+                konteks = Konteks(conn, seed)
+
+            hasil = {}
+            for nama, fungsi in daftar_kasus(manajer, konteks).items():
+                if pola and not re.search(pola, nama):
+                    continue
+                hasil[nama] = ukur_kasus(fungsi, ulang, pemanasan)
+                print(f"{nama:<36} p50 {hasil[nama]['p50_ms']:>9.3f} ms  p95 {hasil[nama]['p95_ms']:>9.3f} ms  "
+                      f"p99 {hasil[nama]['p99_ms']:>9.3f} ms  mem {hasil[nama]['memori_puncak_kib']:>10.1f} KiB")
+        finally:
+            database.tutup_pool()
+
+    return {
+        "meta": {
+            "dataset": os.path.abspath(path_dataset),
+            "jumlah_tugas": jumlah,
+            "ulang": ulang,
+            "dengan_cache": dengan_cache,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "waktu": datetime.datetime.now().isoformat(timespec="seconds"),
+        },
+        "hasil": hasil,
+    }
+
+def bandingkan(lama: dict, baru: dict, ambang: float = 0.15, metrik: tuple[str, ...] = ("p50_ms", "p95_ms")) -> list[dict]:
+    """Return daftar regresi: kasus yang metriknya naik lebih dari `ambang` (0.15 = 15%)."""
+    regresi = []
+    for nama, nilai_baru in baru["hasil"].items():
+        nilai_lama = lama["hasil"].get(nama)
+        if nilai_lama is None:
+            continue
+        for kunci in metrik:
+            sebelum, sesudah = nilai_lama[kunci], nilai_baru[kunci]
+            if sebelum > 0 and (sesudah - sebelum) / sebelum > ambang:
+                regresi.append({"kasus": nama, "metrik": kunci, "lama": sebelum, "baru": sesudah,
+                                "perubahan": (sesudah - sebelum) / sebelum})
+    return regresi
+
+def simpan_json(data: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def baca_json(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
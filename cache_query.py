@@ -0,0 +1,66 @@
+# cache_query.py
+"""Cache hasil query di memori dengan batas ukuran (LRU), TTL dan nomor generasi tulis.
+
+Setiap entri dicatat bersama generasi tulis saat hasilnya dihitung. Begitu
+generasi naik (ada penulisan), entri lama otomatis dianggap basi ketika
+dibaca berikutnya, tanpa perlu mengosongkan seluruh cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+class CacheQuery:
+    """Cache LRU + TTL yang aman dipakai banyak thread."""
+
+    def __init__(self, ukuran: int = 128, ttl: float | None = 30.0):
+        self.ukuran = ukuran
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[int, float, Any]] = OrderedDict()  # kunci -> (generasi, waktu, nilai)
+        self._lock = threading.Lock()
+        self.jumlah_hit = 0
+        self.jumlah_miss = 0
+
+    def ambil(self, kunci: Hashable, generasi: int) -> tuple[bool, Any]:
+        """Return (ketemu, nilai). Entri dari generasi lain atau yang melewati TTL dibuang."""
+        with self._lock:
+            entri = self._data.get(kunci)
+            if entri is not None:
+                generasi_entri, waktu, nilai = entri
+                kedaluwarsa = self.ttl is not None and time.monotonic() - waktu > self.ttl
+                if generasi_entri == generasi and not kedaluwarsa:
+                    self._data.move_to_end(kunci)
+                    self.jumlah_hit += 1
+                    return True, nilai
+                del self._data[kunci]
+            self.jumlah_miss += 1
+            return False, None
+
+    def simpan(self, kunci: Hashable, generasi: int, nilai: Any) -> None:
+        if self.ukuran <= 0:
+            return
+        with self._lock:
+            self._data[kunci] = (generasi, time.monotonic(), nilai)
+            self._data.move_to_end(kunci)
+            while len(self._data) > self.ukuran:
+                self._data.popitem(last=False)
+
+    def ambil_atau_hitung(self, kunci: Hashable, generasi: int, hitung: Callable[[], Any]) -> Any:
+        """Ambil dari cache, atau jalankan `hitung()` lalu simpan hasilnya dengan generasi yang dibaca sebelumnya.
+        Jika ada penulisan selama `hitung()` berjalan, entri tersebut langsung basi pada pembacaan berikutnya."""
+        ketemu, nilai = self.ambil(kunci, generasi)
+        if ketemu:
+            return nilai
+        nilai = hitung()
+        self.simpan(kunci, generasi, nilai)
+        return nilai
+
+    def kosongkan(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"CacheQuery({len(self)}/{self.ukuran} entri, hit:{self.jumlah_hit}, miss:{self.jumlah_miss})"
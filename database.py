@@ -1,96 +1,734 @@
 # database.py
 
+import queue
 import sqlite3
-import pandas as pd
-from konfigurasi import DB_PATH
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator
+import migrasi
+import metrik
+from model import tipekan_dataframe
+from pencatatan import get_logger
+from konfigurasi import (DB_PATH, POOL_UKURAN, POOL_TIMEOUT, SQLITE_SYNCHRONOUS,
+                         SQLITE_CACHE_KB, SQLITE_MMAP_BYTES, AMBANG_QUERY_LAMBAT_MS,
+                         UKURAN_LOG_QUERY_LAMBAT, SNAPSHOT_BACA, SNAPSHOT_BASI_MAKS_DETIK,
+                         SNAPSHOT_SALINAN)
 
-def get_db_connection() -> sqlite3.Connection | None:
-    """Membuka dan mengembalikan koneksi baru ke database SQLite."""
+_log = get_logger("database")
+
+def _terapkan_pragma(conn: sqlite3.Connection) -> None:
+    """Atur pragma performa untuk koneksi yang baru dibuka."""
+    # Hanya berlaku untuk file baru (harus sebelum journal_mode); file lama: arsip.py --aktifkan-incremental-vacuum
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("PRAGMA journal_mode = WAL")  # Pembaca tidak lagi memblokir penulis
+    conn.execute(f"PRAGMA synchronous = {SQLITE_SYNCHRONOUS}")
+    conn.execute(f"PRAGMA cache_size = -{int(SQLITE_CACHE_KB)}")
+    conn.execute(f"PRAGMA mmap_size = {int(SQLITE_MMAP_BYTES)}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA foreign_keys = ON")  # Kode status/prioritas harus ada di tabel kode (migrasi 9)
+
+def get_db_connection(db_path: str = DB_PATH) -> sqlite3.Connection | None:
+    """Membuka dan mengembalikan koneksi baru ke database SQLite.
+    Koneksi boleh dipakai lintas thread (satu thread pada satu waktu) agar bisa disimpan di pool."""
     try:
-        conn = sqlite3.connect(DB_PATH, timeout=10, detect_types=sqlite3.PARSE_DECLTYPES)
+        conn = sqlite3.connect(db_path, timeout=10, detect_types=sqlite3.PARSE_DECLTYPES,
+                               check_same_thread=False)
         conn.row_factory = sqlite3.Row  # Akses kolom seperti dict (by name)
+        _terapkan_pragma(conn)
         return conn
     except sqlite3.Error as e:
-        print(f"ERROR [database.py] Gagal koneksi DB: {e}")
+        _log.error("Gagal koneksi DB", extra={"kv": {"db": db_path, "error": e}})
         return None
 
-def execute_query(query: str, params: tuple = None) -> int | None:
-    """Jalankan query non-SELECT (INSERT, UPDATE, DELETE). Return lastrowid jika INSERT."""
-    conn = get_db_connection()
-    if not conn:
-        return None
+# ---- Instrumentasi query ----
+
+_METRIK_QUERY = metrik.registri.counter("todolist_query_total", "Jumlah query per operasi dan status (ok/error)")
+_METRIK_DURASI = metrik.registri.histogram("todolist_query_durasi_detik", "Durasi eksekusi query")
+_METRIK_BARIS = metrik.registri.counter("todolist_query_baris_total", "Jumlah baris yang dibaca atau diubah query")
+_METRIK_LAMBAT = metrik.registri.counter("todolist_query_lambat_total", "Jumlah query di atas ambang query lambat")
+_METRIK_TUNGGU = metrik.registri.histogram("todolist_pool_tunggu_detik", "Waktu menunggu koneksi dari pool")
+_METRIK_POOL_TIMEOUT = metrik.registri.counter("todolist_pool_timeout_total", "Peminjaman koneksi yang gagal karena timeout")
+
+_lokal = threading.local()  # Waktu tunggu koneksi terakhir per thread, dibebankan ke query berikutnya
+_hooks: list[Callable[["PeristiwaQuery"], None]] = []
+_log_lambat: deque = deque(maxlen=UKURAN_LOG_QUERY_LAMBAT)
+ambang_query_lambat_ms: float = AMBANG_QUERY_LAMBAT_MS  # Boleh diubah saat runtime
+
+def _operasi(query: str) -> str:
+    """Kata kunci pertama query (SELECT, INSERT, ...) sebagai label metrik."""
+    kata = query.split(None, 1)
+    return kata[0].upper() if kata else "?"
+
+class PeristiwaQuery:
+    """Catatan satu query yang dikirim ke setiap hook setelah query selesai.
+
+    `durasi` (detik) hanya menghitung waktu di dalam SQLite; untuk query yang dibaca
+    bertahap, waktu pemanggil memproses setiap chunk tidak ikut dihitung."""
+
+    def __init__(self, query: str, params=None, banyak: bool = False):
+        self.query = query
+        self.params = params
+        self.operasi = _operasi(query)
+        self.banyak = banyak  # True untuk executemany; params berisi banyak baris
+        self.waktu = time.time()
+        self.durasi = 0.0
+        self.jumlah_baris: int | None = None
+        self.tunggu_koneksi = getattr(_lokal, "tunggu", 0.0)
+        self.error: BaseException | None = None
+        _lokal.tunggu = 0.0
+
+    @contextmanager
+    def bagian(self):
+        """Tambahkan waktu blok ini ke `durasi`; exception dicatat lalu diteruskan."""
+        mulai = time.perf_counter()
+        try:
+            yield self
+        except BaseException as e:
+            self.error = e
+            raise
+        finally:
+            self.durasi += time.perf_counter() - mulai
+
+    def __repr__(self) -> str:
+        status = "error" if self.error else "ok"
+        return f"PeristiwaQuery({self.operasi}, {self.durasi * 1000:.2f} ms, baris:{self.jumlah_baris}, {status})"
+
+def tambah_hook(fungsi: Callable[[PeristiwaQuery], None]) -> None:
+    """Daftarkan fungsi yang dipanggil dengan `PeristiwaQuery` setiap kali query selesai."""
+    if fungsi not in _hooks:
+        _hooks.append(fungsi)
+
+def hapus_hook(fungsi: Callable[[PeristiwaQuery], None]) -> None:
+    if fungsi in _hooks:
+        _hooks.remove(fungsi)
+
+def _hook_metrik(p: PeristiwaQuery) -> None:
+    _METRIK_QUERY.tambah(operasi=p.operasi, status="error" if p.error else "ok")
+    _METRIK_DURASI.amati(p.durasi, operasi=p.operasi)
+    if p.jumlah_baris:
+        _METRIK_BARIS.tambah(p.jumlah_baris, operasi=p.operasi)
+
+tambah_hook(_hook_metrik)
+
+def _rencana_query(conn: sqlite3.Connection, query: str, params) -> list[str]:
+    """Hasil EXPLAIN QUERY PLAN sebagai baris teks, menjorok sesuai induknya."""
     try:
-        cursor = conn.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        conn.commit()
-        return cursor.lastrowid
+        rows = conn.execute("EXPLAIN QUERY PLAN " + query, params or ()).fetchall()
     except sqlite3.Error as e:
-        print(f"ERROR [database.py] Query gagal: {e}\nQuery: {query}")
-        conn.rollback()
-        return None
-    finally:
-        conn.close()
+        return [f"(rencana tidak tersedia: {e})"]
+    kedalaman = {0: -1}
+    hasil = []
+    for row in rows:
+        kedalaman[row[0]] = kedalaman.get(row[1], -1) + 1
+        hasil.append("  " * kedalaman[row[0]] + row[3])
+    return hasil
 
-def fetch_query(query: str, params: tuple = None, fetch_all: bool = True):
-    """Jalankan query SELECT dan kembalikan hasil (list of rows)."""
-    conn = get_db_connection()
-    if not conn:
-        return None
+def _laporkan(conn: sqlite3.Connection, p: PeristiwaQuery) -> None:
+    """Catat query lambat (beserta rencananya) lalu kirim peristiwa ke semua hook."""
+    durasi_ms = p.durasi * 1000
+    if durasi_ms >= ambang_query_lambat_ms and p.error is None:
+        # executemany tidak punya satu set parameter untuk di-EXPLAIN
+        rencana = [] if p.banyak else _rencana_query(conn, p.query, p.params)
+        _log_lambat.append({
+            "waktu": p.waktu, "durasi_ms": durasi_ms, "operasi": p.operasi, "query": " ".join(p.query.split()),
+            "params": None if p.banyak else p.params, "jumlah_baris": p.jumlah_baris, "rencana": rencana,
+        })
+        _METRIK_LAMBAT.tambah(operasi=p.operasi)
+        _log.warning("Query lambat", extra={"kv": {"durasi_ms": round(durasi_ms, 2), "operasi": p.operasi,
+                                                   "baris": p.jumlah_baris, "query": " ".join(p.query.split()),
+                                                   "rencana": " | ".join(rencana)}})
+    for hook in list(_hooks):
+        try:
+            hook(p)
+        except Exception:
+            _log.exception("Hook instrumentasi gagal", extra={"kv": {"hook": getattr(hook, "__name__", hook)}})
+
+@contextmanager
+def ukur(conn: sqlite3.Connection, query: str, params=None, banyak: bool = False):
+    """Context manager untuk mengukur satu query pada `conn`. Isi `p.jumlah_baris` di dalam blok.
+
+        with database.ukur(conn, sql, params) as p:
+            cursor = conn.execute(sql, params)
+            p.jumlah_baris = cursor.rowcount
+    """
+    p = PeristiwaQuery(query, params, banyak)
     try:
-        cursor = conn.cursor()
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        return cursor.fetchall() if fetch_all else cursor.fetchone()
-    except sqlite3.Error as e:
-        print(f"ERROR [database.py] Fetch gagal: {e}\nQuery: {query}")
-        return None
+        with p.bagian():
+            yield p
     finally:
-        conn.close()
+        _laporkan(conn, p)
 
-def get_dataframe(query: str, params: tuple = None) -> pd.DataFrame:
-    """Jalankan query SELECT dan kembalikan hasil sebagai DataFrame Pandas."""
-    conn = get_db_connection()
-    if not conn:
-        return pd.DataFrame()
+def iter_baris(conn: sqlite3.Connection, query: str, params=(), ukuran_chunk: int = 500) -> Iterator[list]:
+    """Jalankan SELECT lalu hasilkan baris per chunk (`fetchmany`) dengan instrumentasi.
+    Peristiwa dikirim sekali ketika iterasi selesai atau generator ditutup."""
+    p = PeristiwaQuery(query, params)
+    p.jumlah_baris = 0
     try:
-        return pd.read_sql_query(query, conn, params=params)
-    except Exception as e:
-        print(f"ERROR [database.py] Gagal baca ke DataFrame: {e}")
-        return pd.DataFrame()
+        with p.bagian():
+            cursor = conn.execute(query, params)
+        while True:
+            with p.bagian():
+                rows = cursor.fetchmany(ukuran_chunk)
+            if not rows:
+                break
+            p.jumlah_baris += len(rows)
+            yield rows
     finally:
-        conn.close()
+        _laporkan(conn, p)
+
+def query_lambat() -> list[dict]:
+    """Salinan log query lambat, terbaru lebih dulu."""
+    return list(reversed(_log_lambat))
+
+def kosongkan_query_lambat() -> None:
+    _log_lambat.clear()
+
+class PoolKoneksi:
+    """Pool koneksi SQLite berumur panjang yang aman dipakai banyak thread.
+
+    Koneksi dibuat sesuai kebutuhan sampai `ukuran`, dipinjam dengan `pinjam()`
+    dan wajib dikembalikan dengan `kembalikan()` (atau pakai `with pool.koneksi()`)."""
+
+    def __init__(self, db_path: str = DB_PATH, ukuran: int = POOL_UKURAN, timeout: float = POOL_TIMEOUT):
+        if ukuran < 1:
+            raise ValueError("Ukuran pool minimal 1.")
+        self.db_path = db_path
+        self.ukuran = ukuran
+        self.timeout = timeout
+        self._tersedia: queue.LifoQueue = queue.LifoQueue(maxsize=ukuran)
+        self._jumlah_dibuat = 0
+        self._lock = threading.Lock()
+        self._ditutup = False
+
+    def _buat_koneksi(self) -> sqlite3.Connection:
+        conn = get_db_connection(self.db_path)
+        if conn is None:
+            with self._lock:
+                self._jumlah_dibuat -= 1
+            raise sqlite3.OperationalError(f"Tidak bisa membuka database: {self.db_path}")
+        return conn
+
+    @staticmethod
+    def _sehat(conn: sqlite3.Connection) -> bool:
+        """Health check ringan sebelum koneksi diserahkan ke pemanggil."""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def pinjam(self, timeout: float | None = None) -> sqlite3.Connection:
+        """Ambil satu koneksi dari pool. Raise `TimeoutError` jika pool penuh terlalu lama.
+        Lama menunggu dicatat ke metrik dan ke query pertama yang dijalankan thread ini."""
+        mulai = time.perf_counter()
+        try:
+            conn = self._ambil(timeout)
+        except TimeoutError:
+            _METRIK_POOL_TIMEOUT.tambah()
+            raise
+        tunggu = time.perf_counter() - mulai
+        _METRIK_TUNGGU.amati(tunggu)
+        _lokal.tunggu = tunggu
+        return conn
+
+    def _ambil(self, timeout: float | None) -> sqlite3.Connection:
+        if self._ditutup:
+            raise sqlite3.ProgrammingError("Pool koneksi sudah ditutup.")
+        try:
+            conn = self._tersedia.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                boleh_buat = self._jumlah_dibuat < self.ukuran
+                if boleh_buat:
+                    self._jumlah_dibuat += 1
+            if boleh_buat:
+                return self._buat_koneksi()
+            try:
+                conn = self._tersedia.get(timeout=self.timeout if timeout is None else timeout)
+            except queue.Empty:
+                raise TimeoutError(f"Tidak ada koneksi kosong dalam pool setelah {self.timeout} detik.") from None
+
+        if not self._sehat(conn):
+            _log.warning("Koneksi pool rusak, membuka koneksi pengganti", extra={"kv": {"db": self.db_path}})
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            return self._buat_koneksi()
+        return conn
+
+    def kembalikan(self, conn: sqlite3.Connection) -> None:
+        """Kembalikan koneksi ke pool. Transaksi yang masih terbuka akan di-rollback."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._buang(conn)
+            return
+        if self._ditutup:
+            self._buang(conn)
+            return
+        try:
+            self._tersedia.put_nowait(conn)
+        except queue.Full:
+            self._buang(conn)
+
+    def _buang(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._jumlah_dibuat -= 1
+
+    @contextmanager
+    def koneksi(self, timeout: float | None = None):
+        """Context manager: pinjam koneksi lalu kembalikan otomatis ke pool."""
+        conn = self.pinjam(timeout)
+        try:
+            yield conn
+        finally:
+            self.kembalikan(conn)
+
+    def statistik(self) -> dict:
+        """Jumlah koneksi yang sudah dibuat dan yang sedang menganggur."""
+        return {"ukuran": self.ukuran, "dibuat": self._jumlah_dibuat, "menganggur": self._tersedia.qsize()}
+
+    def tutup(self) -> None:
+        """Tutup semua koneksi yang sedang menganggur di pool."""
+        self._ditutup = True
+        while True:
+            try:
+                self._buang(self._tersedia.get_nowait())
+            except queue.Empty:
+                break
+
+def _statistik_pool(kunci: str) -> float:
+    # Dijumlahkan atas semua database yang pool-nya terbuka (database utama dan shard tenant)
+    return sum(bd._pool.statistik()[kunci] for bd in list(_semua_basis_data) if bd._pool is not None)
+
+metrik.registri.gauge("todolist_pool_koneksi_dibuat", "Koneksi pool yang sedang terbuka",
+                      fungsi=lambda: _statistik_pool("dibuat"))
+metrik.registri.gauge("todolist_pool_koneksi_menganggur", "Koneksi pool yang siap dipinjam",
+                      fungsi=lambda: _statistik_pool("menganggur"))
+
+# ---- Snapshot baca di memori ----
+
+_METRIK_SNAPSHOT_REFRESH = metrik.registri.histogram("todolist_snapshot_refresh_detik",
+                                                     "Durasi menyalin database ke snapshot di memori")
+
+class SnapshotBaca:
+    """Salinan database di memori (lewat backup API) untuk query analitik.
+
+    Query panjang di snapshot tidak pernah memegang kunci atau read mark WAL di file,
+    jadi tidak bersaing dengan form tambah/edit. Snapshot disalin ulang saat dipakai jika
+    `PRAGMA data_version` koneksi sumber berubah (ada commit dari koneksi lain) dan
+    umurnya sudah melewati `basi_maks` detik; itulah batas basi datanya.
+
+    Salinan utama tidak dipakai query langsung: setiap pembaca meminjam salinan sendiri
+    (maks. `jumlah_salinan`, diselaraskan dari salinan utama saat versinya tertinggal),
+    sehingga laporan yang lambat tidak menahan laporan lain."""
+
+    def __init__(self, db_path: str = DB_PATH, basi_maks: float = SNAPSHOT_BASI_MAKS_DETIK,
+                 jumlah_salinan: int = SNAPSHOT_SALINAN):
+        self.db_path = db_path
+        self.basi_maks = basi_maks
+        self.jumlah_salinan = max(1, jumlah_salinan)
+        self.versi = 0                 # Naik setiap kali snapshot disalin ulang
+        self.waktu_diambil: float | None = None  # time.time() saat salinan terakhir
+        self.durasi_refresh_terakhir = 0.0
+        self._sumber: sqlite3.Connection | None = None  # Koneksi khusus untuk backup dan cek data_version
+        self._memori: sqlite3.Connection | None = None  # Salinan utama (sumber salinan pembaca)
+        self._data_version = None
+        self._diambil = 0.0            # time.monotonic() saat salinan terakhir
+        self._lock_refresh = threading.Lock()   # Dipegang selama salinan utama dibuat ulang atau disalin
+        self._kondisi = threading.Condition()   # Menjaga daftar salinan pembaca
+        self._salinan_bebas: list[tuple[int, sqlite3.Connection]] = []  # (versi, koneksi) yang siap dipinjam
+        self._salinan_dibuat = 0
+        self._ditutup = False
+        self._lokal = threading.local()
+
+    def _berubah(self) -> bool:
+        return self._sumber.execute("PRAGMA data_version").fetchone()[0] != self._data_version
+
+    @staticmethod
+    def _koneksi_memori() -> sqlite3.Connection:
+        conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def segarkan(self, paksa: bool = False) -> bool:
+        """Salin ulang database jika perlu (atau selalu jika `paksa`). Return True jika disalin.
+        Salinan yang sedang dipinjam tidak terpengaruh; versinya diselaraskan saat dipinjam lagi."""
+        with self._lock_refresh:
+            if self._ditutup:
+                raise sqlite3.ProgrammingError("Snapshot baca sudah ditutup.")
+            if self._sumber is None:
+                self._sumber = get_db_connection(self.db_path)
+                if self._sumber is None:
+                    raise sqlite3.OperationalError(f"Tidak bisa membuka database: {self.db_path}")
+            if not paksa and self._memori is not None:
+                if time.monotonic() - self._diambil < self.basi_maks or not self._berubah():
+                    return False
+            mulai = time.perf_counter()
+            # Dibaca sebelum backup: commit selama backup berjalan akan memicu salinan berikutnya
+            data_version = self._sumber.execute("PRAGMA data_version").fetchone()[0]
+            baru = self._koneksi_memori()
+            self._sumber.backup(baru)
+            lama, self._memori = self._memori, baru
+            self._data_version = data_version
+            self._diambil = time.monotonic()
+            self.waktu_diambil = time.time()
+            self.versi += 1
+            if lama is not None:
+                lama.close()
+            self.durasi_refresh_terakhir = time.perf_counter() - mulai
+            _METRIK_SNAPSHOT_REFRESH.amati(self.durasi_refresh_terakhir)
+            _log.debug("Snapshot baca disalin ulang", extra={"kv": {"versi": self.versi,
+                       "durasi_ms": round(self.durasi_refresh_terakhir * 1000, 2)}})
+            return True
+
+    def _pinjam_salinan(self) -> tuple[int, sqlite3.Connection]:
+        with self._kondisi:
+            while True:
+                if self._ditutup:
+                    raise sqlite3.ProgrammingError("Snapshot baca sudah ditutup.")
+                if self._salinan_bebas:
+                    # Utamakan salinan yang sudah versi terbaru agar tidak perlu disalin lagi
+                    self._salinan_bebas.sort(key=lambda entri: entri[0])
+                    return self._salinan_bebas.pop()
+                if self._salinan_dibuat < self.jumlah_salinan:
+                    self._salinan_dibuat += 1
+                    break
+                self._kondisi.wait()
+        try:
+            return 0, self._koneksi_memori()
+        except BaseException:
+            with self._kondisi:
+                self._salinan_dibuat -= 1
+                self._kondisi.notify()
+            raise
+
+    def _kembalikan_salinan(self, versi: int, conn: sqlite3.Connection) -> None:
+        with self._kondisi:
+            if self._ditutup:
+                self._salinan_dibuat -= 1
+                conn.close()
+            else:
+                self._salinan_bebas.append((versi, conn))
+            self._kondisi.notify()
+
+    def _selaraskan(self, versi: int, conn: sqlite3.Connection) -> int:
+        """Salin isi salinan utama ke salinan pembaca jika versinya tertinggal. Return versi baru."""
+        with self._lock_refresh:
+            if versi == self.versi:
+                return versi
+            if self._memori is None:
+                raise sqlite3.ProgrammingError("Snapshot baca sudah ditutup.")
+            conn.execute("PRAGMA query_only = OFF")
+            self._memori.backup(conn)
+            conn.execute("PRAGMA query_only = ON")
+            return self.versi
+
+    @contextmanager
+    def koneksi(self):
+        """Context manager: koneksi snapshot milik pemanggil ini (disegarkan dulu jika perlu).
+        Pemakaian bertingkat di thread yang sama memakai koneksi yang sama."""
+        aktif = getattr(self._lokal, "conn", None)
+        if aktif is not None:
+            yield aktif
+            return
+        self.segarkan()
+        versi, conn = self._pinjam_salinan()
+        try:
+            versi = self._selaraskan(versi, conn)
+        except BaseException:
+            # Salinan yang gagal diselaraskan dibuang agar tidak dipinjam dalam keadaan setengah jadi
+            with self._kondisi:
+                self._salinan_dibuat -= 1
+                self._kondisi.notify()
+            conn.close()
+            raise
+        self._lokal.conn = conn
+        try:
+            yield conn
+        finally:
+            self._lokal.conn = None
+            self._kembalikan_salinan(versi, conn)
+
+    def umur(self) -> float | None:
+        """Detik sejak salinan terakhir, atau None jika belum pernah disalin."""
+        return None if self.waktu_diambil is None else time.monotonic() - self._diambil
+
+    def info(self) -> dict:
+        """Keadaan snapshot untuk halaman diagnostik: versi, umur, salinan pembaca,
+        dan apakah file sudah berubah sejak disalin."""
+        with self._lock_refresh:
+            berubah = self._sumber is not None and self._memori is not None and self._berubah()
+        with self._kondisi:
+            salinan = {"dibuat": self._salinan_dibuat, "menganggur": len(self._salinan_bebas),
+                       "maks": self.jumlah_salinan}
+        return {"versi": self.versi, "umur_detik": self.umur(), "basi_maks_detik": self.basi_maks,
+                "ada_perubahan": berubah, "durasi_refresh_ms": self.durasi_refresh_terakhir * 1000,
+                "salinan": salinan}
+
+    def tutup(self) -> None:
+        """Tutup salinan utama dan salinan yang menganggur; salinan yang sedang dipinjam ditutup saat dikembalikan."""
+        with self._lock_refresh, self._kondisi:
+            self._ditutup = True
+            for _, conn in self._salinan_bebas:
+                conn.close()
+            self._salinan_dibuat -= len(self._salinan_bebas)
+            self._salinan_bebas.clear()
+            for conn in (self._memori, self._sumber):
+                if conn is not None:
+                    conn.close()
+            self._memori = self._sumber = None
+            self._kondisi.notify_all()
+
+snapshot_aktif = SNAPSHOT_BACA  # Bisa diubah saat runtime (misalnya dari halaman diagnostik), berlaku untuk semua database
+
+def _umur_snapshot() -> float:
+    umur = [bd._snapshot.umur() or 0 for bd in list(_semua_basis_data) if bd._snapshot is not None]
+    return max(umur, default=0)
+
+metrik.registri.gauge("todolist_snapshot_umur_detik", "Umur snapshot baca di memori (0 jika belum ada)",
+                      fungsi=_umur_snapshot)
+
+# ---- Satu file database: pool koneksi, snapshot baca dan helper query ----
+
+_semua_basis_data: weakref.WeakSet = weakref.WeakSet()  # Untuk metrik gabungan semua pool
+
+class BasisData:
+    """Satu file database SQLite beserta pool koneksi dan snapshot bacanya (dibuat saat pertama dibutuhkan).
+
+    Fungsi modul (`koneksi`, `fetch_query`, `get_dataframe`, ...) memakai instance utama
+    (`get_basis_data()`); setiap shard tenant punya instance sendiri (lihat shard.py),
+    sehingga kunci tulis dan pool koneksinya tidak dibagi dengan tenant lain."""
+
+    def __init__(self, db_path: str = DB_PATH, ukuran_pool: int = POOL_UKURAN, timeout: float = POOL_TIMEOUT):
+        self.db_path = db_path
+        self.ukuran_pool = ukuran_pool
+        self.timeout = timeout
+        self.skema_siap = False  # Diset oleh setup_database_initial agar migrasi dicek sekali per database
+        self._pool: PoolKoneksi | None = None
+        self._snapshot: SnapshotBaca | None = None
+        self._lock = threading.Lock()
+        _semua_basis_data.add(self)
+
+    @property
+    def pool(self) -> PoolKoneksi:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = PoolKoneksi(self.db_path, self.ukuran_pool, self.timeout)
+        return self._pool
+
+    @property
+    def snapshot(self) -> SnapshotBaca:
+        if self._snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = SnapshotBaca(self.db_path)
+        return self._snapshot
+
+    def koneksi(self, timeout: float | None = None):
+        """Singkatan untuk `self.pool.koneksi()`."""
+        return self.pool.koneksi(timeout)
+
+    @contextmanager
+    def koneksi_baca(self):
+        """Koneksi untuk query analitik: snapshot di memori jika `snapshot_aktif`, selain itu koneksi pool biasa.
+        Hanya untuk SELECT; data di snapshot bisa tertinggal paling lama `SNAPSHOT_BASI_MAKS_DETIK`."""
+        if snapshot_aktif:
+            with self.snapshot.koneksi() as conn:
+                yield conn
+        else:
+            with self.koneksi() as conn:
+                yield conn
+
+    def versi_baca(self) -> int:
+        """Versi sumber baca analitik, untuk kunci cache hasil query: versi snapshot (setelah dicek
+        apakah perlu disalin ulang) jika mode snapshot aktif, selain itu 0."""
+        if not snapshot_aktif:
+            return 0
+        snapshot = self.snapshot
+        snapshot.segarkan()
+        return snapshot.versi
+
+    def tutup(self) -> None:
+        """Tutup pool dan snapshot baca. Jika dipakai lagi, keduanya dibuat ulang."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.tutup()
+                self._pool = None
+            if self._snapshot is not None:
+                self._snapshot.tutup()
+                self._snapshot = None
+
+    def execute_query(self, query: str, params: tuple = None) -> int | None:
+        """Jalankan query non-SELECT (INSERT, UPDATE, DELETE). Return lastrowid jika INSERT."""
+        try:
+            with self.koneksi() as conn:
+                try:
+                    with ukur(conn, query, params) as p:
+                        cursor = conn.cursor()
+                        if params:
+                            cursor.execute(query, params)
+                        else:
+                            cursor.execute(query)
+                        conn.commit()
+                        p.jumlah_baris = cursor.rowcount
+                    return cursor.lastrowid
+                except sqlite3.Error as e:
+                    _log.error("Query gagal", extra={"kv": {"error": e, "query": " ".join(query.split())}})
+                    conn.rollback()
+                    return None
+        except (sqlite3.Error, TimeoutError) as e:
+            _log.error("Gagal koneksi DB", extra={"kv": {"db": self.db_path, "error": e}})
+            return None
+
+    def fetch_query(self, query: str, params: tuple = None, fetch_all: bool = True, snapshot: bool = False):
+        """Jalankan query SELECT dan kembalikan hasil (list of rows).
+        `snapshot=True` untuk query agregasi/analitik: dibaca lewat `koneksi_baca()`."""
+        try:
+            with (self.koneksi_baca() if snapshot else self.koneksi()) as conn:
+                try:
+                    with ukur(conn, query, params) as p:
+                        cursor = conn.cursor()
+                        if params:
+                            cursor.execute(query, params)
+                        else:
+                            cursor.execute(query)
+                        if fetch_all:
+                            hasil = cursor.fetchall()
+                            p.jumlah_baris = len(hasil)
+                        else:
+                            hasil = cursor.fetchone()
+                            p.jumlah_baris = 0 if hasil is None else 1
+                    return hasil
+                except sqlite3.Error as e:
+                    _log.error("Fetch gagal", extra={"kv": {"error": e, "query": " ".join(query.split())}})
+                    return None
+        except (sqlite3.Error, TimeoutError) as e:
+            _log.error("Gagal koneksi DB", extra={"kv": {"db": self.db_path, "error": e}})
+            return None
+
+    def get_dataframe(self, query: str, params: tuple = None, chunksize: int | None = None, snapshot: bool = False):
+        """Jalankan query SELECT dan kembalikan hasil sebagai DataFrame Pandas.
+        Jika `chunksize` diisi, kembalikan iterator DataFrame berisi paling banyak `chunksize` baris.
+        `snapshot=True` untuk query analitik: dibaca lewat `koneksi_baca()`.
+        Kolom tugas yang dikenal diberi dtype ringkas (lihat `model.tipekan_dataframe`)."""
+        if chunksize:
+            return self._iter_dataframe(query, params, chunksize)
+        import pandas as pd  # Dimuat saat pertama dibutuhkan agar startup aplikasi tetap ringan
+        try:
+            with (self.koneksi_baca() if snapshot else self.koneksi()) as conn:
+                with ukur(conn, query, params) as p:
+                    df = tipekan_dataframe(pd.read_sql_query(query, conn, params=params))
+                    p.jumlah_baris = len(df)
+                return df
+        except Exception as e:
+            _log.error("Gagal baca ke DataFrame", extra={"kv": {"error": e, "query": " ".join(query.split())}})
+            return pd.DataFrame()
+
+    def _iter_dataframe(self, query: str, params: tuple | None, chunksize: int):
+        """Generator chunk DataFrame. Koneksi tetap dipinjam sampai iterasi selesai atau ditutup.
+        Error di tengah iterasi dicatat lalu dilempar ulang agar hasil yang terpotong tidak terlihat lengkap."""
+        import pandas as pd
+        try:
+            with self.koneksi() as conn:
+                p = PeristiwaQuery(query, params)
+                p.jumlah_baris = 0
+                try:
+                    with p.bagian():
+                        chunks = pd.read_sql_query(query, conn, params=params, chunksize=chunksize)
+                    while True:
+                        with p.bagian():
+                            chunk = next(chunks, None)
+                        if chunk is None:
+                            break
+                        p.jumlah_baris += len(chunk)
+                        yield tipekan_dataframe(chunk)
+                finally:
+                    _laporkan(conn, p)
+        except Exception as e:
+            _log.error("Gagal baca chunk DataFrame", extra={"kv": {"error": e, "query": " ".join(query.split())}})
+            raise
+
+    def setup_database_initial(self) -> bool:
+        """Memastikan skema database terbaru (dipanggil oleh ManajerTugas saat inisialisasi).
+        Return True jika semua migrasi berhasil atau skema sudah terbaru."""
+        _log.info("Memeriksa skema database", extra={"kv": {"db": self.db_path}})
+        try:
+            with self.koneksi() as conn:
+                # Probe murah: satu PRAGMA baca, tanpa transaksi tulis, untuk kasus umum skema sudah terbaru
+                versi = migrasi.versi_skema(conn)
+                if versi < migrasi.VERSI_TERBARU:
+                    versi = migrasi.jalankan_migrasi(conn)
+                elif versi > migrasi.VERSI_TERBARU:
+                    _log.warning("Skema database lebih baru dari aplikasi", extra={"kv": {"versi": versi,
+                                 "versi_aplikasi": migrasi.VERSI_TERBARU}})
+                migrasi.sinkronkan_kode(conn)  # Nilai status/prioritas yang baru ditambahkan di konfigurasi
+                _log.info("Skema database siap", extra={"kv": {"db": self.db_path, "versi": versi}})
+                self.skema_siap = True
+                return True
+        except (sqlite3.Error, TimeoutError) as e:
+            _log.error("Error saat migrasi skema", extra={"kv": {"db": self.db_path, "error": e}})
+            return False
+
+    def __repr__(self) -> str:
+        return f"BasisData({self.db_path!r}, pool:{'terbuka' if self._pool is not None else 'belum dibuat'})"
+
+# ---- Database utama: fungsi modul untuk aplikasi satu file ----
+
+_utama = BasisData(DB_PATH)  # Bisa diarahkan ke file lain dengan ganti_database() (misalnya oleh benchmark)
+
+def get_basis_data() -> BasisData:
+    """Kembalikan database utama (instance yang sama selama proses berjalan)."""
+    return _utama
+
+def get_pool() -> PoolKoneksi:
+    """Kembalikan pool koneksi database utama (dibuat saat pertama kali dibutuhkan)."""
+    return _utama.pool
+
+def koneksi(timeout: float | None = None):
+    """Singkatan untuk `get_pool().koneksi()`."""
+    return _utama.koneksi(timeout)
+
+def get_snapshot() -> SnapshotBaca:
+    """Kembalikan snapshot baca database utama (dibuat saat pertama kali dibutuhkan)."""
+    return _utama.snapshot
+
+def koneksi_baca():
+    """Lihat `BasisData.koneksi_baca`."""
+    return _utama.koneksi_baca()
+
+def versi_baca() -> int:
+    """Lihat `BasisData.versi_baca`."""
+    return _utama.versi_baca()
+
+def tutup_pool() -> None:
+    """Tutup pool dan snapshot baca database utama (misalnya saat proses berhenti atau di skrip)."""
+    _utama.tutup()
+
+def ganti_database(db_path: str) -> None:
+    """Arahkan database utama ke file lain. Koneksi lama ditutup."""
+    _utama.tutup()
+    _utama.db_path = db_path
+    _utama.skema_siap = False
+
+def execute_query(query: str, params: tuple = None) -> int | None:
+    return _utama.execute_query(query, params)
+
+def fetch_query(query: str, params: tuple = None, fetch_all: bool = True, snapshot: bool = False):
+    return _utama.fetch_query(query, params, fetch_all, snapshot)
+
+def get_dataframe(query: str, params: tuple = None, chunksize: int | None = None, snapshot: bool = False):
+    return _utama.get_dataframe(query, params, chunksize, snapshot)
 
 def setup_database_initial() -> bool:
-    """Memastikan tabel tugas ada (dipanggil oleh ManajerTugas saat inisialisasi).
-    Return True jika setup berhasil atau tabel sudah ada."""
-    print(f"[database.py] Memeriksa/membuat tabel 'tugas' di: {DB_PATH}")
-    conn = get_db_connection()
-    if not conn:
-        return False
-        
-    try:
-        cursor = conn.cursor()
-        sql_create_table = """
-        CREATE TABLE IF NOT EXISTS tugas (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            matkul TEXT,
-            deskripsi TEXT NOT NULL,
-            deadline DATE NOT NULL,
-            prioritas TEXT NOT NULL,
-            status TEXT NOT NULL
-        );"""
-        cursor.execute(sql_create_table)
-        conn.commit()
-        print("[database.py] Tabel 'tugas' siap.")
-        return True
-    except sqlite3.Error as e:
-        print(f"[database.py] Error saat setup tabel: {e}")
-        return False
-    finally:
-        if conn:
-            conn.close()
\ No newline at end of file
+    return _utama.setup_database_initial()
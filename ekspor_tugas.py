@@ -0,0 +1,114 @@
+# ekspor_tugas.py
+"""Ekspor tugas ke CSV, NDJSON atau Parquet secara streaming.
+
+Data diambil per chunk dari database dan langsung ditulis ke file, sehingga
+yang ada di memori tidak pernah lebih dari satu chunk.
+
+Contoh:
+    python ekspor_tugas.py semua_tugas.csv
+    python ekspor_tugas.py pending.ndjson --status Pending
+    python ekspor_tugas.py arsip.parquet --chunk 5000   (butuh pyarrow)
+"""
+
+import argparse
+import os
+import sqlite3
+from konfigurasi import DAFTAR_PRIORITAS, STATUS_TUGAS, UKURAN_CHUNK_BATCH
+from model import format_tanggal_kolom
+
+FORMAT_EKSPOR = ("csv", "ndjson", "parquet")
+
+def _chunks(manajer, filters: dict | None, ukuran_chunk: int):
+    """Chunk DataFrame dengan kolom deadline sebagai teks YYYY-MM-DD."""
+    for df in manajer.iter_dataframe_tugas(filters, ukuran_chunk=ukuran_chunk):
+        if df.empty:
+            continue
+        df["deadline"] = format_tanggal_kolom(df["deadline"], "%Y-%m-%d")
+        yield df
+
+def ekspor_csv(path: str, manajer, filters: dict | None = None, ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> int:
+    """Tulis tugas ke file CSV. Return jumlah baris yang ditulis."""
+    total = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        for df in _chunks(manajer, filters, ukuran_chunk):
+            df.to_csv(f, index=False, header=(total == 0))
+            total += len(df)
+    return total
+
+def ekspor_ndjson(path: str, manajer, filters: dict | None = None, ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> int:
+    """Tulis tugas ke file NDJSON (satu objek JSON per baris). Return jumlah baris."""
+    total = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for df in _chunks(manajer, filters, ukuran_chunk):
+            teks = df.to_json(orient="records", lines=True, force_ascii=False)
+            f.write(teks if teks.endswith("\n") else teks + "\n")
+            total += len(df)
+    return total
+
+def ekspor_parquet(path: str, manajer, filters: dict | None = None, ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> int:
+    """Tulis tugas ke file Parquet, satu row group per chunk. Membutuhkan paket `pyarrow`."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Ekspor Parquet membutuhkan paket 'pyarrow' (pip install pyarrow).") from None
+
+    skema = pa.schema([
+        ("id", pa.int64()),
+        ("matkul", pa.string()),
+        ("deskripsi", pa.string()),
+        ("deadline", pa.string()),
+        ("prioritas", pa.string()),
+        ("status", pa.string()),
+    ])
+    total = 0
+    with pq.ParquetWriter(path, skema) as writer:
+        for df in _chunks(manajer, filters, ukuran_chunk):
+            writer.write_table(pa.Table.from_pandas(df, schema=skema, preserve_index=False))
+            total += len(df)
+    return total
+
+def ekspor_file(path: str, manajer=None, filters: dict | None = None, format: str | None = None,
+                ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> int:
+    """Ekspor ke `path` dengan format dari argumen atau dari ekstensi file."""
+    if manajer is None:
+        from manajer_tugas import ManajerTugas
+        manajer = ManajerTugas()
+
+    format = format or os.path.splitext(path)[1].lower().lstrip(".")
+    if format in ("jsonl", "json"):
+        format = "ndjson"
+    if format not in FORMAT_EKSPOR:
+        raise ValueError(f"Format ekspor '{format}' tidak didukung, pilih salah satu dari {FORMAT_EKSPOR}.")
+
+    penulis = {"csv": ekspor_csv, "ndjson": ekspor_ndjson, "parquet": ekspor_parquet}[format]
+    try:
+        return penulis(path, manajer, filters, ukuran_chunk)
+    except Exception:
+        # Jangan tinggalkan file setengah jadi yang terlihat seperti ekspor lengkap
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Ekspor tugas ke CSV/NDJSON/Parquet.")
+    parser.add_argument("file", help="Path file tujuan")
+    parser.add_argument("--format", choices=FORMAT_EKSPOR, help="Paksa format file (default: dari ekstensi)")
+    parser.add_argument("--status", choices=STATUS_TUGAS, help="Hanya tugas dengan status ini")
+    parser.add_argument("--prioritas", choices=DAFTAR_PRIORITAS, help="Hanya tugas dengan prioritas ini")
+    parser.add_argument("--chunk", type=int, default=UKURAN_CHUNK_BATCH, help="Jumlah baris per chunk")
+    args = parser.parse_args(argv)
+
+    filters = {"status_filter": args.status, "prioritas_filter": args.prioritas}
+    print(f"--- Mengekspor tugas ke '{args.file}' ---")
+    try:
+        total = ekspor_file(args.file, filters=filters, format=args.format, ukuran_chunk=args.chunk)
+    except (ValueError, RuntimeError, OSError, sqlite3.Error) as e:  # OSError termasuk pandas.errors.DatabaseError
+        print(f"Ekspor GAGAL: {e}")
+        return 1
+    print(f"{total} tugas diekspor.")
+    print("--- Ekspor Selesai ---")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+# grafik.py
+"""Render grafik halaman ringkasan dengan cache.
+
+Grafik matplotlib dirender sekali menjadi PNG lalu disimpan di cache LRU
+berdasarkan sidik jari (hash) data agregat dan tema. Rerun dengan data yang
+sama cukup mengirim ulang byte PNG tanpa membuat figure baru. Figure dibuat
+lewat `matplotlib.figure.Figure` (bukan pyplot) sehingga tidak pernah masuk
+registri global pyplot dan tidak menumpuk di proses yang berumur panjang.
+
+Alternatifnya, `spesifikasi_pie` menghasilkan spesifikasi Vega-Lite yang
+dirender browser, tanpa pekerjaan render sama sekali di server."""
+
+import hashlib
+import io
+from typing import Iterable
+from cache_query import CacheQuery
+from konfigurasi import CACHE_GRAFIK_UKURAN
+
+_cache = CacheQuery(CACHE_GRAFIK_UKURAN, ttl=None)  # Isi PNG hanya bergantung pada kunci, tidak pernah basi
+
+def sidik_jari(*bagian) -> str:
+    """Hash pendek dari data dan opsi grafik, dipakai sebagai kunci cache."""
+    return hashlib.sha1(repr(bagian).encode("utf-8")).hexdigest()
+
+def _render_pie(label: tuple[str, ...], nilai: tuple[int, ...], warna_teks: str) -> bytes:
+    from matplotlib.figure import Figure  # Dimuat saat grafik pertama dirender
+    fig = Figure(facecolor="none")
+    try:
+        ax = fig.subplots()
+        ax.pie(nilai, labels=label, autopct="%1.1f%%", textprops={"color": warna_teks})
+        ax.axis("equal")
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", transparent=True)  # Background transparan untuk dark/light mode
+        return buffer.getvalue()
+    finally:
+        fig.clear()  # Lepaskan artist sekarang, jangan tunggu garbage collector
+
+def pie_png(label: Iterable[str], nilai: Iterable[int], tema: str = "dark") -> bytes:
+    """PNG diagram pie. Hanya dirender jika kombinasi label, nilai dan tema belum ada di cache."""
+    label = tuple(str(x) for x in label)
+    nilai = tuple(int(x) for x in nilai)
+    warna_teks = "white" if tema == "dark" else "black"  # Teks label kontras dengan latar tema
+    kunci = sidik_jari("pie", label, nilai, warna_teks)
+    return _cache.ambil_atau_hitung(kunci, 0, lambda: _render_pie(label, nilai, warna_teks))
+
+def spesifikasi_pie(kolom_label: str, kolom_nilai: str) -> dict:
+    """Spesifikasi Vega-Lite diagram pie (data diberikan terpisah oleh pemanggil)."""
+    return {
+        "mark": {"type": "arc", "tooltip": True},
+        "encoding": {
+            "theta": {"field": kolom_nilai, "type": "quantitative", "stack": True},
+            "color": {"field": kolom_label, "type": "nominal"},
+        },
+    }
+
+def statistik_cache() -> CacheQuery:
+    """Cache PNG grafik (untuk halaman diagnostik)."""
+    return _cache
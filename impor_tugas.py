@@ -0,0 +1,165 @@
+# impor_tugas.py
+"""Impor tugas massal dari file CSV atau NDJSON (satu objek JSON per baris).
+
+File dibaca baris demi baris sehingga memori tetap konstan berapa pun ukuran
+filenya. Baris yang tidak valid dicatat beserta nomor barisnya dan dilewati,
+sisanya tetap disimpan lewat `ManajerTugas.tambah_tugas_batch`.
+
+Contoh:
+    python impor_tugas.py tugas_semester.csv
+    python impor_tugas.py ekspor.ndjson --format ndjson --chunk 1000
+"""
+
+import argparse
+import csv
+import datetime
+import itertools
+import json
+import os
+from typing import Iterator
+from model import Tugas
+from konfigurasi import DAFTAR_PRIORITAS, STATUS_TUGAS, UKURAN_CHUNK_BATCH
+
+MAKS_KESALAHAN_DISIMPAN = 1000  # Batas detail kesalahan yang disimpan agar memori tetap kecil
+
+class HasilImpor:
+    """Ringkasan hasil impor: jumlah baris tersimpan dan daftar kesalahan per baris."""
+
+    def __init__(self):
+        self.jumlah_dibaca = 0
+        self.jumlah_berhasil = 0
+        self.jumlah_gagal = 0
+        self.kesalahan: list[tuple[int, str]] = []  # (nomor_baris, pesan)
+
+    def catat_kesalahan(self, nomor_baris: int, pesan: str) -> None:
+        self.jumlah_gagal += 1
+        if len(self.kesalahan) < MAKS_KESALAHAN_DISIMPAN:
+            self.kesalahan.append((nomor_baris, pesan))
+
+    def __repr__(self) -> str:
+        return f"HasilImpor(dibaca:{self.jumlah_dibaca}, berhasil:{self.jumlah_berhasil}, gagal:{self.jumlah_gagal})"
+
+def baca_csv(path: str) -> Iterator[tuple[int, dict]]:
+    """Hasilkan (nomor_baris, data) untuk setiap baris CSV (baris 1 adalah header)."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for nomor, data in enumerate(csv.DictReader(f), start=2):
+            yield nomor, data
+
+def baca_ndjson(path: str) -> Iterator[tuple[int, dict]]:
+    """Hasilkan (nomor_baris, data) untuk setiap baris NDJSON yang tidak kosong."""
+    with open(path, encoding="utf-8") as f:
+        for nomor, baris in enumerate(f, start=1):
+            baris = baris.strip()
+            if not baris:
+                continue
+            try:
+                data = json.loads(baris)
+            except json.JSONDecodeError as e:
+                data = ValueError(f"JSON tidak valid: {e.msg}")
+            yield nomor, data
+
+def _teks(data: dict, kolom: str) -> str:
+    """Nilai teks satu kolom tanpa spasi di tepi ('' jika kosong). Raise `ValueError` jika bukan teks."""
+    nilai = data.get(kolom)
+    if nilai is None:
+        return ""
+    if not isinstance(nilai, str):
+        raise ValueError(f"Kolom '{kolom}' harus berupa teks, bukan {type(nilai).__name__}.")
+    return nilai.strip()
+
+def validasi_baris(data: dict) -> Tugas:
+    """Ubah satu baris mentah menjadi `Tugas`. Raise `ValueError` jika data tidak valid."""
+    if not isinstance(data, dict):
+        raise ValueError("Baris harus berupa objek dengan kolom tugas.")
+
+    matkul = _teks(data, "matkul")
+
+    deskripsi = _teks(data, "deskripsi")
+    if not deskripsi:
+        raise ValueError("Kolom 'deskripsi' wajib diisi.")
+
+    deadline = _teks(data, "deadline")
+    if not deadline:
+        raise ValueError("Kolom 'deadline' wajib diisi.")
+    try:
+        deadline = datetime.datetime.strptime(deadline[:10], "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"Format deadline '{deadline}' salah, gunakan YYYY-MM-DD.") from None
+
+    prioritas = _teks(data, "prioritas") or None
+    if prioritas and prioritas not in DAFTAR_PRIORITAS:
+        raise ValueError(f"Prioritas '{prioritas}' tidak dikenal.")
+
+    status = _teks(data, "status") or None
+    if status and status not in STATUS_TUGAS:
+        raise ValueError(f"Status '{status}' tidak dikenal.")
+
+    return Tugas(
+        matkul=matkul,
+        deskripsi=deskripsi,
+        deadline=deadline,
+        prioritas=prioritas,
+        status=status
+    )
+
+def tebak_format(path: str) -> str:
+    """Tentukan format dari ekstensi file ('csv' atau 'ndjson')."""
+    ekstensi = os.path.splitext(path)[1].lower()
+    return "ndjson" if ekstensi in (".ndjson", ".jsonl", ".json") else "csv"
+
+def impor_file(path: str, manajer=None, format: str | None = None,
+               ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> HasilImpor:
+    """Impor seluruh isi file ke database secara streaming."""
+    if manajer is None:
+        from manajer_tugas import ManajerTugas
+        manajer = ManajerTugas()
+
+    format = format or tebak_format(path)
+    pembaca = baca_ndjson if format == "ndjson" else baca_csv
+    hasil = HasilImpor()
+
+    def tugas_valid():
+        for nomor, data in pembaca(path):
+            hasil.jumlah_dibaca += 1
+            try:
+                if isinstance(data, Exception):
+                    raise data
+                yield nomor, validasi_baris(data)
+            except ValueError as e:
+                hasil.catat_kesalahan(nomor, str(e))
+
+    def simpan(chunk: list[tuple[int, Tugas]]) -> None:
+        # Satu panggilan per chunk agar indeks dari `saat_gagal` bisa dipetakan ke nomor baris file
+        def catat(indeks: int, tugas: Tugas, error: Exception) -> None:
+            hasil.catat_kesalahan(chunk[indeks][0], f"Gagal disimpan ke database: {error}")
+
+        hasil.jumlah_berhasil += manajer.tambah_tugas_batch([tugas for _, tugas in chunk], ukuran_chunk=len(chunk),
+                                                            saat_gagal=catat)
+
+    sumber = tugas_valid()
+    while True:
+        chunk = list(itertools.islice(sumber, ukuran_chunk))
+        if not chunk:
+            break
+        simpan(chunk)
+    return hasil
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Impor tugas massal dari file CSV/NDJSON.")
+    parser.add_argument("file", help="Path file CSV atau NDJSON")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Paksa format file (default: dari ekstensi)")
+    parser.add_argument("--chunk", type=int, default=UKURAN_CHUNK_BATCH, help="Jumlah baris per transaksi")
+    args = parser.parse_args(argv)
+
+    print(f"--- Mengimpor tugas dari '{args.file}' ---")
+    hasil = impor_file(args.file, format=args.format, ukuran_chunk=args.chunk)
+    for nomor, pesan in hasil.kesalahan:
+        print(f"Baris {nomor}: {pesan}")
+    if hasil.jumlah_gagal > len(hasil.kesalahan):
+        print(f"... dan {hasil.jumlah_gagal - len(hasil.kesalahan)} kesalahan lainnya.")
+    print(f"\nDibaca: {hasil.jumlah_dibaca}, berhasil: {hasil.jumlah_berhasil}, gagal: {hasil.jumlah_gagal}")
+    print("--- Impor Selesai ---")
+    return 0 if hasil.jumlah_gagal == 0 else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -15,3 +15,73 @@ STATUS_TUGAS = ["In Progress","Need Approval","Pending", "Complete"]
 # Default nilai jika user tidak memilih
 PRIORITAS_DEFAULT = "Medium"
 STATUS_DEFAULT = "Pending"
+
+# Pengaturan pool koneksi SQLite
+POOL_UKURAN = 5            # Jumlah maksimum koneksi yang dibuka bersamaan
+POOL_TIMEOUT = 10          # Detik menunggu koneksi kosong sebelum menyerah
+SQLITE_SYNCHRONOUS = "NORMAL"          # Aman untuk mode WAL, jauh lebih sedikit fsync
+SQLITE_CACHE_KB = 16 * 1024            # Ukuran page cache per koneksi (KiB)
+SQLITE_MMAP_BYTES = 64 * 1024 * 1024   # Ukuran memory-mapped I/O per koneksi
+
+# Multi-tenant: setiap tenant (pemilik) punya file database sendiri di SHARD_FOLDER (lihat shard.py)
+MODE_TENANT = os.environ.get("TODOLIST_MODE_TENANT", "0") == "1"  # Nonaktif: satu database bersama (DB_PATH)
+SHARD_FOLDER = os.environ.get("TODOLIST_SHARD_FOLDER", os.path.join(BASE_DIR, "tenant"))
+# Header HTTP berisi ID tenant yang diisi proxy/login di depan aplikasi (misalnya "X-Forwarded-User").
+# Jika diisi, hanya header ini yang dipercaya; kosong = tenant dari ?tenant=... atau isian sidebar (tanpa autentikasi).
+# Aplikasi tidak pernah membuat shard baru: tenant didaftarkan admin lewat `python shard.py --buat <id>`.
+TENANT_HEADER = os.environ.get("TODOLIST_TENANT_HEADER", "")
+SHARD_POOL_UKURAN = 2      # Koneksi per shard; kecil karena jumlah shard yang terbuka bisa banyak
+SHARD_MAKS_TERBUKA = 64    # Lebih dari ini, pool shard yang paling lama tidak dipakai ditutup
+SHARD_PEKERJA = 8          # Thread untuk laporan lintas tenant (fan-out ke semua shard)
+
+# Jumlah baris per transaksi untuk operasi massal (impor/batch)
+UKURAN_CHUNK_BATCH = 500
+
+# Paginasi halaman Daftar Tugas
+PILIHAN_UKURAN_HALAMAN = [10, 25, 50, 100]
+UKURAN_HALAMAN_DEFAULT = 25
+
+# Jumlah objek Tugas yang disimpan di peta identitas (LRU) ManajerTugas; 0 = nonaktif
+UKURAN_PETA_IDENTITAS = 256
+
+# Pencarian teks penuh (FTS5)
+BATAS_HASIL_CARI = 50   # Jumlah hasil maksimum per pencarian
+
+# Log perubahan (change feed) untuk refresh inkremental
+PERUBAHAN_SISAKAN = 10000   # Jumlah entri terbaru yang dipertahankan saat kompaksi
+PERUBAHAN_BATAS_DELTA = 5000  # Lebih dari ini ID berubah, muat ulang penuh lebih murah daripada delta
+
+# Arsip tugas selesai dan pemeliharaan database terjadwal
+ARSIP_UMUR_HARI = 90             # Tugas Complete dengan deadline lebih lama dari ini dipindah ke arsip
+ARSIP_UKURAN_CHUNK = 5000        # Jumlah tugas yang dipindah per transaksi
+PEMELIHARAAN_INTERVAL_JAM = 24   # Jarak minimal antar pemeliharaan otomatis (arsip, ANALYZE, vacuum, optimize)
+# Pemeliharaan latar di main_app ikut mengarsipkan tugas lama. Nonaktif secara default: tugas Complete
+# tetap tampil di Daftar Tugas sampai admin menjalankan `python arsip.py --arsipkan`
+ARSIP_OTOMATIS = os.environ.get("TODOLIST_ARSIP_OTOMATIS", "0") == "1"
+
+# Snapshot baca di memori untuk query analitik (ringkasan, DataFrame penuh, laporan)
+SNAPSHOT_BACA = os.environ.get("TODOLIST_SNAPSHOT_BACA", "0") == "1"  # Nonaktif secara default
+SNAPSHOT_BASI_MAKS_DETIK = 5.0   # Snapshot disalin ulang jika database berubah dan umurnya sudah melewati ini
+SNAPSHOT_SALINAN = 2             # Salinan pembaca (query analitik yang bisa berjalan bersamaan); memori ~(1 + ini) x ukuran DB
+
+# DataFrame bertipe: id int64, deadline datetime64, status/prioritas kategori (lihat model.tipekan_dataframe)
+DATAFRAME_PYARROW = False   # True: id, deadline dan kolom teks memakai dtype pyarrow (butuh paket pyarrow)
+
+# Cache hasil query di ManajerTugas (dibuang otomatis setiap ada penulisan)
+CACHE_QUERY_UKURAN = 128   # Jumlah entri maksimum (LRU); 0 = nonaktif
+CACHE_QUERY_TTL = 30       # Detik; batas basi untuk perubahan dari proses lain
+
+# Halaman diagnostik (admin): dibuka dengan ?diagnostik=<token>; kosong = halaman nonaktif
+DIAGNOSTIK_TOKEN = os.environ.get("TODOLIST_DIAGNOSTIK_TOKEN", "")
+
+# Logging dan instrumentasi query
+LOG_LEVEL = os.environ.get("TODOLIST_LOG_LEVEL", "WARNING")  # DEBUG, INFO, WARNING, ERROR
+AMBANG_QUERY_LAMBAT_MS = 200    # Query di atas ambang ini dicatat beserta EXPLAIN QUERY PLAN
+UKURAN_LOG_QUERY_LAMBAT = 100   # Jumlah entri query lambat terakhir yang disimpan di memori
+
+# Target waktu cold start (import + inisialisasi) untuk profil_startup.py
+TARGET_STARTUP_MS = 1500
+
+# Grafik halaman ringkasan
+MODE_GRAFIK = "matplotlib"   # "matplotlib" (PNG yang di-cache) atau "vega" (grafik native Streamlit)
+CACHE_GRAFIK_UKURAN = 32     # Jumlah PNG grafik yang disimpan (LRU)
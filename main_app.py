@@ -1,35 +1,98 @@
 # main_app.py
 import streamlit as st
-import matplotlib.pyplot as plt
 import datetime
-import pandas as pd
+import hmac
+import threading
+import time
 
 # Set page configuration
 st.set_page_config(page_title="To-Do List", layout="wide", initial_sidebar_state="expanded")
 
 # Import modul yang diperlukan
-from model import Tugas
-from manajer_tugas import ManajerTugas
-from konfigurasi import DAFTAR_PRIORITAS, STATUS_TUGAS, PRIORITAS_DEFAULT, STATUS_DEFAULT
+import arsip
+import database
+import grafik
+import metrik
+import pencatatan
+from model import Tugas, format_tanggal_kolom
+from manajer_tugas import ManajerTugas, rentang_ke_depan
+from shard import RouterShard, validasi_tenant
+from konfigurasi import (DAFTAR_PRIORITAS, STATUS_TUGAS, PRIORITAS_DEFAULT, STATUS_DEFAULT,
+                         PILIHAN_UKURAN_HALAMAN, UKURAN_HALAMAN_DEFAULT, MODE_GRAFIK, MODE_TENANT,
+                         DIAGNOSTIK_TOKEN, SHARD_FOLDER, TENANT_HEADER, ARSIP_OTOMATIS, ARSIP_UMUR_HARI)
+
+_log = pencatatan.get_logger("main_app")
 
 # Inisialisasi manajer tugas
 @st.cache_resource(show_spinner=False)
 def get_manajer_tugas():
     return ManajerTugas()
 
-manajer = get_manajer_tugas()
+# Mode multi-tenant: satu file database (shard) per tenant, dibagi semua sesi lewat satu router
+@st.cache_resource(show_spinner=False)
+def get_router():
+    return RouterShard(SHARD_FOLDER)
+
+def pilih_tenant() -> str | None:
+    """Tenant sesi ini. Jika TENANT_HEADER diisi, hanya header dari proxy/login di depan aplikasi
+    yang dipercaya; selain itu dari ?tenant=... di URL atau isian di sidebar (tanpa autentikasi)."""
+    if TENANT_HEADER:
+        tenant = (st.context.headers.get(TENANT_HEADER) or "").strip()
+        if not tenant:
+            st.error("Identitas tenant tidak ditemukan pada permintaan. Silakan login ulang.")
+            return None
+    else:
+        tenant = (st.query_params.get("tenant") or st.sidebar.text_input("Tenant", key="tenant")).strip()
+        if not tenant:
+            st.sidebar.info("Masukkan ID tenant untuk membuka daftar tugas.")
+            return None
+    try:
+        return validasi_tenant(tenant)
+    except ValueError as e:
+        st.sidebar.error(str(e))
+        return None
 
-# Fungsi untuk format tanggal agar seragam
-def format_tanggal(tanggal):
-    if isinstance(tanggal, str):
-        try:
-            tgl = datetime.datetime.strptime(tanggal, "%Y-%m-%d").date()
-            return tgl.strftime("%d-%m-%Y")
-        except:
-            return tanggal
-    elif isinstance(tanggal, datetime.date):
-        return tanggal.strftime("%d-%m-%Y")
-    return tanggal
+if MODE_TENANT:
+    router = get_router()
+    tenant_aktif = pilih_tenant()
+    if tenant_aktif is None:
+        st.stop()
+    try:
+        # Hanya tenant yang shard-nya sudah dibuat admin; ID sembarang tidak boleh membuat file baru
+        manajer = router.manajer(tenant_aktif, buat=False)
+    except KeyError:
+        st.error(f"Tenant '{tenant_aktif}' belum terdaftar. Hubungi admin untuk mendaftarkannya.")
+        st.stop()
+else:
+    router = None
+    manajer = get_manajer_tugas()
+
+# Pemeliharaan berkala (ANALYZE/optimize/vacuum, plus arsip jika ARSIP_OTOMATIS) di thread latar,
+# satu per proses server. Jadwal sebenarnya dijaga tabel meta, jadi cek setiap jam cukup dan aman untuk banyak proses.
+def pemeliharaan_latar():
+    # Router/manajer diambil dari cache resource setiap putaran, bukan dari sesi yang memulai thread
+    umur_hari = ARSIP_UMUR_HARI if ARSIP_OTOMATIS else None
+    if MODE_TENANT:
+        get_router().pemeliharaan_semua(umur_hari=umur_hari)
+    else:
+        get_manajer_tugas().pemeliharaan_terjadwal(umur_hari=umur_hari)
+
+@st.cache_resource(show_spinner=False)
+def mulai_pemeliharaan_latar():
+    def loop():
+        time.sleep(60)  # Jangan bersaing dengan startup aplikasi
+        while True:
+            # Satu kegagalan (misalnya "database is locked") tidak boleh menghentikan thread ini selamanya
+            try:
+                pemeliharaan_latar()
+            except Exception:
+                _log.exception("Pemeliharaan latar gagal, dicoba lagi satu jam lagi")
+            time.sleep(3600)
+    thread = threading.Thread(target=loop, name="pemeliharaan-db", daemon=True)
+    thread.start()
+    return thread
+
+mulai_pemeliharaan_latar()
 
 # Halaman Input Tugas
 def halaman_tambah():
@@ -60,7 +123,6 @@ def halaman_tambah():
                 )
                 if manajer.tambah_tugas(tugas_baru):
                     st.success("Tugas berhasil disimpan!", icon="✅")
-                    st.cache_data.clear()  # Clear cache jika diperlukan untuk memperbarui tampilan data
                     st.rerun()
                 else:
                     st.error("Gagal menyimpan tugas.")
@@ -68,6 +130,9 @@ def halaman_tambah():
 # Halaman Daftar Tugas
 def halaman_daftar():
     st.header("🗂️ Daftar Tugas")
+    if ARSIP_OTOMATIS:
+        st.caption(f"ℹ️ Tugas Complete dengan deadline lebih dari {ARSIP_UMUR_HARI} hari lalu dipindah otomatis ke arsip "
+                   "dan tidak tampil di sini. Lihat jumlahnya di Ringkasan dengan opsi \"Sertakan arsip\".")
     
     # Filter
     col1, col2 = st.columns(2)
@@ -83,28 +148,131 @@ def halaman_daftar():
         if prioritas_filter == "Semua":
             prioritas_filter = None
 
-    
+    col1, col2 = st.columns(2)
+    with col1:
+        # Filter deadline (range query pada indeks deadline)
+        pilihan_deadline = st.selectbox("Filter Deadline", ["Semua", "Terlambat", "7 Hari ke Depan", "Rentang Tanggal"])
+        filter_deadline = {}
+        if pilihan_deadline == "Terlambat":
+            filter_deadline = {"terlambat": True}
+        elif pilihan_deadline == "7 Hari ke Depan":
+            filter_deadline = {"rentang": rentang_ke_depan(7)}
+        elif pilihan_deadline == "Rentang Tanggal":
+            hari_ini = datetime.date.today()
+            pilihan_rentang = st.date_input("Dari - Sampai", value=(hari_ini, hari_ini + datetime.timedelta(days=30)))
+            if len(pilihan_rentang) == 2:  # Saat baru memilih tanggal pertama, ujung kedua belum ada
+                filter_deadline = {"rentang": tuple(pilihan_rentang)}
+    with col2:
+        ukuran_halaman = st.selectbox("Jumlah per Halaman", PILIHAN_UKURAN_HALAMAN,
+                                      index=PILIHAN_UKURAN_HALAMAN.index(UKURAN_HALAMAN_DEFAULT))
+
+    # Kembali ke halaman pertama jika filter atau ukuran halaman berubah
+    kunci_filter = (status_filter, prioritas_filter, tuple(filter_deadline.items()), ukuran_halaman)
+    if st.session_state.get("daftar_filter") != kunci_filter:
+        st.session_state.daftar_filter = kunci_filter
+        st.session_state.daftar_kursor = {}
+        st.session_state.daftar_nomor = 1
+
     # Tombol refresh
     if st.button("🔄 Refresh Daftar"):
-        st.cache_data.clear()
+        manajer.kosongkan_cache()  # Ambil ulang dari database (misalnya setelah diubah proses lain)
         st.rerun()
-        
-    # Tampilkan data tugas dalam bentuk tabel menggunakan Pandas DataFrame
-    df_tugas = manajer.get_dataframe_tugas(status_filter=status_filter, prioritas_filter=prioritas_filter)
+
+    # Pencarian teks penuh: hasil terurut relevansi menggantikan daftar berhalaman
+    kata_kunci = st.text_input("🔍 Cari Tugas", placeholder="Kata di mata kuliah atau deskripsi, misalnya: laporan jaringan")
+    if kata_kunci.strip():
+        df_hasil = manajer.cari(kata_kunci, filters={"status_filter": status_filter, "prioritas_filter": prioritas_filter,
+                                                     **filter_deadline})
+        if df_hasil.empty:
+            st.info("Tidak ada tugas yang cocok.")
+        else:
+            st.caption(f"{len(df_hasil)} hasil teratas untuk \"{kata_kunci}\"")
+            df_tampil = df_hasil.drop(columns="skor").assign(deadline=format_tanggal_kolom(df_hasil["deadline"]))
+            st.dataframe(df_tampil.set_index("id"), use_container_width=True)
+        id_tampil = df_hasil["id"].tolist()
+    else:
+        id_tampil = halaman_daftar_berhalaman(status_filter, prioritas_filter, filter_deadline, ukuran_halaman)
+    halaman_daftar_aksi_massal(id_tampil, prioritas_filter)
+    halaman_daftar_aksi()
+
+# Bagian daftar tugas berhalaman (keyset pagination)
+def halaman_daftar_berhalaman(status_filter, prioritas_filter, filter_deadline, ukuran_halaman):
+    """Return daftar ID tugas yang tampil di halaman ini."""
+    # Tampilkan satu halaman data tugas (keyset pagination) menggunakan Pandas DataFrame
+    halaman = manajer.get_halaman_tugas(status_filter=status_filter, prioritas_filter=prioritas_filter,
+                                        ukuran=ukuran_halaman, **filter_deadline, **st.session_state.daftar_kursor)
+    df_tugas = halaman.data
     if df_tugas.empty:
         st.info("Belum ada tugas yang tersimpan.")
     else:
-        # Format tanggal agar lebih mudah dibaca
-        df_tugas["deadline"] = df_tugas["deadline"].apply(format_tanggal)
-        st.dataframe(df_tugas.set_index("id"), use_container_width=True)
-    
+        # Format tanggal agar lebih mudah dibaca (vektor, di salinan; kunci halaman tetap memakai tanggal asli)
+        df_tampil = df_tugas.assign(deadline=format_tanggal_kolom(df_tugas["deadline"]))
+        st.dataframe(df_tampil.set_index("id"), use_container_width=True)
+
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("⬅️ Sebelumnya", disabled=not halaman.ada_sebelumnya):
+            st.session_state.daftar_kursor = {"sebelum": halaman.kunci_awal}
+            st.session_state.daftar_nomor = max(1, st.session_state.daftar_nomor - 1)
+            st.rerun()
+    with col_info:
+        st.caption(f"Halaman {st.session_state.daftar_nomor}")
+    with col_next:
+        if st.button("Berikutnya ➡️", disabled=not halaman.ada_berikutnya):
+            st.session_state.daftar_kursor = {"setelah": halaman.kunci_akhir}
+            st.session_state.daftar_nomor += 1
+            st.rerun()
+    return df_tugas["id"].tolist() if not df_tugas.empty else []
+
+# Ringkasan hasil operasi massal {id: berhasil}, ditampilkan setelah halaman dimuat ulang
+def simpan_pesan_massal(hasil, keterangan):
+    gagal = [i for i, ok in hasil.items() if not ok]
+    pesan = f"{len(hasil) - len(gagal)} tugas {keterangan}."
+    if gagal:
+        pesan += f" Gagal/tidak ditemukan: ID {', '.join(map(str, gagal))}."
+    st.session_state.pesan_massal = pesan
+
+# Bagian aksi massal: pilih banyak tugas lalu proses dalam satu transaksi
+def halaman_daftar_aksi_massal(id_tampil, prioritas_filter):
+    st.subheader("Aksi Massal")
+    if "pesan_massal" in st.session_state:
+        st.success(st.session_state.pop("pesan_massal"), icon="✅")
+
+    terpilih = st.multiselect("Pilih tugas (ID dari tabel di atas)", id_tampil, key="pilih_massal")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button(f"✅ Tandai Selesai ({len(terpilih)})", disabled=not terpilih):
+            simpan_pesan_massal(manajer.tandai_selesai_banyak(terpilih), "ditandai Complete")
+            del st.session_state["pilih_massal"]
+            st.rerun()
+    with col2:
+        if st.button(f"🗑️ Hapus ({len(terpilih)})", disabled=not terpilih):
+            simpan_pesan_massal(manajer.hapus_banyak(terpilih), "dihapus")
+            del st.session_state["pilih_massal"]
+            st.rerun()
+
+    with st.expander("Ubah status berdasarkan filter"):
+        with st.form("form_ubah_status_massal"):
+            col1, col2, col3 = st.columns(3)
+            status_lama = col1.selectbox("Tugas berstatus", STATUS_TUGAS, index=STATUS_TUGAS.index("Pending"))
+            sebelum = col2.date_input("Deadline sebelum", value=datetime.date.today())
+            status_baru = col3.selectbox("Ubah menjadi", STATUS_TUGAS, index=STATUS_TUGAS.index("Complete"))
+            if prioritas_filter:
+                st.caption(f"Hanya tugas dengan prioritas {prioritas_filter} (mengikuti filter di atas).")
+            if st.form_submit_button("Terapkan"):
+                daftar_id = manajer.ubah_status_dengan_filter(
+                    status_baru, {"status_filter": status_lama, "prioritas_filter": prioritas_filter}, sebelum=sebelum)
+                st.session_state.pesan_massal = f"{len(daftar_id)} tugas diubah dari {status_lama} menjadi {status_baru}."
+                st.rerun()
+
+# Bagian edit, hapus dan tandai selesai di halaman Daftar Tugas
+def halaman_daftar_aksi():
     # Edit Tugas
     st.subheader("Edit Tugas")
     id_edit = st.number_input("ID Tugas yang akan diedit", min_value=1, step=1, format="%d", key="edit_id")
     if st.session_state.get("edit_mode") or st.button("✏️ Edit Tugas"):
         st.session_state.edit_mode = True
-        semua = manajer.get_semua_tugas_obj()
-        tugas_terpilih = next((t for t in semua if t.id == id_edit), None)
+        tugas_terpilih = manajer.get_tugas(int(id_edit))
         
         if not tugas_terpilih:
             st.error("Tugas tidak ditemukan.")
@@ -129,7 +297,6 @@ def halaman_daftar():
                     if manajer.update_tugas(tugas_baru):
                         st.success(f"Tugas ID {tugas_baru.id} berhasil diperbarui.", icon="✅")
                         st.session_state.edit_mode = False
-                        st.cache_data.clear()
                         st.rerun()
                     else:
                         st.error("Gagal memperbarui tugas.")
@@ -142,7 +309,6 @@ def halaman_daftar():
         if st.button("🗑️ Hapus Tugas"):
             if manajer.hapus_tugas(hapus_id):
                 st.success(f"Tugas ID {hapus_id} berhasil dihapus.", icon="✅")
-                st.cache_data.clear()
                 st.rerun()
             else:
                 st.error("Gagal menghapus tugas. Pastikan ID benar.")
@@ -151,39 +317,80 @@ def halaman_daftar():
         if st.button("✅ Tandai Selesai"):
             if manajer.tandai_selesai(selesai_id):
                 st.success(f"Tugas ID {selesai_id} telah ditandai sebagai Complete.", icon="✅")
-                st.cache_data.clear()
                 st.rerun()
             else:
                 st.error("Gagal memperbarui status tugas. Pastikan ID benar.")
 
 
+# Widget dashboard: tugas yang paling dekat jatuh tempo (top-N, bukan seluruh tabel)
+def widget_jatuh_tempo():
+    st.subheader("⏰ Segera Jatuh Tempo")
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        jumlah = st.number_input("Tampilkan", min_value=1, max_value=50, value=5, step=1, key="jumlah_jatuh_tempo")
+    with col2:
+        st.metric("Terlambat", manajer.hitung_total_tugas(terlambat=True))
+    with col3:
+        st.metric("Jatuh tempo 7 hari ke depan", manajer.hitung_total_tugas(rentang=rentang_ke_depan(7)))
+
+    df_berikutnya = manajer.berikutnya(int(jumlah))
+    if df_berikutnya.empty:
+        st.info("Tidak ada tugas yang akan jatuh tempo.")
+    else:
+        df_tampil = df_berikutnya.assign(deadline=format_tanggal_kolom(df_berikutnya["deadline"]))
+        st.dataframe(df_tampil.set_index("id"), use_container_width=True)
+    st.markdown("---")
+
 # Halaman Ringkasan Tugas 
 def halaman_ringkasan():
     st.header("📊 Ringkasan & Analisis Tugas")
     col1, col2 = st.columns([1, 2])
     with col1:
-        pilihan_periode = st.selectbox("Filter Periode:", ["Semua Waktu", "Hari Ini", "Pilih Tanggal Tertentu"], key="filter_periode")
+        pilihan_periode = st.selectbox("Filter Periode:", ["Semua Waktu", "Hari Ini", "7 Hari ke Depan", "Pilih Tanggal Tertentu", "Rentang Tanggal"], key="filter_periode")
+        pilihan_mode = {"Gambar (matplotlib)": "matplotlib", "Native (Vega-Lite)": "vega"}
+        label_mode = st.radio("Mode Grafik", list(pilihan_mode), horizontal=True,
+                              index=list(pilihan_mode.values()).index(MODE_GRAFIK))
+        mode_grafik = pilihan_mode[label_mode]
+        bantuan_arsip = (f"Tugas Complete dengan deadline lebih dari {ARSIP_UMUR_HARI} hari lalu diarsipkan otomatis."
+                         if ARSIP_OTOMATIS else "Arsip otomatis nonaktif; arsip hanya berisi tugas yang diarsipkan admin.")
+        sertakan_arsip = st.checkbox("Sertakan arsip", help="Ikut hitung tugas Complete lama yang sudah diarsipkan. " + bantuan_arsip)
         
     tanggal_filter = None
+    rentang_filter = None
     label_periode = "(Semua Waktu)"
     if pilihan_periode == "Hari Ini":
         tanggal_filter = datetime.date.today()
         label_periode = f"({tanggal_filter.strftime('%d %b')})"
+    elif pilihan_periode == "7 Hari ke Depan":
+        rentang_filter = rentang_ke_depan(7)
+        label_periode = f"({rentang_filter[0].strftime('%d %b')} - {rentang_filter[1].strftime('%d %b')})"
     elif pilihan_periode == "Pilih Tanggal Tertentu":
         tanggal_filter = st.date_input("Pilih Tanggal", value=datetime.date.today())
         label_periode = f"({tanggal_filter.strftime('%d %b %Y')})"
+    elif pilihan_periode == "Rentang Tanggal":
+        hari_ini = datetime.date.today()
+        pilihan_rentang = st.date_input("Dari - Sampai", value=(hari_ini, hari_ini + datetime.timedelta(days=30)))
+        if len(pilihan_rentang) == 2:
+            rentang_filter = tuple(pilihan_rentang)
+            label_periode = f"({rentang_filter[0].strftime('%d %b %Y')} - {rentang_filter[1].strftime('%d %b %Y')})"
+
+    widget_jatuh_tempo()
 
+    # Semua angka di halaman ini berasal dari satu query agregasi (GROUP BY di SQLite)
+    ringkasan = manajer.ringkasan(tanggal=tanggal_filter, rentang=rentang_filter, sertakan_arsip=sertakan_arsip)
     with col2:
-        total_tugas = manajer.hitung_total_tugas(tanggal_filter)
-        st.metric(label=f"Total Tugas {label_periode}", value=f"{total_tugas} Tugas")
+        st.metric(label=f"Total Tugas {label_periode}", value=f"{ringkasan.total} Tugas")
+        if database.snapshot_aktif:
+            umur = manajer.db.snapshot.umur()
+            st.caption(f"Dibaca dari snapshot di memori (umur {umur:.0f} detik, "
+                       f"maks. {manajer.db.snapshot.basi_maks:g} detik setelah ada perubahan)")
     
-    df_tugas = manajer.get_dataframe_tugas(tanggal=tanggal_filter)
-    if df_tugas.empty:
+    if ringkasan.total == 0:
         st.info("Belum ada data tugas.")
         return
 
     # ==== Ringkasan berdasarkan Status ====
-    df_summary = df_tugas.groupby("status").size().reset_index(name="Jumlah Tugas")
+    df_summary = ringkasan.df_status()
     st.subheader("Total Tugas Berdasarkan Status")
 
     col1, col2 = st.columns(2)
@@ -192,21 +399,18 @@ def halaman_ringkasan():
         st.dataframe(df_summary, use_container_width=True, hide_index=True)
     with col2:
         st.write("Grafik:")
-        fig_pie, ax = plt.subplots(facecolor="none")  # <== INI kunci agar background transparan
-        ax.pie(
-            df_summary["Jumlah Tugas"],
-            labels=df_summary["status"],
-            autopct="%1.1f%%",
-            textprops={'color': 'white'}  # teks label biar kontras di dark mode
-        )
-        ax.axis("equal")
-        fig_pie.patch.set_alpha(0)  # transparan juga bagian luar figure
-        st.pyplot(fig_pie)
+        if mode_grafik == "vega":
+            # Dirender di browser: server hanya mengirim data dan spesifikasi
+            st.vega_lite_chart(df_summary, grafik.spesifikasi_pie("status", "Jumlah Tugas"), use_container_width=True)
+        else:
+            # PNG di-cache per data + tema, jadi rerun dengan angka yang sama tidak merender ulang
+            tema = st.context.theme.type or "dark"
+            st.image(grafik.pie_png(df_summary["status"], df_summary["Jumlah Tugas"], tema=tema))
         
     st.markdown("---")
     
     # ==== Ringkasan berdasarkan Prioritas ====
-    df_prioritas = df_tugas.groupby("prioritas").size().reset_index(name="Jumlah")
+    df_prioritas = ringkasan.df_prioritas()
     st.subheader("Total Tugas Berdasarkan Prioritas")
 
     col3, col4 = st.columns(2)
@@ -217,8 +421,85 @@ def halaman_ringkasan():
         st.write("Grafik:")
         st.bar_chart(df_prioritas.set_index("prioritas"))
 
+# Halaman Diagnostik (khusus admin, buka dengan ?diagnostik=<DIAGNOSTIK_TOKEN> di URL).
+# Pengaturan di halaman ini (level log, snapshot baca) berlaku untuk seluruh proses server.
+# Laporan lintas tenant sengaja tidak ada di sini; pakai CLI `python shard.py --ringkasan`.
+def akses_diagnostik() -> bool:
+    token = st.query_params.get("diagnostik")
+    return bool(DIAGNOSTIK_TOKEN) and token is not None and hmac.compare_digest(token, DIAGNOSTIK_TOKEN)
+
+def halaman_diagnostik():
+    st.header("🩺 Diagnostik")
+
+    level = st.selectbox("Level log", pencatatan.DAFTAR_LEVEL,
+                         index=pencatatan.DAFTAR_LEVEL.index(pencatatan.level_aktif())
+                         if pencatatan.level_aktif() in pencatatan.DAFTAR_LEVEL else 2)
+    if level != pencatatan.level_aktif():
+        pencatatan.atur_level(level)
+
+    col1, col2, col3 = st.columns(3)
+    statistik_pool = manajer.db.pool.statistik()
+    col1.metric("Koneksi pool (dibuat / ukuran)", f"{statistik_pool['dibuat']} / {statistik_pool['ukuran']}")
+    col2.metric("Cache query (hit / miss)", f"{manajer._cache.jumlah_hit} / {manajer._cache.jumlah_miss}")
+    col3.metric("Generasi tulis / seq perubahan", f"{manajer.generasi} / {manajer.seq_terakhir()}")
+    st.caption(f"Cache grafik: {grafik.statistik_cache()}")
+    with manajer.db.koneksi() as conn:
+        status_arsip = arsip.status(conn)
+    st.caption(f"Arsip: {status_arsip['jumlah_arsip']} tugas (otomatis: {'aktif' if ARSIP_OTOMATIS else 'nonaktif'}) · "
+               f"pemeliharaan terakhir: "
+               f"{status_arsip['pemeliharaan_terakhir'] or 'belum pernah'} · auto_vacuum {status_arsip['auto_vacuum']} · "
+               f"{status_arsip['halaman_kosong']} halaman kosong")
+
+    st.subheader("Snapshot baca")
+    aktif = st.toggle("Baca analitik dari snapshot di memori", value=database.snapshot_aktif)
+    if aktif != database.snapshot_aktif:
+        database.snapshot_aktif = aktif
+        manajer.kosongkan_cache()
+    if aktif:
+        info = manajer.db.snapshot.info()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Versi snapshot", info["versi"])
+        col2.metric("Umur (detik)", "-" if info["umur_detik"] is None else f"{info['umur_detik']:.1f}",
+                    help=f"Disalin ulang saat dipakai jika database berubah dan umurnya ≥ {info['basi_maks_detik']:g} detik")
+        col3.metric("Salin terakhir (ms)", f"{info['durasi_refresh_ms']:.1f}")
+        st.caption(f"Salinan pembaca: {info['salinan']['dibuat']} dibuat, {info['salinan']['menganggur']} menganggur "
+                   f"(maks. {info['salinan']['maks']} query analitik bersamaan)")
+        if info["ada_perubahan"]:
+            st.caption("Database sudah berubah sejak snapshot disalin; angka analitik mungkin tertinggal.")
+
+    st.subheader("Query per operasi")
+    histogram = metrik.registri.cari("todolist_query_durasi_detik")
+    baris = []
+    for _, kunci, nilai in metrik.registri.cari("todolist_query_total").sampel():
+        label = dict(kunci)
+        jumlah, total_detik = histogram.ringkas(operasi=label["operasi"])
+        baris.append({"operasi": label["operasi"], "status": label["status"], "jumlah": int(nilai),
+                      "rata-rata (ms)": round(total_detik / jumlah * 1000, 3) if jumlah else 0.0})
+    if baris:
+        st.dataframe(baris, use_container_width=True, hide_index=True)
+    else:
+        st.info("Belum ada query yang tercatat.")
+
+    st.subheader(f"Query lambat (≥ {database.ambang_query_lambat_ms} ms)")
+    lambat = database.query_lambat()
+    if not lambat:
+        st.info("Tidak ada query lambat.")
+    for entri in lambat:
+        waktu = datetime.datetime.fromtimestamp(entri["waktu"]).strftime("%H:%M:%S")
+        with st.expander(f"{waktu} · {entri['durasi_ms']:.1f} ms · {entri['operasi']} · {entri['jumlah_baris']} baris"):
+            st.code(entri["query"], language="sql")
+            st.write("Parameter:", entri["params"])
+            st.code("\n".join(entri["rencana"]) or "(tidak ada rencana)", language="text")
+
+    st.subheader("Metrik (format Prometheus)")
+    st.code(metrik.registri.ekspor_prometheus(), language="text")
+
 # Fungsi utama untuk routing halaman
 def main():
+    if akses_diagnostik():
+        halaman_diagnostik()
+        return
+
     st.sidebar.title("📚 TugasKu")
     pilihan = st.sidebar.radio("Pilih Menu", ("Tambah Tugas", "Daftar Tugas", "Ringkasan & Analisis Tugas"))
     
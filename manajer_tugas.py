@@ -1,174 +1,954 @@
+from __future__ import annotations
 import datetime
-import pandas as pd
-from model import Tugas
+import itertools
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+from model import Tugas, TugasBatch, tipekan_dataframe, nomor_hari
+from konfigurasi import (UKURAN_CHUNK_BATCH, UKURAN_HALAMAN_DEFAULT, UKURAN_PETA_IDENTITAS,
+                         CACHE_QUERY_UKURAN, CACHE_QUERY_TTL, BATAS_HASIL_CARI,
+                         PERUBAHAN_SISAKAN, PERUBAHAN_BATAS_DELTA, ARSIP_UMUR_HARI, PEMELIHARAAN_INTERVAL_JAM)
+from cache_query import CacheQuery
+from pencatatan import get_logger
+import arsip
 import database  # modul database.py
 
+if TYPE_CHECKING:
+    import pandas as pd  # Dimuat saat pertama dibutuhkan (lihat method yang membuat DataFrame)
+
+_log = get_logger("manajer_tugas")
+
+def _rentang_hari(tanggal: datetime.date) -> tuple[str, str]:
+    """Ubah satu tanggal menjadi rentang teks [awal, besok) untuk kolom tanggal rekap_harian."""
+    besok = tanggal + datetime.timedelta(days=1)
+    return tanggal.strftime("%Y-%m-%d"), besok.strftime("%Y-%m-%d")
+
+# Kode status/prioritas dari namanya (migrasi 9). Nama yang tidak dikenal menghasilkan NULL:
+# filter tidak cocok dengan baris mana pun, tulisan ditolak oleh NOT NULL.
+_KODE_STATUS = "(SELECT kode FROM status_tugas WHERE nama = ?)"
+_KODE_PRIORITAS = "(SELECT kode FROM prioritas_tugas WHERE nama = ?)"
+
+def rentang_ke_depan(jumlah_hari: int, hari_ini: datetime.date | None = None) -> tuple[datetime.date, datetime.date]:
+    """Rentang inklusif `jumlah_hari` mulai hari ini, misalnya 7 -> (hari ini, hari ini + 6)."""
+    hari_ini = hari_ini or datetime.date.today()
+    return hari_ini, hari_ini + datetime.timedelta(days=max(jumlah_hari, 1) - 1)
+
+def _kondisi_filter(status_filter: str | None = None, prioritas_filter: str | None = None,
+                    tanggal: datetime.date | None = None,
+                    rentang: tuple[datetime.date | None, datetime.date | None] | None = None,
+                    terlambat: bool = False,
+                    rekap: bool = False) -> tuple[list[str], list]:
+    """Daftar kondisi (digabung dengan AND) beserta parameternya dari filter yang dipakai halaman.
+    `rentang` = (dari, sampai) inklusif; salah satu ujung boleh None (terbuka).
+    `terlambat` = deadline sebelum hari ini dan belum Complete.
+    Kondisi memakai kolom berkode (kode_status, kode_prioritas, hari) yang ada di tugas_data,
+    tugas_arsip_data dan view-nya; `rekap=True` memakai kolom teks tabel rekap_harian."""
+    if rekap:
+        kolom_status, kolom_prioritas, kolom_tanggal = "status", "prioritas", "tanggal"
+        nilai_status = nilai_prioritas = "?"
+
+        def batas(tanggal, besok=False):
+            return _rentang_hari(tanggal)[besok]
+    else:
+        kolom_status, kolom_prioritas, kolom_tanggal = "kode_status", "kode_prioritas", "hari"
+        nilai_status, nilai_prioritas = _KODE_STATUS, _KODE_PRIORITAS
+
+        def batas(tanggal, besok=False):
+            return nomor_hari(tanggal) + besok
+    params = []
+    kondisi = []
+
+    if status_filter:
+        kondisi.append(f"{kolom_status} = {nilai_status}")
+        params.append(status_filter)
+
+    if prioritas_filter:
+        kondisi.append(f"{kolom_prioritas} = {nilai_prioritas}")
+        params.append(prioritas_filter)
+
+    if tanggal:
+        kondisi.append(f"{kolom_tanggal} >= ? AND {kolom_tanggal} < ?")
+        params.extend([batas(tanggal), batas(tanggal, besok=True)])
+
+    if rentang:
+        # Rentang inklusif [dari, sampai], tetap sebagai range predicate agar indeks deadline terpakai
+        dari, sampai = rentang
+        if dari:
+            kondisi.append(f"{kolom_tanggal} >= ?")
+            params.append(batas(dari))
+        if sampai:
+            kondisi.append(f"{kolom_tanggal} < ?")
+            params.append(batas(sampai, besok=True))
+
+    if terlambat:
+        kondisi.append(f"{kolom_tanggal} < ? AND {kolom_status} != {nilai_status}")
+        params.extend([batas(datetime.date.today()), "Complete"])
+
+    return kondisi, params
+
+def _bangun_filter(*args, **kwargs) -> tuple[str, list]:
+    """Susun klausa WHERE (boleh kosong) beserta parameternya; argumen sama dengan `_kondisi_filter`."""
+    kondisi, params = _kondisi_filter(*args, **kwargs)
+    where = " WHERE " + " AND ".join(kondisi) if kondisi else ""
+    return where, params
+
+def _query_fts(teks: str) -> str | None:
+    """Ubah teks bebas dari pengguna menjadi query FTS5: setiap kata menjadi prefix
+    ("kata"*) dan semua kata harus ada. Sintaks FTS5 dari pengguna tidak diteruskan
+    sehingga tanda kutip atau operator tidak bisa membuat query error."""
+    kata = re.findall(r"\w+", teks)
+    if not kata:
+        return None
+    return " ".join(f'"{k}"*' for k in kata)
+
+_MAKS_PARAM_IN = 500  # Jumlah ID per query `IN (...)`, jauh di bawah batas variabel SQLite
+
+_KOLOM_TUGAS = "id, matkul, deskripsi, deadline, prioritas, status"
+
+# Tulis langsung ke tugas_data (bukan view tugas) agar lastrowid/rowcount terisi
+_SQL_TAMBAH = f"""
+INSERT INTO tugas_data (matkul, deskripsi, hari, kode_prioritas, kode_status)
+VALUES (?, ?, ?, {_KODE_PRIORITAS}, {_KODE_STATUS})
+"""
+_SQL_UPDATE = f"""
+UPDATE tugas_data
+SET matkul = ?, deskripsi = ?, hari = ?, kode_prioritas = {_KODE_PRIORITAS}, kode_status = {_KODE_STATUS}
+WHERE id = ?
+"""
+
+def _params_tulis(tugas: Tugas) -> tuple:
+    """Parameter `_SQL_TAMBAH` (dan awal `_SQL_UPDATE`) dari satu objek `Tugas`."""
+    return (tugas.matkul, tugas.deskripsi, nomor_hari(tugas.deadline), tugas.prioritas, tugas.status)
+
+def _sql_dengan_arsip(where: str) -> str:
+    """SELECT kolom tugas dari view tugas digabung (UNION ALL) dengan view tugas_arsip, filter yang sama di keduanya.
+    Parameter filter harus diberikan dua kali. Tanpa ORDER BY."""
+    return f"SELECT {_KOLOM_TUGAS} FROM tugas{where} UNION ALL SELECT {_KOLOM_TUGAS} FROM tugas_arsip{where}"
+
+def _seq_dari(conn) -> int:
+    """Seq log perubahan terakhir menurut koneksi `conn` (0 jika belum pernah ada perubahan)."""
+    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tugas_perubahan'").fetchone()
+    return row[0] if row else 0
+
+def _tugas_dari_row(row) -> Tugas:
+    """Bangun objek `Tugas` dari satu baris SELECT (id, matkul, deskripsi, deadline, prioritas, status).
+    Memakai jalur cepat `Tugas.dari_db` karena data berasal dari database."""
+    return Tugas.dari_db(*row)
+
+class RingkasanTugas:
+    """Hasil agregasi jumlah tugas: total, per status, per prioritas dan tabel silang status x prioritas."""
+
+    def __init__(self, silang: dict[tuple[str, str], int]):
+        self.silang = silang
+        self.per_status: dict[str, int] = {}
+        self.per_prioritas: dict[str, int] = {}
+        for (status, prioritas), jumlah in silang.items():
+            self.per_status[status] = self.per_status.get(status, 0) + jumlah
+            self.per_prioritas[prioritas] = self.per_prioritas.get(prioritas, 0) + jumlah
+        self.per_status = dict(sorted(self.per_status.items()))
+        self.per_prioritas = dict(sorted(self.per_prioritas.items()))
+        self.total = sum(silang.values())
+
+    def df_status(self) -> pd.DataFrame:
+        import pandas as pd
+        return pd.DataFrame({"status": list(self.per_status), "Jumlah Tugas": list(self.per_status.values())})
+
+    def df_prioritas(self) -> pd.DataFrame:
+        import pandas as pd
+        return pd.DataFrame({"prioritas": list(self.per_prioritas), "Jumlah": list(self.per_prioritas.values())})
+
+    def df_silang(self) -> pd.DataFrame:
+        """Tabel silang: baris = status, kolom = prioritas."""
+        import pandas as pd
+        df = pd.DataFrame(
+            [(status, prioritas, jumlah) for (status, prioritas), jumlah in self.silang.items()],
+            columns=["status", "prioritas", "jumlah"]
+        )
+        return df.pivot_table(index="status", columns="prioritas", values="jumlah", fill_value=0, aggfunc="sum")
+
+    def __repr__(self) -> str:
+        return f"RingkasanTugas(total:{self.total}, status:{self.per_status}, prioritas:{self.per_prioritas})"
+
+class HalamanTugas:
+    """Satu halaman hasil keyset pagination beserta kunci (deadline, id) untuk berpindah halaman."""
+
+    def __init__(self, data: pd.DataFrame, ada_sebelumnya: bool, ada_berikutnya: bool):
+        self.data = data
+        self.ada_sebelumnya = ada_sebelumnya
+        self.ada_berikutnya = ada_berikutnya
+
+    def _kunci(self, posisi: int) -> tuple[str, int] | None:
+        if self.data.empty:
+            return None
+        baris = self.data.iloc[posisi]
+        return baris["deadline"].strftime("%Y-%m-%d"), int(baris["id"])  # Teks, sama seperti kolom deadline di SQLite
+
+    @property
+    def kunci_awal(self) -> tuple[str, int] | None:
+        """Kunci baris pertama; dipakai sebagai `sebelum` untuk halaman sebelumnya."""
+        return self._kunci(0)
+
+    @property
+    def kunci_akhir(self) -> tuple[str, int] | None:
+        """Kunci baris terakhir; dipakai sebagai `setelah` untuk halaman berikutnya."""
+        return self._kunci(-1)
+
+    def __repr__(self) -> str:
+        return f"HalamanTugas({len(self.data)} baris, sebelumnya:{self.ada_sebelumnya}, berikutnya:{self.ada_berikutnya})"
+
+class PerubahanTugas:
+    """Delta tabel tugas di antara dua nomor urut (seq) log perubahan.
+
+    `diubah` berisi baris terbaru tugas yang ditambah/diubah dan cocok dengan filter;
+    `dibuang` berisi ID yang harus dibuang dari tampilan (dihapus atau tidak lagi
+    cocok filter). Jika `perlu_muat_ulang` True, log sudah dikompaksi melewati
+    `seq_awal` atau deltanya terlalu besar, sehingga klien harus memuat ulang penuh."""
+
+    def __init__(self, seq_awal: int, seq_akhir: int, diubah: pd.DataFrame | None = None,
+                 dibuang: list[int] | None = None, perlu_muat_ulang: bool = False):
+        self.seq_awal = seq_awal
+        self.seq_akhir = seq_akhir
+        self.diubah = diubah
+        self.dibuang = dibuang or []
+        self.perlu_muat_ulang = perlu_muat_ulang
+
+    @property
+    def kosong(self) -> bool:
+        return not self.perlu_muat_ulang and not self.dibuang and (self.diubah is None or self.diubah.empty)
+
+    def terapkan(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Terapkan delta ke DataFrame hasil `get_dataframe_tugas` (filter yang sama) yang dibaca pada `seq_awal`."""
+        if self.perlu_muat_ulang:
+            raise ValueError("Delta tidak lengkap, DataFrame harus dimuat ulang penuh.")
+        if self.kosong:
+            return df
+        import pandas as pd
+        id_diubah = self.diubah["id"] if self.diubah is not None else []
+        sisa = df[~df["id"].isin(self.dibuang) & ~df["id"].isin(id_diubah)]
+        if self.diubah is not None and not self.diubah.empty:
+            sisa = pd.concat([sisa, self.diubah], ignore_index=True) if not sisa.empty else self.diubah
+        return sisa.sort_values(["deadline", "id"], kind="stable").reset_index(drop=True)
+
+    def __repr__(self) -> str:
+        jumlah_diubah = 0 if self.diubah is None else len(self.diubah)
+        return (f"PerubahanTugas(seq {self.seq_awal}->{self.seq_akhir}, diubah:{jumlah_diubah}, "
+                f"dibuang:{len(self.dibuang)}, muat_ulang:{self.perlu_muat_ulang})")
+
 class ManajerTugas:
     """Mengelola logika bisnis to-do list (CRUD untuk tugas)."""
-    _db_setup_done = False # Flag untuk memastikan setup DB hanya dicek sekali per sesi
-
-    def __init__(self):
-        if not ManajerTugas._db_setup_done:
-            print("[ManajerTugas] Memeriksa inisialisasi database...")
-            if database.setup_database_initial(): # Panggil fungsi setup dari database.py
-                ManajerTugas._db_setup_done = True
-                print("[ManajerTugas] Database siap.")
+
+    def __init__(self, ukuran_peta_identitas: int = UKURAN_PETA_IDENTITAS,
+                 ukuran_cache: int = CACHE_QUERY_UKURAN, ttl_cache: float | None = CACHE_QUERY_TTL,
+                 basis_data: database.BasisData | None = None):
+        # Database yang dikelola: default database utama, atau shard milik satu tenant (lihat shard.py)
+        self.db = basis_data or database.get_basis_data()
+
+        # Peta identitas: cache LRU kecil {id: Tugas} untuk lookup per primary key.
+        # Dikosongkan per ID oleh method tulis (update, hapus, tandai selesai).
+        self._peta_identitas: OrderedDict[int, Tugas] = OrderedDict()
+        self._ukuran_peta = ukuran_peta_identitas
+        self._peta_lock = threading.Lock()
+
+        # Cache hasil query baca. Setiap method tulis menaikkan generasi sehingga
+        # entri lama basi dengan sendirinya; TTL menangkap perubahan dari proses lain.
+        self._cache = CacheQuery(ukuran_cache, ttl_cache)
+        self._generasi = 0
+        self._generasi_lock = threading.Lock()
+
+        # DataFrame hasil get_dataframe_tugas beserta seq log perubahan saat dibaca.
+        # Saat seq database naik, hanya delta yang dibaca (lihat perubahan_sejak).
+        self._df_seq: OrderedDict[tuple, tuple[int, pd.DataFrame]] = OrderedDict()
+        self._df_lock = threading.Lock()
+
+        if not self.db.skema_siap: # Setup DB hanya dicek sekali per file database
+            _log.info("Memeriksa inisialisasi database")
+            if self.db.setup_database_initial(): # Panggil fungsi setup dari database.py
+                _log.info("Database siap")
             else:
-                print("[ManajerTugas] ERROR: Inisialisasi database gagal!")
+                _log.error("Inisialisasi database gagal")
             
+    def _ambil_dari_peta(self, id_tugas: int) -> Tugas | None:
+        with self._peta_lock:
+            tugas = self._peta_identitas.get(id_tugas)
+            if tugas is not None:
+                self._peta_identitas.move_to_end(id_tugas)
+            return tugas
+
+    def _simpan_ke_peta(self, tugas: Tugas) -> None:
+        if self._ukuran_peta <= 0:
+            return
+        with self._peta_lock:
+            self._peta_identitas[tugas.id] = tugas
+            self._peta_identitas.move_to_end(tugas.id)
+            while len(self._peta_identitas) > self._ukuran_peta:
+                self._peta_identitas.popitem(last=False)
+
+    def _buang_dari_peta(self, *daftar_id: int) -> None:
+        with self._peta_lock:
+            for id_tugas in daftar_id:
+                self._peta_identitas.pop(id_tugas, None)
+
+    def _setelah_tulis(self, *daftar_id: int) -> None:
+        """Dipanggil setiap method tulis setelah commit: naikkan generasi dan buang ID dari peta identitas."""
+        with self._generasi_lock:
+            self._generasi += 1
+        self._buang_dari_peta(*daftar_id)
+
+    @property
+    def generasi(self) -> int:
+        """Nomor generasi tulis; naik setiap kali data diubah lewat manajer ini."""
+        return self._generasi
+
+    def _dari_cache(self, kunci: tuple, hitung, cadangan=None):
+        """Ambil hasil dari cache atau jalankan `hitung()`. Jika `hitung()` raise dan `cadangan` diisi,
+        error dicatat lalu `cadangan()` dikembalikan tanpa disimpan, sehingga panggilan berikutnya mencoba lagi."""
+        try:
+            return self._cache.ambil_atau_hitung(kunci, self._generasi, hitung)
+        except Exception as e:
+            if cadangan is None:
+                raise
+            _log.error("Gagal menghitung hasil query", extra={"kv": {"kunci": kunci[0], "error": e}})
+            return cadangan()
+
+    def _baca_dataframe(self, sql: str, params: tuple, snapshot: bool = False) -> pd.DataFrame:
+        """Seperti `BasisData.get_dataframe`, tetapi error diteruskan ke pemanggil (untuk `_dari_cache`)."""
+        import pandas as pd
+        with (self.db.koneksi_baca() if snapshot else self.db.koneksi()) as conn:
+            with database.ukur(conn, sql, params) as p:
+                df = tipekan_dataframe(pd.read_sql_query(sql, conn, params=params))
+                p.jumlah_baris = len(df)
+        return df
+
+    def kosongkan_cache(self) -> None:
+        """Buang semua hasil query yang di-cache (misalnya saat tombol Refresh ditekan)."""
+        self._cache.kosongkan()
+        with self._peta_lock:
+            self._peta_identitas.clear()
+        with self._df_lock:
+            self._df_seq.clear()
+
     def tambah_tugas(self, tugas: Tugas) -> bool:
         if not isinstance(tugas, Tugas):
             return False
 
-        sql = """
-        INSERT INTO tugas (matkul, deskripsi, deadline, prioritas, status)
-        VALUES (?, ?, ?, ?, ?)
-        """
-        params = (
-            tugas.matkul,
-            tugas.deskripsi,
-            tugas.deadline.strftime("%Y-%m-%d"),
-            tugas.prioritas,
-            tugas.status
-        )
-        
-        print(">> Menyimpan tugas:", params)
-        
-        last_id = database.execute_query(sql, params)
+        params = _params_tulis(tugas)
+
+        _log.debug("Menyimpan tugas", extra={"kv": {"params": params}})
+
+        # Status/prioritas di luar tabel kode ditolak database (NOT NULL), execute_query return None
+        last_id = self.db.execute_query(_SQL_TAMBAH, params)
         if last_id is not None:
             tugas.id = last_id
+            self._setelah_tulis()
             return True
         return False
 
+    def tambah_tugas_batch(self, daftar: Iterable[Tugas | dict], ukuran_chunk: int = UKURAN_CHUNK_BATCH,
+                           saat_gagal: Callable[[int, Tugas | dict, Exception], None] | None = None) -> int:
+        """Simpan banyak tugas sekaligus. Setiap chunk ditulis dengan `executemany`
+        dalam satu transaksi. Dict akan divalidasi lewat `Tugas` terlebih dahulu.
+        Jika satu chunk gagal, barisnya dicoba ulang satu per satu sehingga hanya baris
+        yang bermasalah yang dilewati. `saat_gagal(indeks, item, error)` dipanggil untuk setiap
+        item yang tidak tersimpan (indeks = posisi di `daftar`, mulai 0), termasuk item yang
+        bukan `Tugas`/dict atau gagal divalidasi. Return jumlah tugas yang berhasil disimpan."""
+        sql = _SQL_TAMBAH
+
+        def gagal(indeks: int, item, error: Exception) -> None:
+            if saat_gagal is not None:
+                saat_gagal(indeks, item, error)
+
+        def ke_params(indeks, item):
+            try:
+                if isinstance(item, dict):
+                    tugas = Tugas(**item)
+                elif isinstance(item, Tugas):
+                    tugas = item
+                else:
+                    raise TypeError(f"Item batch harus Tugas atau dict, bukan {type(item).__name__}")
+                return indeks, item, _params_tulis(tugas)
+            except Exception as e:
+                _log.warning("Data tugas batch tidak valid, dilewati", extra={"kv": {"indeks": indeks, "error": e}})
+                gagal(indeks, item, e)
+                return None
+
+        semua_params = (ke_params(indeks, item) for indeks, item in enumerate(daftar))
+        sumber = (hasil for hasil in semua_params if hasil is not None)
+        total = 0
+        while True:
+            chunk = list(itertools.islice(sumber, ukuran_chunk))
+            if not chunk:
+                break
+            selesai = set()  # Indeks yang sudah tersimpan atau sudah dilaporkan lewat saat_gagal
+            tersimpan = 0
+            try:
+                with self.db.koneksi() as conn:
+                    daftar_params = [params for _, _, params in chunk]
+                    try:
+                        with database.ukur(conn, sql, daftar_params, banyak=True) as p, conn:  # Commit di akhir chunk, rollback jika gagal
+                            conn.executemany(sql, daftar_params)
+                            p.jumlah_baris = len(chunk)
+                        tersimpan = len(chunk)
+                        selesai.update(indeks for indeks, _, _ in chunk)
+                    except Exception as e:
+                        _log.error("Gagal menyimpan chunk batch, dicoba per baris",
+                                   extra={"kv": {"jumlah": len(chunk), "error": e}})
+                        for indeks, item, params in chunk:
+                            try:
+                                with conn:
+                                    conn.execute(sql, params)
+                                tersimpan += 1
+                            except Exception as e_baris:
+                                gagal(indeks, item, e_baris)
+                            selesai.add(indeks)
+            except (sqlite3.Error, TimeoutError) as e:
+                # Koneksi tidak didapat atau rusak: sisa chunk dilaporkan, chunk berikutnya tetap dicoba
+                _log.error("Gagal menyimpan chunk batch", extra={"kv": {"jumlah": len(chunk), "error": e}})
+                for indeks, item, _ in chunk:
+                    if indeks not in selesai:
+                        gagal(indeks, item, e)
+            total += tersimpan
+            if tersimpan:
+                self._setelah_tulis()
+        return total
+
     def get_semua_tugas_obj(self) -> list[Tugas]:
-        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas ORDER BY deadline ASC, id ASC"
-        rows = database.fetch_query(sql)
+        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas ORDER BY hari ASC, id ASC"
+        rows = self.db.fetch_query(sql)
         daftar_tugas = []
         if rows:
             for row in rows:
-                tugas = Tugas(
-                    id_tugas=row["id"],
-                    matkul=row["matkul"],
-                    deskripsi=row["deskripsi"],
-                    deadline=row["deadline"],
-                    prioritas=row["prioritas"],
-                    status=row["status"]
-                )
-                daftar_tugas.append(tugas)
+                daftar_tugas.append(_tugas_dari_row(row))
         return daftar_tugas
 
-    def get_dataframe_tugas(self, status_filter: str | None = None, prioritas_filter: str | None = None, tanggal: datetime.date | None = None) -> pd.DataFrame:
-        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas"
-        params = []
-        kondisi = []
+    def get_tugas_batch(self, filters: dict | None = None, ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> TugasBatch:
+        """Ambil tugas ke dalam `TugasBatch` (columnar) untuk pekerjaan massal yang hemat memori."""
+        where, params = _bangun_filter(**(filters or {}))
+        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas" + where
+        sql += " ORDER BY hari ASC, id ASC"
+        batch = TugasBatch()
+        with self.db.koneksi() as conn:
+            for rows in database.iter_baris(conn, sql, params, ukuran_chunk):
+                for row in rows:
+                    batch.tambah(*row)
+        return batch
+
+    def get_tugas(self, id_tugas: int, sertakan_arsip: bool = False) -> Tugas | None:
+        """Ambil satu tugas lewat primary key. Return None jika ID tidak ada.
+        Dengan `sertakan_arsip=True`, ID yang tidak ada di tabel aktif dicari juga di arsip."""
+        tugas = self._ambil_dari_peta(id_tugas)
+        if tugas is not None:
+            return tugas
+        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas WHERE id = ?"
+        row = self.db.fetch_query(sql, (id_tugas,), fetch_all=False)
+        if not row and sertakan_arsip:
+            # Tugas arsip tidak disimpan di peta identitas: method tulis hanya menyentuh tabel aktif
+            sql = f"SELECT {_KOLOM_TUGAS} FROM tugas_arsip WHERE id = ?"
+            row = self.db.fetch_query(sql, (id_tugas,), fetch_all=False)
+            return _tugas_dari_row(row) if row else None
+        if not row:
+            return None
+        tugas = _tugas_dari_row(row)
+        self._simpan_ke_peta(tugas)
+        return tugas
+
+    def get_tugas_many(self, daftar_id: Iterable[int]) -> dict[int, Tugas]:
+        """Ambil banyak tugas lewat primary key. Return dict {id: Tugas} untuk ID yang ditemukan."""
+        hasil = {}
+        belum = []
+        for id_tugas in dict.fromkeys(daftar_id):  # Buang duplikat, urutan tetap
+            tugas = self._ambil_dari_peta(id_tugas)
+            if tugas is not None:
+                hasil[id_tugas] = tugas
+            else:
+                belum.append(id_tugas)
+
+        for awal in range(0, len(belum), _MAKS_PARAM_IN):
+            potongan = belum[awal:awal + _MAKS_PARAM_IN]
+            tanda = ", ".join("?" * len(potongan))
+            sql = f"SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas WHERE id IN ({tanda})"
+            for row in self.db.fetch_query(sql, tuple(potongan)) or []:
+                tugas = _tugas_dari_row(row)
+                self._simpan_ke_peta(tugas)
+                hasil[tugas.id] = tugas
+        return hasil
+
+    def get_dataframe_tugas(self, status_filter: str | None = None, prioritas_filter: str | None = None, tanggal: datetime.date | None = None,
+                            rentang: tuple[datetime.date | None, datetime.date | None] | None = None,
+                            terlambat: bool = False, sertakan_arsip: bool = False) -> pd.DataFrame:
+        """`tanggal` = satu hari, `rentang` = (dari, sampai) inklusif, `terlambat` = lewat deadline dan belum Complete.
+        `sertakan_arsip=True` ikut membaca tugas_arsip (di-cache per generasi, tanpa refresh inkremental)."""
+        filters = {"status_filter": status_filter, "prioritas_filter": prioritas_filter, "tanggal": tanggal,
+                   "rentang": rentang, "terlambat": terlambat}
+        where, params = _bangun_filter(**filters)
+        if sertakan_arsip:
+            sql = _sql_dengan_arsip(where) + " ORDER BY deadline ASC, id ASC"  # Kolom hasil UNION, bukan hari
+            kunci = ("df_arsip", status_filter, prioritas_filter, tanggal, rentang, terlambat, self.db.versi_baca())
+            import pandas as pd
+            return self._dari_cache(kunci, lambda: self._baca_dataframe(sql, tuple(params) * 2, snapshot=True),
+                                    pd.DataFrame).copy()
+        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas" + where
+        sql += " ORDER BY hari ASC, id ASC"
+        if self._cache.ukuran <= 0:
+            return self.db.get_dataframe(sql, tuple(params), snapshot=True)
+
+        # Refresh inkremental: biaya sebanding jumlah perubahan sejak pembacaan terakhir, bukan ukuran tabel
+        # Batas `terlambat` bergeser setiap hari tanpa ada perubahan data, jadi tanggalnya ikut jadi kunci
+        kunci = (status_filter, prioritas_filter, tanggal, rentang, datetime.date.today() if terlambat else False)
+        try:
+            seq = self.seq_terakhir()
+            with self._df_lock:
+                entri = self._df_seq.get(kunci)
+            if entri is None:
+                # Muat penuh lewat koneksi baca (snapshot di memori jika aktif) beserta seq dari sumber yang sama;
+                # delta dari file lalu mengejar ketertinggalan snapshot sehingga hasilnya tetap terkini
+                entri = self._muat_dataframe(sql, tuple(params))
+            df = None
+            if entri[0] == seq:
+                df = entri[1]
+            else:
+                perubahan = self.perubahan_sejak(entri[0], filters)
+                if not perubahan.perlu_muat_ulang:
+                    df, seq = perubahan.terapkan(entri[1]), perubahan.seq_akhir
+            if df is None:
+                # Log perubahan sudah dikompaksi atau delta terlalu besar: muat ulang langsung dari file
+                seq, df = self._muat_dataframe(sql, tuple(params), dari_file=True)
+        except Exception as e:
+            # Kontrak lama tetap berlaku (DataFrame kosong, bukan exception); hasil gagal tidak disimpan
+            import pandas as pd
+            _log.error("Gagal baca ke DataFrame", extra={"kv": {"error": e, "query": " ".join(sql.split())}})
+            return pd.DataFrame()
+        with self._df_lock:
+            self._df_seq[kunci] = (seq, df)
+            self._df_seq.move_to_end(kunci)
+            while len(self._df_seq) > self._cache.ukuran:
+                self._df_seq.popitem(last=False)
+        return df.copy()
+
+    def _muat_dataframe(self, sql: str, params: tuple, dari_file: bool = False) -> tuple[int, pd.DataFrame]:
+        """Muat penuh (seq, DataFrame) lewat koneksi baca, atau koneksi pool biasa jika `dari_file`.
+        Error database diteruskan ke pemanggil agar hasil gagal tidak ikut disimpan."""
+        import pandas as pd
+        with (self.db.koneksi() if dari_file else self.db.koneksi_baca()) as conn:
+            # seq dibaca sebelum query: perubahan di antaranya akan diterapkan ulang nanti (idempoten)
+            seq = _seq_dari(conn)
+            with database.ukur(conn, sql, params) as p:
+                df = tipekan_dataframe(pd.read_sql_query(sql, conn, params=params))
+                p.jumlah_baris = len(df)
+        return seq, df
+
+    def get_halaman_tugas(self, status_filter: str | None = None, prioritas_filter: str | None = None,
+                          setelah: tuple[str, int] | None = None, sebelum: tuple[str, int] | None = None,
+                          ukuran: int = UKURAN_HALAMAN_DEFAULT,
+                          rentang: tuple[datetime.date | None, datetime.date | None] | None = None,
+                          terlambat: bool = False) -> HalamanTugas:
+        """Ambil satu halaman tugas dengan keyset pagination pada (deadline, id).
+        Isi `setelah` dengan `kunci_akhir` halaman sekarang untuk maju, atau `sebelum`
+        dengan `kunci_awal` untuk mundur. Biaya per halaman tidak bergantung pada kedalaman.
+        Deadline kunci berupa teks YYYY-MM-DD; dibandingkan sebagai nomor hari di indeks (hari, id)."""
+        where, params = _bangun_filter(status_filter, prioritas_filter, rentang=rentang, terlambat=terlambat)
+        mundur = sebelum is not None and setelah is None
+        kunci = sebelum if mundur else setelah
+        if kunci is not None:
+            where += (" AND " if where else " WHERE ") + ("(hari, id) < (?, ?)" if mundur else "(hari, id) > (?, ?)")
+            params.extend([nomor_hari(datetime.date.fromisoformat(str(kunci[0]))), int(kunci[1])])
+
+        arah = "DESC" if mundur else "ASC"
+        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas" + where
+        sql += f" ORDER BY hari {arah}, id {arah} LIMIT ?"
+        params.append(ukuran + 1)  # Satu baris ekstra untuk tahu apakah masih ada halaman lain
+
+        kunci_cache = ("halaman", status_filter, prioritas_filter, setelah, sebelum, ukuran, rentang,
+                       datetime.date.today() if terlambat else False)  # Batas `terlambat` bergeser tiap hari
+        import pandas as pd
+        df = self._dari_cache(kunci_cache, lambda: self._baca_dataframe(sql, tuple(params)), pd.DataFrame).copy()
+        masih_ada = len(df) > ukuran
+        df = df.iloc[:ukuran]
+        if mundur:
+            df = df.iloc[::-1]
+            return HalamanTugas(df.reset_index(drop=True), ada_sebelumnya=masih_ada, ada_berikutnya=True)
+        return HalamanTugas(df.reset_index(drop=True), ada_sebelumnya=kunci is not None, ada_berikutnya=masih_ada)
+
+    def iter_dataframe_tugas(self, filters: dict | None = None, ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> Iterator[pd.DataFrame]:
+        """Sama seperti `get_dataframe_tugas`, tetapi menghasilkan DataFrame per chunk.
+        `filters` berisi argumen `get_dataframe_tugas` (status_filter, prioritas_filter, tanggal)."""
+        where, params = _bangun_filter(**(filters or {}))
+        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas" + where
+        sql += " ORDER BY hari ASC, id ASC"
+        return self.db.get_dataframe(sql, tuple(params), chunksize=ukuran_chunk)
+
+    def iter_tugas(self, filters: dict | None = None, ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> Iterator[Tugas]:
+        """Generator `Tugas` berurutan deadline. Baris diambil dengan `fetchmany` per chunk
+        sehingga memori tidak bertambah seiring ukuran tabel."""
+        where, params = _bangun_filter(**(filters or {}))
+        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas" + where
+        sql += " ORDER BY hari ASC, id ASC"
+        with self.db.koneksi() as conn:
+            for rows in database.iter_baris(conn, sql, params, ukuran_chunk):
+                for row in rows:
+                    yield _tugas_dari_row(row)
+
+    def get_chunk_tugas(self, filters: dict | None = None, setelah: tuple[int, int] | None = None,
+                        ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> tuple[list[Tugas], tuple[int, int] | None]:
+        """Satu chunk `Tugas` berurutan deadline dengan keyset pagination pada (hari, id).
+        Return (daftar tugas, kunci untuk chunk berikutnya; None jika sudah habis). Setiap panggilan
+        meminjam koneksi sendiri, jadi aman dipakai iterator yang lama hidupnya (lihat AsyncManajerTugas)."""
+        where, params = _bangun_filter(**(filters or {}))
+        if setelah is not None:
+            where += (" AND " if where else " WHERE ") + "(hari, id) > (?, ?)"
+            params.extend([int(setelah[0]), int(setelah[1])])
+        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status, hari FROM tugas" + where
+        sql += " ORDER BY hari ASC, id ASC LIMIT ?"
+        params.append(ukuran_chunk)
+        rows = self.db.fetch_query(sql, tuple(params))
+        if rows is None:
+            raise sqlite3.OperationalError("Gagal membaca chunk tugas (lihat log)")
+        daftar = [_tugas_dari_row(row[:6]) for row in rows]
+        kunci = (rows[-1][6], rows[-1][0]) if len(rows) == ukuran_chunk else None
+        return daftar, kunci
+
+    # ---- Log perubahan (change feed) ----
+
+    def seq_terakhir(self) -> int:
+        """Nomor urut perubahan terakhir di database (0 jika belum pernah ada perubahan)."""
+        with self.db.koneksi() as conn:
+            return _seq_dari(conn)
+
+    def perubahan_sejak(self, seq: int, filters: dict | None = None,
+                        batas: int = PERUBAHAN_BATAS_DELTA) -> PerubahanTugas:
+        """Delta sejak `seq` (nilai `seq_akhir` dari delta sebelumnya atau `seq_terakhir()` saat memuat penuh).
+        `filters` berisi argumen `get_dataframe_tugas`; baris yang berubah tetapi tidak lagi cocok
+        masuk `dibuang`. Semua dibaca dalam satu transaksi baca sehingga konsisten satu sama lain."""
+        import pandas as pd
+        kondisi, params_filter = _kondisi_filter(**(filters or {}))
+        with self.db.koneksi() as conn:
+            conn.execute("BEGIN")  # Snapshot baca: seq, log dan isi tugas dari titik waktu yang sama
+            try:
+                seq_akhir = _seq_dari(conn)
+                if seq >= seq_akhir:
+                    return PerubahanTugas(seq, seq_akhir)
+                seq_min = conn.execute("SELECT MIN(seq) FROM tugas_perubahan").fetchone()[0]
+                if seq_min is None or seq_min > seq + 1:  # Entri sesudah `seq` sudah dikompaksi
+                    return PerubahanTugas(seq, seq_akhir, perlu_muat_ulang=True)
+
+                sql = "SELECT DISTINCT id_tugas FROM tugas_perubahan WHERE seq > ? AND seq <= ?"
+                with database.ukur(conn, sql, (seq, seq_akhir)) as p:
+                    daftar_id = [row[0] for row in conn.execute(sql, (seq, seq_akhir))]
+                    p.jumlah_baris = len(daftar_id)
+                if len(daftar_id) > batas:
+                    return PerubahanTugas(seq, seq_akhir, perlu_muat_ulang=True)
+
+                potongan_df = []
+                for awal in range(0, len(daftar_id), _MAKS_PARAM_IN):
+                    potongan = daftar_id[awal:awal + _MAKS_PARAM_IN]
+                    sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas WHERE "
+                    sql += " AND ".join([f"id IN ({', '.join('?' * len(potongan))})"] + kondisi)
+                    params = tuple(potongan) + tuple(params_filter)
+                    with database.ukur(conn, sql, params) as p:
+                        potongan_df.append(tipekan_dataframe(pd.read_sql_query(sql, conn, params=params)))
+                        p.jumlah_baris = len(potongan_df[-1])
+            finally:
+                conn.rollback()
+
+        diubah = pd.concat(potongan_df, ignore_index=True) if len(potongan_df) > 1 else potongan_df[0]
+        tetap_ada = set(diubah["id"].tolist())
+        return PerubahanTugas(seq, seq_akhir, diubah, [i for i in daftar_id if i not in tetap_ada])
+
+    def kompaksi_perubahan(self, sisakan: int = PERUBAHAN_SISAKAN) -> int:
+        """Buang entri log perubahan lama, sisakan `sisakan` entri terbaru. Return jumlah entri yang dibuang.
+        Klien yang seq-nya lebih tua dari entri tersisa akan mendapat `perlu_muat_ulang`."""
+        sql = "DELETE FROM tugas_perubahan WHERE seq <= (SELECT seq FROM sqlite_sequence WHERE name = 'tugas_perubahan') - ?"
+        try:
+            with self.db.koneksi() as conn:
+                with database.ukur(conn, sql, (sisakan,)) as p, conn:
+                    p.jumlah_baris = conn.execute(sql, (sisakan,)).rowcount
+                return p.jumlah_baris
+        except Exception as e:
+            _log.error("Kompaksi log perubahan gagal", extra={"kv": {"error": e}})
+            return 0
 
-        if status_filter:
-            kondisi.append("status = ?")
-            params.append(status_filter)
+    def berikutnya(self, n: int = 5, dari: datetime.date | None = None, prioritas_filter: str | None = None,
+                   termasuk_selesai: bool = False) -> pd.DataFrame:
+        """`n` tugas yang paling dekat jatuh tempo mulai `dari` (default hari ini), diurutkan
+        deadline lalu peringkat prioritas (kolom `urutan` prioritas_tugas, disinkronkan dari `DAFTAR_PRIORITAS`
+        setiap start). Indeks hari dibaca berurutan dan hanya tugas di hari yang sama yang diurutkan ulang,
+        lalu berhenti setelah LIMIT, jadi biayanya tidak bergantung jumlah tugas."""
+        kondisi, params = _kondisi_filter(prioritas_filter=prioritas_filter, rentang=(dari or datetime.date.today(), None))
+        if not termasuk_selesai:
+            kondisi.append(f"kode_status != {_KODE_STATUS}")
+            params.append("Complete")
+        sql = "SELECT id, matkul, deskripsi, deadline, prioritas, status FROM tugas WHERE " + " AND ".join(kondisi)
+        sql += " ORDER BY hari ASC, (SELECT urutan FROM prioritas_tugas WHERE kode = kode_prioritas) ASC, id ASC LIMIT ?"
+        params.append(n)
+        kunci = ("berikutnya", n, dari or datetime.date.today(), prioritas_filter, termasuk_selesai)
+        import pandas as pd
+        return self._dari_cache(kunci, lambda: self._baca_dataframe(sql, tuple(params)), pd.DataFrame).copy()
 
-        if prioritas_filter:
-            kondisi.append("prioritas = ?")
-            params.append(prioritas_filter)
-        
-        if tanggal:
-            kondisi.append("DATE(deadline) = ?")
-            params.append(tanggal.strftime("%Y-%m-%d"))
+    def cari(self, query: str, filters: dict | None = None, limit: int = BATAS_HASIL_CARI,
+             penanda: tuple[str, str] = ("[", "]")) -> pd.DataFrame:
+        """Cari tugas berdasarkan kata di matkul atau deskripsi lewat indeks FTS5.
+        Kata terakhir yang belum selesai diketik tetap cocok (pencocokan prefix).
+        `filters` berisi argumen yang sama dengan `get_dataframe_tugas`.
+        Return DataFrame terurut relevansi (bm25) dengan kolom tambahan `cuplikan`
+        (potongan teks, kata yang cocok diapit `penanda`) dan `skor` (lebih kecil = lebih relevan)."""
+        ekspresi = _query_fts(query or "")
+        if ekspresi is None:
+            import pandas as pd
+            return tipekan_dataframe(pd.DataFrame(columns=["id", "matkul", "deskripsi", "deadline", "prioritas", "status", "cuplikan", "skor"]))
 
-        if kondisi:
-            sql += " WHERE " + " AND ".join(kondisi)
+        kondisi, params = _kondisi_filter(**(filters or {}))
+        kondisi = ["tugas_fts MATCH ?"] + kondisi  # Kolom filter hanya ada di tugas, tidak ambigu
+        sql = f"""
+        SELECT t.id, t.matkul, t.deskripsi, t.deadline, t.prioritas, t.status,
+               snippet(tugas_fts, -1, ?, ?, '…', 12) AS cuplikan, tugas_fts.rank AS skor
+        FROM tugas_fts JOIN tugas t ON t.id = tugas_fts.rowid
+        WHERE {" AND ".join(kondisi)}
+        ORDER BY tugas_fts.rank, t.hari
+        LIMIT ?"""
+        params = [penanda[0], penanda[1], ekspresi] + params + [limit]
 
-        sql += " ORDER BY deadline ASC, id ASC"
-        return database.get_dataframe(sql, tuple(params))
+        kunci = ("cari", ekspresi, tuple(sorted((filters or {}).items())), limit, penanda)
+        import pandas as pd
+        return self._dari_cache(kunci, lambda: self._baca_dataframe(sql, tuple(params)), pd.DataFrame).copy()
 
+    def ringkasan(self, tanggal: datetime.date | None = None,
+                  rentang: tuple[datetime.date, datetime.date] | None = None,
+                  sertakan_arsip: bool = False) -> RingkasanTugas:
+        """Hitung total, jumlah per status, per prioritas dan tabel silangnya dalam satu query GROUP BY.
+        `tanggal` memfilter satu hari, `rentang` memfilter (dari, sampai) inklusif.
+        Dibaca dari `rekap_harian` sehingga biayanya sebanding jumlah hari, bukan jumlah tugas.
+        `sertakan_arsip=True` menambahkan hitungan dari tugas_arsip (GROUP BY kode status/prioritas)."""
+        where, params = _bangun_filter(tanggal=tanggal, rentang=rentang, rekap=True)
+        sql = "SELECT status, prioritas, SUM(jumlah) AS jumlah FROM rekap_harian" + where
+        if sertakan_arsip:
+            where_arsip, params_arsip = _bangun_filter(tanggal=tanggal, rentang=rentang)
+            sql = (f"SELECT status, prioritas, SUM(jumlah) AS jumlah FROM ({sql} GROUP BY status, prioritas"
+                   f" UNION ALL SELECT status, prioritas, COUNT(*) FROM tugas_arsip{where_arsip}"
+                   f" GROUP BY kode_status, kode_prioritas)")
+            params += params_arsip
+        sql += " GROUP BY status, prioritas ORDER BY status, prioritas"
+
+        def hitung():
+            with self.db.koneksi_baca() as conn:
+                with database.ukur(conn, sql, tuple(params)) as p:
+                    rows = conn.execute(sql, tuple(params)).fetchall()
+                    p.jumlah_baris = len(rows)
+            return RingkasanTugas({(row["status"], row["prioritas"]): row["jumlah"] for row in rows})
+        kunci = ("ringkasan", tanggal, rentang, sertakan_arsip, self.db.versi_baca())
+        return self._dari_cache(kunci, hitung, lambda: RingkasanTugas({}))
 
     def hapus_tugas(self, id_tugas: int) -> bool:
-        sql = "DELETE FROM tugas WHERE id = ?"
+        sql = "DELETE FROM tugas_data WHERE id = ?"
         params = (id_tugas,)
-        conn = database.get_db_connection()
-        if not conn:
-            return False
         try:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            conn.commit()
-            if cursor.rowcount == 0:
-                print(f"ERROR saat menghapus tugas: ID {id_tugas} tidak ditemukan.")
-                return False
-            return True
+            with self.db.koneksi() as conn:
+                with database.ukur(conn, sql, params) as p:
+                    cursor = conn.cursor()
+                    cursor.execute(sql, params)
+                    conn.commit()
+                    p.jumlah_baris = cursor.rowcount
+                self._setelah_tulis(id_tugas)
+                if cursor.rowcount == 0:
+                    _log.warning("Gagal menghapus tugas: ID tidak ditemukan", extra={"kv": {"id": id_tugas}})
+                    return False
+                return True
         except Exception as e:
-            print(f"ERROR saat menghapus tugas: {e}")
+            _log.error("Gagal menghapus tugas", extra={"kv": {"id": id_tugas, "error": e}})
             return False
-        finally:
-            conn.close()
 
     def tandai_selesai(self, id_tugas: int) -> bool:
-        sql = "UPDATE tugas SET status = 'Complete' WHERE id = ?"
-        params = (id_tugas,)
-        conn = database.get_db_connection()
-        if not conn:
-            return False
+        sql = f"UPDATE tugas_data SET kode_status = {_KODE_STATUS} WHERE id = ?"
+        params = ("Complete", id_tugas)
         try:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            conn.commit()
-            if cursor.rowcount == 0:
-                print(f"ERROR saat tandai selesai: ID {id_tugas} tidak ditemukan.")
-                return False
-            return True
+            with self.db.koneksi() as conn:
+                with database.ukur(conn, sql, params) as p:
+                    cursor = conn.cursor()
+                    cursor.execute(sql, params)
+                    conn.commit()
+                    p.jumlah_baris = cursor.rowcount
+                self._setelah_tulis(id_tugas)
+                if cursor.rowcount == 0:
+                    _log.warning("Gagal tandai selesai: ID tidak ditemukan", extra={"kv": {"id": id_tugas}})
+                    return False
+                return True
         except Exception as e:
-            print(f"ERROR saat tandai selesai: {e}")
+            _log.error("Gagal tandai selesai", extra={"kv": {"id": id_tugas, "error": e}})
             return False
-        finally:
-            conn.close()
 
     def update_tugas(self, tugas: Tugas) -> bool:
-        sql = """
-        UPDATE tugas
-        SET matkul = ?, deskripsi = ?, deadline = ?, prioritas = ?, status = ?
-        WHERE id = ?
-        """
-        params = (
-            tugas.matkul,
-            tugas.deskripsi,
-            tugas.deadline.strftime("%Y-%m-%d"),
-            tugas.prioritas,
-            tugas.status,
-            tugas.id
-        )
-        conn = database.get_db_connection()
-        if not conn:
-            return False
+        sql = _SQL_UPDATE
+        params = _params_tulis(tugas) + (tugas.id,)
         try:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            conn.commit()
-            if cursor.rowcount == 0:
-                print(f"ERROR saat update: ID {tugas.id} tidak ditemukan.")
-                return False
-            return True
+            with self.db.koneksi() as conn:
+                with database.ukur(conn, sql, params) as p:
+                    cursor = conn.cursor()
+                    cursor.execute(sql, params)
+                    conn.commit()
+                    p.jumlah_baris = cursor.rowcount
+                self._setelah_tulis(tugas.id)
+                if cursor.rowcount == 0:
+                    _log.warning("Gagal update: ID tidak ditemukan", extra={"kv": {"id": tugas.id}})
+                    return False
+                return True
         except Exception as e:
-            print(f"ERROR saat update tugas: {e}")
+            _log.error("Gagal update tugas", extra={"kv": {"id": tugas.id, "error": e}})
             return False
-        finally:
-            conn.close()
-
-    def hitung_total_tugas(self, tanggal: datetime.date | None = None) -> int:
-        sql = "SELECT COUNT(*) FROM tugas"
-        params = ()
-        if tanggal:
-            sql += " WHERE DATE(deadline) = ?"
-            params = (tanggal.strftime("%Y-%m-%d"),)
-
-        conn = database.get_db_connection()
-        if not conn:
-            return 0
+
+    # ---- Operasi massal: satu transaksi (satu commit) untuk banyak tugas ----
+
+    def _ubah_per_id(self, sql: str, daftar_id: Iterable[int], params_awal: tuple = ()) -> dict[int, bool]:
+        """Jalankan UPDATE/DELETE berbentuk `... WHERE id IN ({tanda})` untuk banyak ID dalam satu transaksi.
+        Return {id: True jika ID ada dan terkena perubahan}. Jika gagal, semua perubahan dibatalkan."""
+        daftar_id = list(dict.fromkeys(int(i) for i in daftar_id))
+        hasil = dict.fromkeys(daftar_id, False)
+        if not daftar_id:
+            return hasil
         try:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            result = cursor.fetchone()
-            return result[0] if result else 0
+            with self.db.koneksi() as conn:
+                conn.execute("BEGIN IMMEDIATE")  # Kunci tulis dari awal agar SELECT dan UPDATE melihat data yang sama
+                try:
+                    for awal in range(0, len(daftar_id), _MAKS_PARAM_IN):
+                        potongan = daftar_id[awal:awal + _MAKS_PARAM_IN]
+                        tanda = ", ".join("?" * len(potongan))
+                        for row in conn.execute(f"SELECT id FROM tugas_data WHERE id IN ({tanda})", potongan):
+                            hasil[row[0]] = True
+                        sql_potongan = sql.format(tanda=tanda)
+                        params = params_awal + tuple(potongan)
+                        with database.ukur(conn, sql_potongan, params) as p:
+                            p.jumlah_baris = conn.execute(sql_potongan, params).rowcount
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
         except Exception as e:
-            print(f"[ERROR hitung_total_tugas] {e}")
+            _log.error("Operasi massal gagal, semua perubahan dibatalkan",
+                       extra={"kv": {"jumlah_id": len(daftar_id), "error": e}})
+            return dict.fromkeys(daftar_id, False)
+        self._setelah_tulis(*daftar_id)
+        return hasil
+
+    def tandai_selesai_banyak(self, daftar_id: Iterable[int]) -> dict[int, bool]:
+        """Tandai banyak tugas Complete dalam satu transaksi. Return {id: berhasil}."""
+        return self._ubah_per_id(f"UPDATE tugas_data SET kode_status = {_KODE_STATUS} WHERE id IN ({{tanda}})",
+                                 daftar_id, ("Complete",))
+
+    def hapus_banyak(self, daftar_id: Iterable[int]) -> dict[int, bool]:
+        """Hapus banyak tugas dalam satu transaksi. Return {id: berhasil}."""
+        return self._ubah_per_id("DELETE FROM tugas_data WHERE id IN ({tanda})", daftar_id)
+
+    def update_banyak(self, daftar_tugas: Iterable[Tugas]) -> dict[int, bool]:
+        """Simpan perubahan banyak objek `Tugas` (yang sudah punya ID) dalam satu transaksi.
+        Return {id: berhasil}; ID yang tidak ada di database bernilai False."""
+        sql = _SQL_UPDATE
+        daftar_tugas = [t for t in daftar_tugas if isinstance(t, Tugas) and t.id is not None]
+        hasil = {tugas.id: False for tugas in daftar_tugas}
+        if not daftar_tugas:
+            return hasil
+        try:
+            with self.db.koneksi() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    with database.ukur(conn, sql, None, banyak=True) as p:
+                        p.jumlah_baris = 0
+                        for tugas in daftar_tugas:
+                            cursor = conn.execute(sql, _params_tulis(tugas) + (tugas.id,))
+                            hasil[tugas.id] = cursor.rowcount > 0
+                            p.jumlah_baris += cursor.rowcount
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+        except Exception as e:
+            _log.error("Update massal gagal, semua perubahan dibatalkan",
+                       extra={"kv": {"jumlah_tugas": len(daftar_tugas), "error": e}})
+            return dict.fromkeys(hasil, False)
+        self._setelah_tulis(*hasil)
+        return hasil
+
+    def ubah_status_dengan_filter(self, status_baru: str, filters: dict | None = None,
+                                  sebelum: datetime.date | None = None) -> list[int]:
+        """Ubah status semua tugas yang cocok dengan filter dalam satu transaksi, misalnya
+        `ubah_status_dengan_filter("Complete", {"status_filter": "Pending"}, sebelum=akhir_semester)`.
+        `filters` berisi argumen `get_dataframe_tugas`; `sebelum` memilih deadline < tanggal tersebut.
+        Return daftar ID yang statusnya berubah."""
+        kondisi, params = _kondisi_filter(**(filters or {}))
+        if sebelum:
+            kondisi.append("hari < ?")
+            params.append(nomor_hari(sebelum))
+        kondisi.append(f"kode_status IS NOT {_KODE_STATUS}")  # Lewati tugas yang statusnya sudah sama
+        params.append(status_baru)
+        where = " WHERE " + " AND ".join(kondisi)
+        try:
+            with self.db.koneksi() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    daftar_id = [row[0] for row in conn.execute("SELECT id FROM tugas_data" + where, params)]
+                    sql = f"UPDATE tugas_data SET kode_status = {_KODE_STATUS}" + where
+                    with database.ukur(conn, sql, [status_baru] + params) as p:
+                        p.jumlah_baris = conn.execute(sql, [status_baru] + params).rowcount
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+        except Exception as e:
+            _log.error("Ubah status dengan filter gagal", extra={"kv": {"status_baru": status_baru, "error": e}})
+            return []
+        if daftar_id:
+            self._setelah_tulis(*daftar_id)
+        return daftar_id
+
+    def hitung_total_tugas(self, tanggal: datetime.date | None = None,
+                           rentang: tuple[datetime.date | None, datetime.date | None] | None = None,
+                           terlambat: bool = False, sertakan_arsip: bool = False) -> int:
+        # Dibaca dari rekap_harian (dijaga trigger), bukan COUNT(*) atas seluruh tabel tugas
+        where, params = _bangun_filter(tanggal=tanggal, rentang=rentang, terlambat=terlambat, rekap=True)
+        sql = "SELECT COALESCE(SUM(jumlah), 0) FROM rekap_harian" + where
+        if sertakan_arsip:
+            where_arsip, params_arsip = _bangun_filter(tanggal=tanggal, rentang=rentang, terlambat=terlambat)
+            sql = f"SELECT ({sql}) + (SELECT COUNT(*) FROM tugas_arsip_data{where_arsip})"
+            params += params_arsip
+        params = tuple(params)
+
+        def hitung():
+            with self.db.koneksi_baca() as conn:
+                with database.ukur(conn, sql, params) as p:
+                    cursor = conn.cursor()
+                    cursor.execute(sql, params)
+                    result = cursor.fetchone()
+                    p.jumlah_baris = 1 if result else 0
+                return result[0] if result else 0
+
+        try:
+            kunci = ("total", tanggal, rentang, terlambat, sertakan_arsip, self.db.versi_baca())
+            return self._dari_cache(kunci, hitung)
+        except Exception as e:
+            _log.error("Gagal menghitung total tugas", extra={"kv": {"error": e}})
             return 0
-        finally:
-            conn.close()
+
+    def arsipkan_selesai(self, umur_hari: int = ARSIP_UMUR_HARI) -> int:
+        """Pindahkan tugas Complete yang deadline-nya lebih lama dari `umur_hari` ke arsip (lihat arsip.py).
+        Return jumlah tugas yang diarsipkan."""
+        with self.db.koneksi() as conn:
+            jumlah = arsip.arsipkan(conn, umur_hari)
+        if jumlah:
+            self._setelah_tulis()
+            with self._peta_lock:
+                self._peta_identitas.clear()  # ID yang diarsipkan tidak dilacak satu per satu
+        return jumlah
+
+    def pemeliharaan_terjadwal(self, interval_jam: float = PEMELIHARAAN_INTERVAL_JAM,
+                               umur_hari: int | None = ARSIP_UMUR_HARI) -> dict | None:
+        """Arsipkan tugas lama lalu jalankan ANALYZE/optimize/incremental vacuum jika sudah jatuh tempo
+        (`umur_hari=None`: tanpa arsip). Aman dipanggil berkala dari banyak proses; return None jika belum waktunya."""
+        try:
+            with self.db.koneksi() as conn:
+                hasil = arsip.jalankan_terjadwal(conn, interval_jam, umur_hari)
+        except Exception as e:
+            _log.error("Pemeliharaan terjadwal gagal", extra={"kv": {"error": e}})
+            return None
+        if hasil and hasil["diarsipkan"]:
+            self._setelah_tulis()
+            with self._peta_lock:
+                self._peta_identitas.clear()
+        return hasil
@@ -0,0 +1,175 @@
+# manajer_tugas_async.py
+"""Fasad asyncio untuk `ManajerTugas`.
+
+Setiap operasi dijalankan di thread pool terbatas yang ukurannya sama dengan
+pool koneksi database, sehingga thread pekerja tidak pernah menunggu koneksi
+dan event loop tidak pernah terblokir oleh SQLite. Setiap pekerjaan mengembalikan
+koneksinya sebelum selesai; `iter_tugas` pun meminjam koneksi per chunk, bukan
+selama iterasi berlangsung. Semaphore membatasi jumlah
+operasi yang boleh antre bersamaan; operasi yang dibatalkan sebelum mulai
+tidak akan pernah menyentuh database.
+
+Contoh:
+    async with AsyncManajerTugas() as manajer:
+        total = await manajer.hitung_total_tugas()
+"""
+
+from __future__ import annotations
+import asyncio
+import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterable
+from model import Tugas, TugasBatch
+from manajer_tugas import ManajerTugas, HalamanTugas, RingkasanTugas, PerubahanTugas
+from konfigurasi import (UKURAN_CHUNK_BATCH, UKURAN_HALAMAN_DEFAULT, BATAS_HASIL_CARI, ARSIP_UMUR_HARI,
+                         PEMELIHARAAN_INTERVAL_JAM)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+class AsyncManajerTugas:
+    """Versi coroutine dari operasi `ManajerTugas` (tambah, update, hapus, query, hitung)."""
+
+    def __init__(self, manajer: ManajerTugas | None = None, jumlah_pekerja: int | None = None,
+                 batas_antrean: int | None = None, timeout: float | None = None):
+        """`jumlah_pekerja` default = ukuran pool koneksi. `batas_antrean` membatasi operasi
+        yang sedang berjalan + menunggu (default 4x jumlah pekerja). `timeout` (detik) berlaku
+        per operasi; operasi yang melewatinya dibatalkan dengan `asyncio.TimeoutError`."""
+        self.manajer = manajer or ManajerTugas()
+        self.jumlah_pekerja = jumlah_pekerja or self.manajer.db.pool.ukuran
+        self.batas_antrean = batas_antrean or self.jumlah_pekerja * 4
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=self.jumlah_pekerja, thread_name_prefix="manajer-tugas")
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _batas(self) -> asyncio.Semaphore:
+        # Dibuat saat pertama dipakai agar terikat ke event loop yang sedang berjalan
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.batas_antrean)
+        return self._semaphore
+
+    async def _jalankan(self, fungsi, *args, **kwargs):
+        """Jalankan fungsi blocking di thread pool. Pembatalan coroutine ini membatalkan
+        pekerjaan yang belum mulai; pekerjaan yang sudah berjalan diselesaikan di latar belakang."""
+        async with self._batas():
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, functools.partial(fungsi, *args, **kwargs))
+            if self.timeout is None:
+                return await future
+            return await asyncio.wait_for(future, self.timeout)
+
+    # ---- Operasi tulis ----
+    async def tambah_tugas(self, tugas: Tugas) -> bool:
+        return await self._jalankan(self.manajer.tambah_tugas, tugas)
+
+    async def tambah_tugas_batch(self, daftar: Iterable[Tugas | dict], ukuran_chunk: int = UKURAN_CHUNK_BATCH,
+                                 saat_gagal: Callable[[int, Tugas | dict, Exception], None] | None = None) -> int:
+        """`saat_gagal` dipanggil dari thread pekerja, bukan dari event loop."""
+        return await self._jalankan(self.manajer.tambah_tugas_batch, daftar, ukuran_chunk, saat_gagal)
+
+    async def update_tugas(self, tugas: Tugas) -> bool:
+        return await self._jalankan(self.manajer.update_tugas, tugas)
+
+    async def hapus_tugas(self, id_tugas: int) -> bool:
+        return await self._jalankan(self.manajer.hapus_tugas, id_tugas)
+
+    async def tandai_selesai(self, id_tugas: int) -> bool:
+        return await self._jalankan(self.manajer.tandai_selesai, id_tugas)
+
+    async def tandai_selesai_banyak(self, daftar_id: Iterable[int]) -> dict[int, bool]:
+        return await self._jalankan(self.manajer.tandai_selesai_banyak, list(daftar_id))
+
+    async def hapus_banyak(self, daftar_id: Iterable[int]) -> dict[int, bool]:
+        return await self._jalankan(self.manajer.hapus_banyak, list(daftar_id))
+
+    async def update_banyak(self, daftar_tugas: Iterable[Tugas]) -> dict[int, bool]:
+        return await self._jalankan(self.manajer.update_banyak, list(daftar_tugas))
+
+    async def ubah_status_dengan_filter(self, status_baru: str, filters: dict | None = None,
+                                        sebelum: datetime.date | None = None) -> list[int]:
+        return await self._jalankan(self.manajer.ubah_status_dengan_filter, status_baru, filters, sebelum)
+
+    # ---- Query ----
+    async def get_tugas(self, id_tugas: int, sertakan_arsip: bool = False) -> Tugas | None:
+        return await self._jalankan(self.manajer.get_tugas, id_tugas, sertakan_arsip)
+
+    async def get_tugas_many(self, daftar_id: Iterable[int]) -> dict[int, Tugas]:
+        return await self._jalankan(self.manajer.get_tugas_many, list(daftar_id))
+
+    async def get_semua_tugas_obj(self) -> list[Tugas]:
+        return await self._jalankan(self.manajer.get_semua_tugas_obj)
+
+    async def get_tugas_batch(self, filters: dict | None = None, ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> TugasBatch:
+        return await self._jalankan(self.manajer.get_tugas_batch, filters, ukuran_chunk)
+
+    async def get_dataframe_tugas(self, status_filter: str | None = None, prioritas_filter: str | None = None,
+                                  tanggal: datetime.date | None = None,
+                                  rentang: tuple[datetime.date | None, datetime.date | None] | None = None,
+                                  terlambat: bool = False, sertakan_arsip: bool = False) -> pd.DataFrame:
+        return await self._jalankan(self.manajer.get_dataframe_tugas, status_filter, prioritas_filter, tanggal,
+                                    rentang, terlambat, sertakan_arsip)
+
+    async def get_halaman_tugas(self, status_filter: str | None = None, prioritas_filter: str | None = None,
+                                setelah: tuple[str, int] | None = None, sebelum: tuple[str, int] | None = None,
+                                ukuran: int = UKURAN_HALAMAN_DEFAULT,
+                                rentang: tuple[datetime.date | None, datetime.date | None] | None = None,
+                                terlambat: bool = False) -> HalamanTugas:
+        return await self._jalankan(self.manajer.get_halaman_tugas, status_filter, prioritas_filter,
+                                    setelah=setelah, sebelum=sebelum, ukuran=ukuran, rentang=rentang,
+                                    terlambat=terlambat)
+
+    async def iter_tugas(self, filters: dict | None = None, ukuran_chunk: int = UKURAN_CHUNK_BATCH) -> AsyncIterator[Tugas]:
+        """Async generator `Tugas`. Satu chunk diambil per lompatan ke thread pool dengan keyset
+        pagination pada (hari, id); koneksi dipinjam per chunk dan tidak ditahan di antara `await`,
+        jadi banyak iterator bersamaan tidak menghabiskan pool."""
+        kunci = None
+        while True:
+            chunk, kunci = await self._jalankan(self.manajer.get_chunk_tugas, filters, kunci, ukuran_chunk)
+            for tugas in chunk:
+                yield tugas
+            if kunci is None:
+                break
+
+    async def seq_terakhir(self) -> int:
+        return await self._jalankan(self.manajer.seq_terakhir)
+
+    async def perubahan_sejak(self, seq: int, filters: dict | None = None) -> PerubahanTugas:
+        return await self._jalankan(self.manajer.perubahan_sejak, seq, filters)
+
+    async def berikutnya(self, n: int = 5, dari: datetime.date | None = None, prioritas_filter: str | None = None,
+                         termasuk_selesai: bool = False) -> pd.DataFrame:
+        return await self._jalankan(self.manajer.berikutnya, n, dari, prioritas_filter, termasuk_selesai)
+
+    async def cari(self, query: str, filters: dict | None = None, limit: int = BATAS_HASIL_CARI) -> pd.DataFrame:
+        return await self._jalankan(self.manajer.cari, query, filters, limit)
+
+    async def ringkasan(self, tanggal: datetime.date | None = None,
+                        rentang: tuple[datetime.date, datetime.date] | None = None,
+                        sertakan_arsip: bool = False) -> RingkasanTugas:
+        return await self._jalankan(self.manajer.ringkasan, tanggal, rentang, sertakan_arsip)
+
+    async def hitung_total_tugas(self, tanggal: datetime.date | None = None,
+                                 rentang: tuple[datetime.date | None, datetime.date | None] | None = None,
+                                 terlambat: bool = False, sertakan_arsip: bool = False) -> int:
+        return await self._jalankan(self.manajer.hitung_total_tugas, tanggal, rentang, terlambat, sertakan_arsip)
+
+    # ---- Arsip dan pemeliharaan ----
+    async def arsipkan_selesai(self, umur_hari: int = ARSIP_UMUR_HARI) -> int:
+        return await self._jalankan(self.manajer.arsipkan_selesai, umur_hari)
+
+    async def pemeliharaan_terjadwal(self, interval_jam: float = PEMELIHARAAN_INTERVAL_JAM,
+                                     umur_hari: int = ARSIP_UMUR_HARI) -> dict | None:
+        return await self._jalankan(self.manajer.pemeliharaan_terjadwal, interval_jam, umur_hari)
+
+    # ---- Siklus hidup ----
+    async def tutup(self) -> None:
+        """Tunggu pekerjaan yang sedang berjalan lalu matikan thread pool (pekerjaan antre dibatalkan)."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self._executor.shutdown, wait=True, cancel_futures=True))
+
+    async def __aenter__(self) -> "AsyncManajerTugas":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.tutup()
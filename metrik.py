@@ -0,0 +1,155 @@
+# metrik.py
+"""Registri metrik di dalam proses (counter, gauge, histogram) dengan ekspor format teks Prometheus.
+
+Contoh:
+    import metrik
+    metrik.registri.counter("todolist_query_total", "Jumlah query").tambah(operasi="SELECT")
+    print(metrik.registri.ekspor_prometheus())
+"""
+
+import threading
+from typing import Callable
+
+BATAS_DURASI_DETIK = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _kunci_label(label: dict) -> tuple:
+    return tuple(sorted(label.items()))
+
+def _escape(nilai) -> str:
+    return str(nilai).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_label(kunci: tuple) -> str:
+    if not kunci:
+        return ""
+    return "{" + ",".join(f'{nama}="{_escape(nilai)}"' for nama, nilai in kunci) + "}"
+
+def _format_angka(nilai: float) -> str:
+    return repr(float(nilai)) if not float(nilai).is_integer() else str(int(nilai))
+
+class Counter:
+    """Nilai yang hanya bertambah, dipisah per kombinasi label."""
+    jenis = "counter"
+
+    def __init__(self, nama: str, bantuan: str):
+        self.nama = nama
+        self.bantuan = bantuan
+        self._nilai: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def tambah(self, jumlah: float = 1, **label) -> None:
+        kunci = _kunci_label(label)
+        with self._lock:
+            self._nilai[kunci] = self._nilai.get(kunci, 0) + jumlah
+
+    def nilai(self, **label) -> float:
+        return self._nilai.get(_kunci_label(label), 0)
+
+    def sampel(self) -> list[tuple[str, tuple, float]]:
+        with self._lock:
+            return [(self.nama, kunci, nilai) for kunci, nilai in sorted(self._nilai.items())]
+
+class Gauge:
+    """Nilai sesaat. Bisa di-set langsung atau dibaca dari fungsi saat ekspor."""
+    jenis = "gauge"
+
+    def __init__(self, nama: str, bantuan: str, fungsi: Callable[[], float] | None = None):
+        self.nama = nama
+        self.bantuan = bantuan
+        self.fungsi = fungsi
+        self._nilai: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, nilai: float, **label) -> None:
+        with self._lock:
+            self._nilai[_kunci_label(label)] = nilai
+
+    def sampel(self) -> list[tuple[str, tuple, float]]:
+        if self.fungsi is not None:
+            return [(self.nama, (), self.fungsi())]
+        with self._lock:
+            return [(self.nama, kunci, nilai) for kunci, nilai in sorted(self._nilai.items())]
+
+class Histogram:
+    """Distribusi nilai dalam bucket kumulatif (le = batas atas), plus _sum dan _count."""
+    jenis = "histogram"
+
+    def __init__(self, nama: str, bantuan: str, batas: tuple[float, ...] = BATAS_DURASI_DETIK):
+        self.nama = nama
+        self.bantuan = bantuan
+        self.batas = tuple(sorted(batas))
+        self._data: dict[tuple, list] = {}  # kunci label -> [jumlah per bucket..., sum, count]
+        self._lock = threading.Lock()
+
+    def amati(self, nilai: float, **label) -> None:
+        kunci = _kunci_label(label)
+        with self._lock:
+            data = self._data.get(kunci)
+            if data is None:
+                data = self._data[kunci] = [0] * len(self.batas) + [0.0, 0]
+            for i, batas in enumerate(self.batas):
+                if nilai <= batas:
+                    data[i] += 1
+            data[-2] += nilai
+            data[-1] += 1
+
+    def ringkas(self, **label) -> tuple[int, float]:
+        """Return (count, sum) untuk satu kombinasi label."""
+        data = self._data.get(_kunci_label(label))
+        return (data[-1], data[-2]) if data else (0, 0.0)
+
+    def sampel(self) -> list[tuple[str, tuple, float]]:
+        hasil = []
+        with self._lock:
+            for kunci, data in sorted(self._data.items()):
+                for i, batas in enumerate(self.batas):
+                    hasil.append((f"{self.nama}_bucket", kunci + (("le", _format_angka(batas)),), data[i]))
+                hasil.append((f"{self.nama}_bucket", kunci + (("le", "+Inf"),), data[-1]))
+                hasil.append((f"{self.nama}_sum", kunci, data[-2]))
+                hasil.append((f"{self.nama}_count", kunci, data[-1]))
+        return hasil
+
+class RegistriMetrik:
+    """Kumpulan metrik bernama. Meminta metrik yang sama dua kali mengembalikan objek yang sama."""
+
+    def __init__(self):
+        self._metrik: dict[str, Counter | Gauge | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _ambil(self, kelas, nama: str, bantuan: str, **kwargs):
+        with self._lock:
+            metrik = self._metrik.get(nama)
+            if metrik is None:
+                metrik = self._metrik[nama] = kelas(nama, bantuan, **kwargs)
+            elif not isinstance(metrik, kelas):
+                raise ValueError(f"Metrik '{nama}' sudah terdaftar sebagai {metrik.jenis}.")
+            return metrik
+
+    def counter(self, nama: str, bantuan: str) -> Counter:
+        return self._ambil(Counter, nama, bantuan)
+
+    def gauge(self, nama: str, bantuan: str, fungsi: Callable[[], float] | None = None) -> Gauge:
+        return self._ambil(Gauge, nama, bantuan, fungsi=fungsi)
+
+    def histogram(self, nama: str, bantuan: str, batas: tuple[float, ...] = BATAS_DURASI_DETIK) -> Histogram:
+        return self._ambil(Histogram, nama, bantuan, batas=batas)
+
+    def cari(self, nama: str) -> Counter | Gauge | Histogram | None:
+        """Metrik yang sudah terdaftar dengan `nama`, atau None."""
+        return self._metrik.get(nama)
+
+    def semua(self) -> list:
+        with self._lock:
+            return list(self._metrik.values())
+
+    def ekspor_prometheus(self) -> str:
+        """Semua metrik dalam format teks eksposisi Prometheus (versi 0.0.4)."""
+        baris = []
+        for metrik in self.semua():
+            baris.append(f"# HELP {metrik.nama} {metrik.bantuan}")
+            baris.append(f"# TYPE {metrik.nama} {metrik.jenis}")
+            for nama, kunci, nilai in metrik.sampel():
+                baris.append(f"{nama}{_format_label(kunci)} {_format_angka(nilai)}")
+        return "\n".join(baris) + "\n"
+
+# Registri global untuk seluruh proses
+registri = RegistriMetrik()
@@ -0,0 +1,430 @@
+# migrasi.py
+"""Migrasi skema database bertingkat berdasarkan `PRAGMA user_version`.
+
+Setiap entri di `MIGRASI` punya nomor versi yang naik terus. Migrasi yang
+nomornya lebih besar dari versi database dijalankan berurutan, masing-masing
+dalam satu transaksi, lalu `user_version` di-set ke nomor tersebut."""
+
+import sqlite3
+from konfigurasi import DAFTAR_PRIORITAS, STATUS_TUGAS
+from pencatatan import get_logger
+
+_log = get_logger("migrasi")
+
+# Tabel kode status/prioritas (migrasi 9) beserta daftar nilai di konfigurasi
+TABEL_KODE = {"status_tugas": STATUS_TUGAS, "prioritas_tugas": DAFTAR_PRIORITAS}
+
+def _isi_kode(tabel: str, daftar: list[str]) -> str:
+    """INSERT nilai konfigurasi ke tabel kode. Kode = posisi di daftar (mulai 1), sehingga
+    urutan kode prioritas sama dengan peringkatnya (Urgent paling kecil)."""
+    nilai = ", ".join("({}, '{}')".format(i, nama.replace("'", "''")) for i, nama in enumerate(daftar, start=1))
+    return f"INSERT OR IGNORE INTO {tabel} (kode, nama) VALUES {nilai}"
+
+# Ekspresi SQL konversi antara deadline teks (YYYY-MM-DD) dan nomor hari sejak 1970-01-01
+def _ke_hari(kolom: str) -> str:
+    return f"CAST(strftime('%s', {kolom}) AS INTEGER) / 86400"
+
+def _ke_tanggal(kolom: str) -> str:
+    return f"date({kolom} * 86400, 'unixepoch')"
+
+def _kunci_rekap(baris: str) -> str:
+    """(tanggal, status, prioritas) teks untuk rekap_harian dari baris tugas_data berkode (NEW/OLD)."""
+    return (f"{_ke_tanggal(baris + '.hari')}, "
+            f"(SELECT nama FROM status_tugas WHERE kode = {baris}.kode_status), "
+            f"(SELECT nama FROM prioritas_tugas WHERE kode = {baris}.kode_prioritas)")
+
+MIGRASI = [
+    (1, "Buat tabel tugas", [
+        """
+        CREATE TABLE IF NOT EXISTS tugas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            matkul TEXT,
+            deskripsi TEXT NOT NULL,
+            deadline DATE NOT NULL,
+            prioritas TEXT NOT NULL,
+            status TEXT NOT NULL
+        )""",
+    ]),
+    (2, "Indeks filter status/prioritas/deadline", [
+        "CREATE INDEX IF NOT EXISTS idx_tugas_status_prioritas_deadline ON tugas (status, prioritas, deadline)",
+    ]),
+    (3, "Indeks urutan deadline/id", [
+        "CREATE INDEX IF NOT EXISTS idx_tugas_deadline_id ON tugas (deadline, id)",
+    ]),
+    (4, "Indeks status/deadline untuk paginasi per status", [
+        "CREATE INDEX IF NOT EXISTS idx_tugas_status_deadline ON tugas (status, deadline)",
+    ]),
+    (5, "Tabel rekap_harian yang dijaga trigger", [
+        """
+        CREATE TABLE IF NOT EXISTS rekap_harian (
+            tanggal TEXT NOT NULL,
+            status TEXT NOT NULL,
+            prioritas TEXT NOT NULL,
+            jumlah INTEGER NOT NULL,
+            PRIMARY KEY (tanggal, status, prioritas)
+        ) WITHOUT ROWID""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_rekap_harian_insert AFTER INSERT ON tugas
+        BEGIN
+            INSERT INTO rekap_harian (tanggal, status, prioritas, jumlah)
+            VALUES (NEW.deadline, NEW.status, NEW.prioritas, 1)
+            ON CONFLICT (tanggal, status, prioritas) DO UPDATE SET jumlah = jumlah + 1;
+        END""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_rekap_harian_delete AFTER DELETE ON tugas
+        BEGIN
+            UPDATE rekap_harian SET jumlah = jumlah - 1
+            WHERE tanggal = OLD.deadline AND status = OLD.status AND prioritas = OLD.prioritas;
+            DELETE FROM rekap_harian
+            WHERE tanggal = OLD.deadline AND status = OLD.status AND prioritas = OLD.prioritas AND jumlah <= 0;
+        END""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_rekap_harian_update AFTER UPDATE OF deadline, status, prioritas ON tugas
+        WHEN OLD.deadline IS NOT NEW.deadline OR OLD.status IS NOT NEW.status OR OLD.prioritas IS NOT NEW.prioritas
+        BEGIN
+            UPDATE rekap_harian SET jumlah = jumlah - 1
+            WHERE tanggal = OLD.deadline AND status = OLD.status AND prioritas = OLD.prioritas;
+            DELETE FROM rekap_harian
+            WHERE tanggal = OLD.deadline AND status = OLD.status AND prioritas = OLD.prioritas AND jumlah <= 0;
+            INSERT INTO rekap_harian (tanggal, status, prioritas, jumlah)
+            VALUES (NEW.deadline, NEW.status, NEW.prioritas, 1)
+            ON CONFLICT (tanggal, status, prioritas) DO UPDATE SET jumlah = jumlah + 1;
+        END""",
+        """
+        INSERT OR REPLACE INTO rekap_harian (tanggal, status, prioritas, jumlah)
+        SELECT deadline, status, prioritas, COUNT(*) FROM tugas GROUP BY deadline, status, prioritas""",
+    ]),
+    (6, "Indeks teks penuh FTS5 atas matkul dan deskripsi", [
+        # External content: teks tidak disimpan dua kali, indeks merujuk tugas.id lewat rowid
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS tugas_fts USING fts5(
+            matkul, deskripsi,
+            content='tugas', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tugas_fts_insert AFTER INSERT ON tugas
+        BEGIN
+            INSERT INTO tugas_fts (rowid, matkul, deskripsi) VALUES (NEW.id, NEW.matkul, NEW.deskripsi);
+        END""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tugas_fts_delete AFTER DELETE ON tugas
+        BEGIN
+            INSERT INTO tugas_fts (tugas_fts, rowid, matkul, deskripsi) VALUES ('delete', OLD.id, OLD.matkul, OLD.deskripsi);
+        END""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tugas_fts_update AFTER UPDATE OF matkul, deskripsi ON tugas
+        WHEN OLD.matkul IS NOT NEW.matkul OR OLD.deskripsi IS NOT NEW.deskripsi
+        BEGIN
+            INSERT INTO tugas_fts (tugas_fts, rowid, matkul, deskripsi) VALUES ('delete', OLD.id, OLD.matkul, OLD.deskripsi);
+            INSERT INTO tugas_fts (rowid, matkul, deskripsi) VALUES (NEW.id, NEW.matkul, NEW.deskripsi);
+        END""",
+        "INSERT INTO tugas_fts (tugas_fts) VALUES ('rebuild')",
+    ]),
+    (7, "Log perubahan tugas (change feed) yang diisi trigger", [
+        # AUTOINCREMENT: seq tidak pernah dipakai ulang walaupun entri lama sudah dikompaksi
+        """
+        CREATE TABLE IF NOT EXISTS tugas_perubahan (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            operasi TEXT NOT NULL,
+            id_tugas INTEGER NOT NULL,
+            waktu TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+        )""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tugas_perubahan_insert AFTER INSERT ON tugas
+        BEGIN
+            INSERT INTO tugas_perubahan (operasi, id_tugas) VALUES ('INSERT', NEW.id);
+        END""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tugas_perubahan_update AFTER UPDATE ON tugas
+        BEGIN
+            INSERT INTO tugas_perubahan (operasi, id_tugas) VALUES ('UPDATE', NEW.id);
+        END""",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tugas_perubahan_delete AFTER DELETE ON tugas
+        BEGIN
+            INSERT INTO tugas_perubahan (operasi, id_tugas) VALUES ('DELETE', OLD.id);
+        END""",
+    ]),
+    (8, "Tabel arsip tugas selesai dan tabel meta", [
+        # id sama dengan id asal di tabel tugas (AUTOINCREMENT di sana menjamin tidak dipakai ulang)
+        """
+        CREATE TABLE IF NOT EXISTS tugas_arsip (
+            id INTEGER PRIMARY KEY,
+            matkul TEXT,
+            deskripsi TEXT NOT NULL,
+            deadline DATE NOT NULL,
+            prioritas TEXT NOT NULL,
+            status TEXT NOT NULL,
+            diarsipkan TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_tugas_arsip_deadline_id ON tugas_arsip (deadline, id)",
+        """
+        CREATE TABLE IF NOT EXISTS meta (
+            kunci TEXT PRIMARY KEY,
+            nilai TEXT
+        ) WITHOUT ROWID""",
+    ]),
+    (9, "Status/prioritas berkode, deadline sebagai nomor hari, view kompatibilitas tugas", [
+        # Tabel kode: status dan prioritas disimpan sebagai integer kecil yang merujuk ke sini
+        "CREATE TABLE IF NOT EXISTS status_tugas (kode INTEGER PRIMARY KEY, nama TEXT NOT NULL UNIQUE)",
+        "CREATE TABLE IF NOT EXISTS prioritas_tugas (kode INTEGER PRIMARY KEY, nama TEXT NOT NULL UNIQUE)",
+        _isi_kode("status_tugas", STATUS_TUGAS),
+        _isi_kode("prioritas_tugas", DAFTAR_PRIORITAS),
+        # Nilai lama di luar konfigurasi tetap mendapat kode agar tidak ada baris yang hilang
+        "INSERT OR IGNORE INTO status_tugas (nama) SELECT status FROM tugas UNION SELECT status FROM tugas_arsip",
+        "INSERT OR IGNORE INTO prioritas_tugas (nama) SELECT prioritas FROM tugas UNION SELECT prioritas FROM tugas_arsip",
+        # Deadline lama yang tidak bisa diurai (strftime = NULL) tidak muat di kolom hari NOT NULL:
+        # barisnya dipindah utuh ke tugas_karantina agar migrasi tetap jalan dan data bisa diperbaiki manual
+        """
+        CREATE TABLE IF NOT EXISTS tugas_karantina (
+            id INTEGER PRIMARY KEY,
+            asal TEXT NOT NULL,
+            matkul TEXT,
+            deskripsi TEXT,
+            deadline TEXT,
+            prioritas TEXT,
+            status TEXT,
+            diarsipkan TEXT,
+            dikarantina TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+        )""",
+        f"""
+        INSERT INTO tugas_karantina (id, asal, matkul, deskripsi, deadline, prioritas, status)
+        SELECT id, 'tugas', matkul, deskripsi, deadline, prioritas, status FROM tugas
+        WHERE {_ke_hari("deadline")} IS NULL""",
+        f"""
+        INSERT INTO tugas_karantina (id, asal, matkul, deskripsi, deadline, prioritas, status, diarsipkan)
+        SELECT id, 'tugas_arsip', matkul, deskripsi, deadline, prioritas, status, diarsipkan FROM tugas_arsip
+        WHERE {_ke_hari("deadline")} IS NULL""",
+        # Kode tidak dikenal menjadi NULL sehingga ditolak NOT NULL saat ditulis
+        """
+        CREATE TABLE tugas_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            matkul TEXT,
+            deskripsi TEXT NOT NULL,
+            hari INTEGER NOT NULL,
+            kode_prioritas INTEGER NOT NULL REFERENCES prioritas_tugas (kode),
+            kode_status INTEGER NOT NULL REFERENCES status_tugas (kode)
+        )""",
+        f"""
+        INSERT INTO tugas_data (id, matkul, deskripsi, hari, kode_prioritas, kode_status)
+        SELECT t.id, t.matkul, t.deskripsi, {_ke_hari("t.deadline")}, p.kode, s.kode
+        FROM tugas t
+        JOIN prioritas_tugas p ON p.nama = t.prioritas
+        JOIN status_tugas s ON s.nama = t.status
+        WHERE {_ke_hari("t.deadline")} IS NOT NULL""",
+        # Bawa seq AUTOINCREMENT agar ID yang pernah dipakai (termasuk yang diarsipkan) tidak dipakai ulang
+        "DELETE FROM sqlite_sequence WHERE name = 'tugas_data'",
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'tugas_data', seq FROM sqlite_sequence WHERE name = 'tugas'",
+        """
+        CREATE TABLE tugas_arsip_data (
+            id INTEGER PRIMARY KEY,
+            matkul TEXT,
+            deskripsi TEXT NOT NULL,
+            hari INTEGER NOT NULL,
+            kode_prioritas INTEGER NOT NULL REFERENCES prioritas_tugas (kode),
+            kode_status INTEGER NOT NULL REFERENCES status_tugas (kode),
+            diarsipkan TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+        )""",
+        f"""
+        INSERT INTO tugas_arsip_data (id, matkul, deskripsi, hari, kode_prioritas, kode_status, diarsipkan)
+        SELECT a.id, a.matkul, a.deskripsi, {_ke_hari("a.deadline")}, p.kode, s.kode, a.diarsipkan
+        FROM tugas_arsip a
+        JOIN prioritas_tugas p ON p.nama = a.prioritas
+        JOIN status_tugas s ON s.nama = a.status
+        WHERE {_ke_hari("a.deadline")} IS NOT NULL""",
+        # Tabel lama beserta indeks dan triggernya dibuang; FTS dibuat ulang di atas tugas_data
+        "DROP TABLE tugas_fts",
+        "DROP TABLE tugas",
+        "DROP TABLE tugas_arsip",
+        # Rekap disusun ulang dari tugas_data: tanpa baris karantina, dan dengan tanggal yang sudah dinormalkan
+        # seperti kunci yang dipakai trigger di bawah
+        "DELETE FROM rekap_harian",
+        f"""
+        INSERT INTO rekap_harian (tanggal, status, prioritas, jumlah)
+        SELECT {_ke_tanggal("t.hari")}, s.nama, p.nama, COUNT(*)
+        FROM tugas_data t
+        JOIN prioritas_tugas p ON p.kode = t.kode_prioritas
+        JOIN status_tugas s ON s.kode = t.kode_status
+        GROUP BY t.hari, t.kode_status, t.kode_prioritas""",
+        "CREATE INDEX idx_tugas_data_status_prioritas_hari ON tugas_data (kode_status, kode_prioritas, hari)",
+        "CREATE INDEX idx_tugas_data_hari_id ON tugas_data (hari, id)",
+        "CREATE INDEX idx_tugas_data_status_hari ON tugas_data (kode_status, hari)",
+        # Urutan (hari, peringkat prioritas, id) untuk "berikutnya": berhenti setelah LIMIT tanpa sort per hari
+        "CREATE INDEX idx_tugas_data_hari_prioritas ON tugas_data (hari, kode_prioritas)",
+        "CREATE INDEX idx_tugas_arsip_data_hari_id ON tugas_arsip_data (hari, id)",
+        # View kompatibilitas dengan nama kolom lama, plus kolom berkode untuk filter yang memakai indeks.
+        # Join ke tabel kode diratakan (flattened) oleh SQLite sehingga filter pada view tetap memakai indeks tugas_data.
+        f"""
+        CREATE VIEW tugas AS
+        SELECT t.id, t.matkul, t.deskripsi, {_ke_tanggal("t.hari")} AS deadline,
+               p.nama AS prioritas, s.nama AS status, t.hari, t.kode_prioritas, t.kode_status
+        FROM tugas_data t
+        JOIN prioritas_tugas p ON p.kode = t.kode_prioritas
+        JOIN status_tugas s ON s.kode = t.kode_status""",
+        f"""
+        CREATE VIEW tugas_arsip AS
+        SELECT a.id, a.matkul, a.deskripsi, {_ke_tanggal("a.hari")} AS deadline,
+               p.nama AS prioritas, s.nama AS status, a.diarsipkan, a.hari, a.kode_prioritas, a.kode_status
+        FROM tugas_arsip_data a
+        JOIN prioritas_tugas p ON p.kode = a.kode_prioritas
+        JOIN status_tugas s ON s.kode = a.kode_status""",
+        # Penulis lama yang masih menulis ke `tugas` diteruskan ke tugas_data. Aplikasi sendiri menulis
+        # langsung ke tugas_data karena rowcount/lastrowid tidak terisi untuk tulisan lewat view.
+        f"""
+        CREATE TRIGGER trg_tugas_view_insert INSTEAD OF INSERT ON tugas
+        BEGIN
+            INSERT INTO tugas_data (id, matkul, deskripsi, hari, kode_prioritas, kode_status)
+            VALUES (NEW.id, NEW.matkul, NEW.deskripsi, {_ke_hari("NEW.deadline")},
+                    (SELECT kode FROM prioritas_tugas WHERE nama = NEW.prioritas),
+                    (SELECT kode FROM status_tugas WHERE nama = NEW.status));
+        END""",
+        f"""
+        CREATE TRIGGER trg_tugas_view_update INSTEAD OF UPDATE ON tugas
+        BEGIN
+            UPDATE tugas_data
+            SET matkul = NEW.matkul, deskripsi = NEW.deskripsi, hari = {_ke_hari("NEW.deadline")},
+                kode_prioritas = (SELECT kode FROM prioritas_tugas WHERE nama = NEW.prioritas),
+                kode_status = (SELECT kode FROM status_tugas WHERE nama = NEW.status)
+            WHERE id = OLD.id;
+        END""",
+        """
+        CREATE TRIGGER trg_tugas_view_delete INSTEAD OF DELETE ON tugas
+        BEGIN
+            DELETE FROM tugas_data WHERE id = OLD.id;
+        END""",
+        # Trigger rekap_harian (tetap berkunci teks), FTS dan log perubahan dipasang ulang di tugas_data
+        f"""
+        CREATE TRIGGER trg_rekap_harian_insert AFTER INSERT ON tugas_data
+        BEGIN
+            INSERT INTO rekap_harian (tanggal, status, prioritas, jumlah)
+            VALUES ({_kunci_rekap("NEW")}, 1)
+            ON CONFLICT (tanggal, status, prioritas) DO UPDATE SET jumlah = jumlah + 1;
+        END""",
+        f"""
+        CREATE TRIGGER trg_rekap_harian_delete AFTER DELETE ON tugas_data
+        BEGIN
+            UPDATE rekap_harian SET jumlah = jumlah - 1
+            WHERE (tanggal, status, prioritas) = ({_kunci_rekap("OLD")});
+            DELETE FROM rekap_harian
+            WHERE (tanggal, status, prioritas) = ({_kunci_rekap("OLD")}) AND jumlah <= 0;
+        END""",
+        f"""
+        CREATE TRIGGER trg_rekap_harian_update AFTER UPDATE OF hari, kode_status, kode_prioritas ON tugas_data
+        WHEN OLD.hari IS NOT NEW.hari OR OLD.kode_status IS NOT NEW.kode_status OR OLD.kode_prioritas IS NOT NEW.kode_prioritas
+        BEGIN
+            UPDATE rekap_harian SET jumlah = jumlah - 1
+            WHERE (tanggal, status, prioritas) = ({_kunci_rekap("OLD")});
+            DELETE FROM rekap_harian
+            WHERE (tanggal, status, prioritas) = ({_kunci_rekap("OLD")}) AND jumlah <= 0;
+            INSERT INTO rekap_harian (tanggal, status, prioritas, jumlah)
+            VALUES ({_kunci_rekap("NEW")}, 1)
+            ON CONFLICT (tanggal, status, prioritas) DO UPDATE SET jumlah = jumlah + 1;
+        END""",
+        """
+        CREATE VIRTUAL TABLE tugas_fts USING fts5(
+            matkul, deskripsi,
+            content='tugas_data', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )""",
+        """
+        CREATE TRIGGER trg_tugas_fts_insert AFTER INSERT ON tugas_data
+        BEGIN
+            INSERT INTO tugas_fts (rowid, matkul, deskripsi) VALUES (NEW.id, NEW.matkul, NEW.deskripsi);
+        END""",
+        """
+        CREATE TRIGGER trg_tugas_fts_delete AFTER DELETE ON tugas_data
+        BEGIN
+            INSERT INTO tugas_fts (tugas_fts, rowid, matkul, deskripsi) VALUES ('delete', OLD.id, OLD.matkul, OLD.deskripsi);
+        END""",
+        """
+        CREATE TRIGGER trg_tugas_fts_update AFTER UPDATE OF matkul, deskripsi ON tugas_data
+        WHEN OLD.matkul IS NOT NEW.matkul OR OLD.deskripsi IS NOT NEW.deskripsi
+        BEGIN
+            INSERT INTO tugas_fts (tugas_fts, rowid, matkul, deskripsi) VALUES ('delete', OLD.id, OLD.matkul, OLD.deskripsi);
+            INSERT INTO tugas_fts (rowid, matkul, deskripsi) VALUES (NEW.id, NEW.matkul, NEW.deskripsi);
+        END""",
+        "INSERT INTO tugas_fts (tugas_fts) VALUES ('rebuild')",
+        # Tanpa optimize, segmen hasil rebuild ikut di-automerge oleh setiap tulisan kecil (WAL dua kali lebih besar)
+        "INSERT INTO tugas_fts (tugas_fts) VALUES ('optimize')",
+        """
+        CREATE TRIGGER trg_tugas_perubahan_insert AFTER INSERT ON tugas_data
+        BEGIN
+            INSERT INTO tugas_perubahan (operasi, id_tugas) VALUES ('INSERT', NEW.id);
+        END""",
+        """
+        CREATE TRIGGER trg_tugas_perubahan_update AFTER UPDATE ON tugas_data
+        BEGIN
+            INSERT INTO tugas_perubahan (operasi, id_tugas) VALUES ('UPDATE', NEW.id);
+        END""",
+        """
+        CREATE TRIGGER trg_tugas_perubahan_delete AFTER DELETE ON tugas_data
+        BEGIN
+            INSERT INTO tugas_perubahan (operasi, id_tugas) VALUES ('DELETE', OLD.id);
+        END""",
+    ]),
+    (10, "Kolom urutan pada tabel kode status/prioritas", [
+        # Kode tidak pernah berubah (dirujuk tugas_data); urutan tampilan/peringkat diisi ulang oleh sinkronkan_kode
+        "ALTER TABLE status_tugas ADD COLUMN urutan INTEGER",
+        "ALTER TABLE prioritas_tugas ADD COLUMN urutan INTEGER",
+        "UPDATE status_tugas SET urutan = kode",
+        "UPDATE prioritas_tugas SET urutan = kode",
+    ]),
+]
+
+VERSI_TERBARU = MIGRASI[-1][0]
+
+def versi_skema(conn: sqlite3.Connection) -> int:
+    """Baca versi skema yang tersimpan di header file database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def jalankan_migrasi(conn: sqlite3.Connection) -> int:
+    """Terapkan semua migrasi yang belum dijalankan. Return versi skema akhir."""
+    for versi, keterangan, langkah in MIGRASI:
+        if versi <= versi_skema(conn):
+            continue
+        conn.execute("BEGIN IMMEDIATE")  # Kunci tulis agar dua proses tidak migrasi bersamaan
+        try:
+            # Cek ulang setelah dapat kunci: proses lain mungkin sudah menjalankannya
+            if versi <= versi_skema(conn):
+                conn.rollback()
+                continue
+            _log.info("Menjalankan migrasi", extra={"kv": {"versi": versi, "keterangan": keterangan}})
+            for sql in langkah:
+                conn.execute(sql)
+            conn.execute(f"PRAGMA user_version = {int(versi)}")
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+    return versi_skema(conn)
+
+def sinkronkan_kode(conn: sqlite3.Connection) -> int:
+    """Selaraskan tabel kode dengan konfigurasi; dipanggil setiap start. Nilai status/prioritas baru
+    mendapat kode berikutnya (kode lama tidak diubah), tanpa ini tulisan dengan nilai baru ditolak.
+    Kolom `urutan` diisi ulang dari posisi di daftar sehingga perubahan urutan `DAFTAR_PRIORITAS`
+    langsung berlaku; nilai yang sudah tidak ada di konfigurasi diurutkan paling belakang.
+    Return jumlah kode baru."""
+    kurang = [(tabel, nama) for tabel, daftar in TABEL_KODE.items() for nama in daftar
+              if conn.execute(f"SELECT 1 FROM {tabel} WHERE nama = ?", (nama,)).fetchone() is None]
+    if kurang:
+        with conn:
+            for tabel, nama in kurang:
+                conn.execute(f"INSERT OR IGNORE INTO {tabel} (nama) VALUES (?)", (nama,))
+        _log.info("Kode status/prioritas baru ditambahkan", extra={"kv": {"nilai": [nama for _, nama in kurang]}})
+
+    ubah = []
+    for tabel, daftar in TABEL_KODE.items():
+        posisi = {nama: i for i, nama in enumerate(daftar, start=1)}
+        for kode, nama, urutan in conn.execute(f"SELECT kode, nama, urutan FROM {tabel}").fetchall():
+            target = posisi.get(nama, len(daftar) + kode)
+            if urutan != target:
+                ubah.append((tabel, target, kode))
+    if ubah:
+        with conn:
+            for tabel, urutan, kode in ubah:
+                conn.execute(f"UPDATE {tabel} SET urutan = ? WHERE kode = ?", (urutan, kode))
+        _log.info("Urutan status/prioritas diperbarui", extra={"kv": {"jumlah": len(ubah)}})
+    return len(kurang)
@@ -1,8 +1,24 @@
 # model.py
 import datetime
+from array import array
+from typing import Iterable, Iterator
+from konfigurasi import DAFTAR_PRIORITAS, STATUS_TUGAS, DATAFRAME_PYARROW
+from pencatatan import get_logger
+
+_log = get_logger("model")
+
+# Referensi lokal untuk jalur hidrasi cepat (menghindari lookup atribut per baris)
+_object_new = object.__new__
+_date = datetime.date
+_HARI_EPOCH = _date(1970, 1, 1).toordinal()
+
+def nomor_hari(tanggal: datetime.date) -> int:
+    """Nomor hari sejak 1970-01-01; bentuk penyimpanan deadline di kolom `hari` (migrasi 9)."""
+    return tanggal.toordinal() - _HARI_EPOCH
 
 class Tugas:
     """Merepresentasikan satu entitas tugas (To-Do Item)."""
+    __slots__ = ("id", "matkul", "deskripsi", "deadline", "prioritas", "status")  # Tanpa __dict__ per objek
 
     def __init__(self, matkul: str, deskripsi: str, deadline: datetime.date | str,
                  prioritas: str, status: str, id_tugas: int | None = None):
@@ -20,10 +36,27 @@ class Tugas:
                 self.deadline = datetime.datetime.strptime(deadline, "%Y-%m-%d").date()
             except ValueError:
                 self.deadline = datetime.date.today()
-                print(f"Peringatan: Format tanggal '{deadline}' salah, gunakan YYYY-MM-DD.")
+                _log.warning("Format tanggal salah, gunakan YYYY-MM-DD", extra={"kv": {"deadline": deadline}})
         else:
             self.deadline = datetime.date.today()
-            print("Peringatan: Tipe data deadline tidak valid, default hari ini digunakan.")
+            _log.warning("Tipe data deadline tidak valid, default hari ini digunakan",
+                         extra={"kv": {"tipe": type(deadline).__name__}})
+
+    @classmethod
+    def dari_db(cls, id_tugas: int, matkul: str, deskripsi: str, deadline: datetime.date | str,
+                prioritas: str, status: str) -> "Tugas":
+        """Konstruktor cepat untuk baris yang sudah tersimpan di database (data dipercaya).
+        Melewati strip/default dan validasi; deadline teks cukup di-parse dengan `fromisoformat`."""
+        tugas = _object_new(cls)
+        tugas.id = id_tugas
+        tugas.matkul = matkul
+        tugas.deskripsi = deskripsi
+        if deadline.__class__ is not _date and not isinstance(deadline, _date):
+            deadline = _date.fromisoformat(deadline)
+        tugas.deadline = deadline
+        tugas.prioritas = prioritas
+        tugas.status = status
+        return tugas
 
     def __repr__(self) -> str:
         return f"Tugas(ID:{self.id}, Matkul:'{self.matkul}', '{self.deskripsi}', Deadline:{self.deadline}, Prioritas:{self.prioritas}, Status:{self.status})"
@@ -36,3 +69,108 @@ class Tugas:
             "prioritas": self.prioritas,
             "status": self.status
         }
+
+class TugasBatch:
+    """Kumpulan tugas dalam bentuk kolom (columnar) untuk pekerjaan massal.
+
+    ID disimpan di `array('q')`, deadline sebagai nomor hari (`date.toordinal()`)
+    di `array('i')`, status dan prioritas sebagai kode kecil di `array('h')`
+    yang merujuk ke `kode_status`/`kode_prioritas`. Objek `Tugas` hanya dibuat
+    saat satu baris benar-benar diakses."""
+    __slots__ = ("id", "matkul", "deskripsi", "deadline", "kode_status", "kode_prioritas",
+                 "status", "prioritas", "_indeks_status", "_indeks_prioritas")
+
+    def __init__(self):
+        self.id = array("q")
+        self.matkul: list[str] = []
+        self.deskripsi: list[str] = []
+        self.deadline = array("i")
+        self.status = array("h")
+        self.prioritas = array("h")
+        # Kamus kode dimulai dari urutan di konfigurasi; nilai lain ditambahkan saat ditemukan
+        self.kode_status = list(STATUS_TUGAS)
+        self.kode_prioritas = list(DAFTAR_PRIORITAS)
+        self._indeks_status = {nilai: i for i, nilai in enumerate(self.kode_status)}
+        self._indeks_prioritas = {nilai: i for i, nilai in enumerate(self.kode_prioritas)}
+
+    @staticmethod
+    def _kode(nilai: str, kamus: list[str], indeks: dict[str, int]) -> int:
+        kode = indeks.get(nilai)
+        if kode is None:
+            kode = indeks[nilai] = len(kamus)
+            kamus.append(nilai)
+        return kode
+
+    def tambah(self, id_tugas: int, matkul: str, deskripsi: str, deadline: datetime.date | str,
+               prioritas: str, status: str) -> None:
+        """Tambahkan satu baris (urutan argumen sama dengan kolom SELECT tabel tugas)."""
+        if not isinstance(deadline, datetime.date):
+            deadline = datetime.date.fromisoformat(deadline)
+        self.id.append(id_tugas)
+        self.matkul.append(matkul)
+        self.deskripsi.append(deskripsi)
+        self.deadline.append(deadline.toordinal())
+        self.prioritas.append(self._kode(prioritas, self.kode_prioritas, self._indeks_prioritas))
+        self.status.append(self._kode(status, self.kode_status, self._indeks_status))
+
+    @classmethod
+    def dari_rows(cls, rows: Iterable) -> "TugasBatch":
+        """Bangun batch dari baris (id, matkul, deskripsi, deadline, prioritas, status)."""
+        batch = cls()
+        for row in rows:
+            batch.tambah(*row)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __getitem__(self, i: int) -> Tugas:
+        return Tugas.dari_db(
+            self.id[i], self.matkul[i], self.deskripsi[i],
+            datetime.date.fromordinal(self.deadline[i]),
+            self.kode_prioritas[self.prioritas[i]], self.kode_status[self.status[i]]
+        )
+
+    def __iter__(self) -> Iterator[Tugas]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"TugasBatch({len(self)} tugas)"
+
+def _kategori(seri, daftar: list[str]):
+    """Categorical dengan urutan kategori dari konfigurasi; nilai lain ditambahkan di belakang agar tidak hilang."""
+    import pandas as pd
+    lain = sorted(set(seri.dropna().unique()) - set(daftar))
+    return pd.Categorical(seri, categories=daftar + lain)
+
+def tipekan_dataframe(df, pyarrow: bool = DATAFRAME_PYARROW):
+    """Ubah kolom tugas hasil query menjadi dtype ringkas (di tempat, lalu return `df`):
+    `id` int64, `deadline` datetime64, `status` dan `prioritas` kategori dengan urutan dari konfigurasi.
+    Dengan `pyarrow=True`, id, deadline dan kolom teks memakai dtype pyarrow. Kolom lain tidak diubah."""
+    import pandas as pd
+    if "id" in df:
+        df["id"] = df["id"].astype("int64[pyarrow]" if pyarrow else "int64")
+    if "deadline" in df:
+        df["deadline"] = pd.to_datetime(df["deadline"], errors="coerce")
+        if pyarrow:
+            df["deadline"] = df["deadline"].astype("date32[pyarrow]")
+    if "status" in df:
+        df["status"] = _kategori(df["status"], STATUS_TUGAS)
+    if "prioritas" in df:
+        df["prioritas"] = _kategori(df["prioritas"], DAFTAR_PRIORITAS)
+    if pyarrow:
+        for kolom in ("matkul", "deskripsi"):
+            if kolom in df:
+                df[kolom] = df[kolom].astype("string[pyarrow]")
+    return df
+
+def format_tanggal_kolom(seri, format: str = "%d-%m-%Y"):
+    """Format satu kolom tanggal menjadi teks secara vektor. Setiap tanggal unik diformat sekali lalu
+    disebar lewat kode `factorize`; daftar tugas hanya punya ratusan tanggal unik. Nilai kosong menjadi None."""
+    import numpy as np
+    import pandas as pd
+    kode, unik = pd.factorize(seri)
+    teks = pd.to_datetime(pd.Series(unik), errors="coerce").dt.strftime(format).to_numpy(dtype=object, na_value=None)
+    teks = np.append(teks, None)  # Kode -1 (NaT/None) menunjuk elemen terakhir ini
+    return pd.Series(teks[kode], index=seri.index, name=seri.name, dtype=object)
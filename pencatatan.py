@@ -0,0 +1,71 @@
+# pencatatan.py
+"""Logging terstruktur (format key=value / logfmt) untuk seluruh modul aplikasi.
+
+Semua logger berada di bawah logger akar "todolist", sehingga level-nya bisa
+diatur sekaligus lewat `atur_level()` atau variabel lingkungan TODOLIST_LOG_LEVEL.
+
+Contoh:
+    from pencatatan import get_logger
+    log = get_logger("database")
+    log.warning("Query lambat", extra={"kv": {"durasi_ms": 250.3, "operasi": "SELECT"}})
+    # 2025-05-15T10:00:00 level=WARNING logger=todolist.database pesan="Query lambat" durasi_ms=250.3 operasi=SELECT
+"""
+
+import logging
+import threading
+from konfigurasi import LOG_LEVEL
+
+NAMA_AKAR = "todolist"
+DAFTAR_LEVEL = ["DEBUG", "INFO", "WARNING", "ERROR"]
+
+_siap = False
+_siap_lock = threading.Lock()
+
+def _nilai_logfmt(nilai) -> str:
+    teks = str(nilai)
+    if teks == "" or any(c in teks for c in ' ="\n'):
+        return '"' + teks.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+    return teks
+
+class FormatKunciNilai(logging.Formatter):
+    """Formatter baris tunggal: waktu, level, logger, pesan, lalu isi `extra={"kv": {...}}`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        bagian = [
+            self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            f"level={record.levelname}",
+            f"logger={record.name}",
+            f"pesan={_nilai_logfmt(record.getMessage())}",
+        ]
+        for kunci, nilai in (getattr(record, "kv", None) or {}).items():
+            bagian.append(f"{kunci}={_nilai_logfmt(nilai)}")
+        if record.exc_info:
+            bagian.append(f"exc={_nilai_logfmt(self.formatException(record.exc_info))}")
+        return " ".join(bagian)
+
+def _siapkan() -> None:
+    global _siap
+    with _siap_lock:
+        if _siap:
+            return
+        akar = logging.getLogger(NAMA_AKAR)
+        handler = logging.StreamHandler()
+        handler.setFormatter(FormatKunciNilai())
+        akar.addHandler(handler)
+        akar.propagate = False  # Hindari baris ganda jika root logger juga punya handler
+        akar.setLevel(LOG_LEVEL.upper())
+        _siap = True
+
+def get_logger(nama: str) -> logging.Logger:
+    """Logger "todolist.<nama>" yang sudah memakai formatter key=value."""
+    _siapkan()
+    return logging.getLogger(f"{NAMA_AKAR}.{nama}")
+
+def atur_level(level: str | int) -> None:
+    """Ubah level semua logger aplikasi saat runtime (misalnya dari halaman diagnostik)."""
+    _siapkan()
+    logging.getLogger(NAMA_AKAR).setLevel(level.upper() if isinstance(level, str) else level)
+
+def level_aktif() -> str:
+    _siapkan()
+    return logging.getLevelName(logging.getLogger(NAMA_AKAR).level)
@@ -0,0 +1,107 @@
+# profil_startup.py
+"""Profil cold start aplikasi: rincian waktu import dan inisialisasi di proses baru.
+
+Setiap pengukuran dijalankan di interpreter Python yang baru (tanpa modul yang
+sudah ter-cache di memori) dengan `-X importtime`, lalu dilaporkan per tahap
+dan per paket teratas. Exit code 1 jika total melewati target.
+
+    python profil_startup.py                  # target dari konfigurasi.TARGET_STARTUP_MS
+    python profil_startup.py --target-ms 800 --ulang 5 --teratas 15
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from konfigurasi import TARGET_STARTUP_MS
+
+# Dijalankan di proses anak. Urutannya meniru `streamlit run main_app.py` sampai sebelum render halaman.
+_SKRIP_ANAK = r"""
+import json, sys, time
+tahap = {}
+t = time.perf_counter()
+import streamlit
+tahap["import streamlit"] = time.perf_counter() - t
+t = time.perf_counter()
+import konfigurasi, model, database, manajer_tugas
+tahap["import modul aplikasi"] = time.perf_counter() - t
+t = time.perf_counter()
+manajer_tugas.ManajerTugas()
+tahap["inisialisasi ManajerTugas"] = time.perf_counter() - t
+t = time.perf_counter()
+import main_app
+tahap["import main_app"] = time.perf_counter() - t
+tahap["pandas dimuat"] = "pandas" in sys.modules
+tahap["matplotlib dimuat"] = "matplotlib" in sys.modules
+print("HASIL " + json.dumps(tahap))
+"""
+
+_POLA_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+def ukur_sekali(folder: str) -> tuple[dict, dict[str, float]]:
+    """Jalankan satu cold start. Return (waktu per tahap, waktu import kumulatif per paket teratas dalam detik)."""
+    lingkungan = dict(os.environ, PYTHONPATH=folder + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proses = subprocess.run([sys.executable, "-X", "importtime", "-c", _SKRIP_ANAK], cwd=folder,
+                            env=lingkungan, capture_output=True, text=True)
+    baris_hasil = [b for b in proses.stdout.splitlines() if b.startswith("HASIL ")]
+    if proses.returncode != 0 or not baris_hasil:
+        raise RuntimeError(f"Proses profil gagal:\n{proses.stderr[-2000:]}")
+    tahap = json.loads(baris_hasil[-1][len("HASIL "):])
+
+    per_paket: dict[str, float] = {}
+    for baris in proses.stderr.splitlines():
+        cocok = _POLA_IMPORTTIME.match(baris)
+        if cocok and not cocok.group(3):  # Hanya import level teratas (tanpa indentasi)
+            paket = cocok.group(4).split(".")[0]
+            per_paket[paket] = per_paket.get(paket, 0.0) + int(cocok.group(2)) / 1e6
+    return tahap, per_paket
+
+def profil(folder: str, ulang: int = 3) -> dict:
+    """Ulangi cold start `ulang` kali dan ambil median setiap angka."""
+    semua_tahap, semua_paket = [], []
+    for _ in range(ulang):
+        tahap, per_paket = ukur_sekali(folder)
+        semua_tahap.append(tahap)
+        semua_paket.append(per_paket)
+
+    median_tahap = {}
+    for nama, nilai in semua_tahap[0].items():
+        if isinstance(nilai, bool):
+            median_tahap[nama] = nilai
+        else:
+            median_tahap[nama] = statistics.median(t[nama] for t in semua_tahap)
+    nama_paket = set().union(*semua_paket)
+    median_paket = {p: statistics.median(x.get(p, 0.0) for x in semua_paket) for p in nama_paket}
+    total = sum(v for v in median_tahap.values() if not isinstance(v, bool))
+    return {"tahap": median_tahap, "paket": median_paket, "total": total}
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profil waktu cold start aplikasi To-Do List.")
+    parser.add_argument("--target-ms", type=float, default=TARGET_STARTUP_MS, help="Batas total waktu startup")
+    parser.add_argument("--ulang", type=int, default=3, help="Jumlah cold start (diambil median)")
+    parser.add_argument("--teratas", type=int, default=10, help="Jumlah paket terlambat yang ditampilkan")
+    parser.add_argument("--json", action="store_true", help="Cetak hasil sebagai JSON")
+    args = parser.parse_args()
+
+    hasil = profil(os.path.dirname(os.path.abspath(__file__)), args.ulang)
+    if args.json:
+        print(json.dumps(hasil, indent=2))
+    else:
+        print("Tahap startup (median):")
+        for nama, nilai in hasil["tahap"].items():
+            print(f"  {nama:<28} {nilai}" if isinstance(nilai, bool) else f"  {nama:<28} {nilai * 1000:>9.1f} ms")
+        print(f"\nImport per paket teratas (kumulatif, {args.teratas} terlambat):")
+        for paket, detik in sorted(hasil["paket"].items(), key=lambda x: -x[1])[:args.teratas]:
+            print(f"  {paket:<28} {detik * 1000:>9.1f} ms")
+        print(f"\nTotal: {hasil['total'] * 1000:.1f} ms (target {args.target_ms:.0f} ms)")
+
+    if hasil["total"] * 1000 > args.target_ms:
+        print("Startup melewati target!", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# rekap_harian.py
+"""Perawatan tabel `rekap_harian`: jumlah tugas per (tanggal deadline, status, prioritas).
+
+Tabel ini dijaga otomatis oleh trigger pada tabel `tugas_data` (lihat migrasi 5 dan 9),
+sehingga total dan ringkasan cukup membaca beberapa baris per hari. Modul ini
+menyediakan pemeriksaan dan pembangunan ulang jika isinya sempat melenceng
+(misalnya karena file database pernah diubah dengan alat lain).
+
+Contoh:
+    python rekap_harian.py --verifikasi
+    python rekap_harian.py --bangun-ulang
+"""
+
+import argparse
+import sqlite3
+import database
+
+# Dikelompokkan per kolom berkode lalu nama dibaca dari view (tanggal, status, prioritas tetap teks)
+_SQL_HITUNG_LANGSUNG = """
+SELECT deadline AS tanggal, status, prioritas, COUNT(*) AS jumlah
+FROM tugas GROUP BY hari, kode_status, kode_prioritas
+"""
+
+def bangun_ulang(conn: sqlite3.Connection) -> int:
+    """Isi ulang `rekap_harian` dari tabel `tugas` dalam satu transaksi. Return jumlah baris rekap."""
+    with conn:
+        conn.execute("DELETE FROM rekap_harian")
+        conn.execute(f"INSERT INTO rekap_harian (tanggal, status, prioritas, jumlah) {_SQL_HITUNG_LANGSUNG}")
+    return conn.execute("SELECT COUNT(*) FROM rekap_harian").fetchone()[0]
+
+def verifikasi(conn: sqlite3.Connection) -> list[tuple[str, str, str, int, int]]:
+    """Bandingkan `rekap_harian` dengan hitungan langsung dari `tugas`.
+    Return daftar selisih (tanggal, status, prioritas, jumlah_rekap, jumlah_sebenarnya); kosong jika cocok."""
+    sql = f"""
+    WITH langsung AS ({_SQL_HITUNG_LANGSUNG}),
+    kunci AS (
+        SELECT tanggal, status, prioritas FROM langsung
+        UNION
+        SELECT tanggal, status, prioritas FROM rekap_harian
+    )
+    SELECT k.tanggal, k.status, k.prioritas,
+           COALESCE(r.jumlah, 0) AS jumlah_rekap, COALESCE(l.jumlah, 0) AS jumlah_sebenarnya
+    FROM kunci k
+    LEFT JOIN rekap_harian r ON r.tanggal = k.tanggal AND r.status = k.status AND r.prioritas = k.prioritas
+    LEFT JOIN langsung l ON l.tanggal = k.tanggal AND l.status = k.status AND l.prioritas = k.prioritas
+    WHERE COALESCE(r.jumlah, 0) != COALESCE(l.jumlah, 0)
+    ORDER BY k.tanggal, k.status, k.prioritas
+    """
+    return [tuple(row) for row in conn.execute(sql)]
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Periksa atau bangun ulang tabel rekap_harian.")
+    aksi = parser.add_mutually_exclusive_group()
+    aksi.add_argument("--verifikasi", action="store_true", help="Hanya laporkan selisih (default)")
+    aksi.add_argument("--bangun-ulang", action="store_true", help="Isi ulang rekap dari tabel tugas")
+    args = parser.parse_args(argv)
+
+    if not database.setup_database_initial():
+        print("Setup database GAGAL.")
+        return 1
+    with database.koneksi() as conn:
+        if args.bangun_ulang:
+            print(f"Rekap harian dibangun ulang: {bangun_ulang(conn)} baris.")
+            return 0
+        selisih = verifikasi(conn)
+    for tanggal, status, prioritas, jumlah_rekap, jumlah_sebenarnya in selisih:
+        print(f"{tanggal} | {status} | {prioritas}: rekap {jumlah_rekap}, sebenarnya {jumlah_sebenarnya}")
+    if selisih:
+        print(f"\n{len(selisih)} selisih ditemukan. Jalankan dengan --bangun-ulang untuk memperbaiki.")
+        return 1
+    print("Rekap harian cocok dengan tabel tugas.")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
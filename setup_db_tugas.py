@@ -2,27 +2,23 @@
 import sqlite3
 import os
 from konfigurasi import DB_PATH
+import database
+import migrasi
 
 def setup_database():
     print(f"-> Memeriksa/membuat database di: {DB_PATH}")
     conn = None
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        sql_create_table = """
-        CREATE TABLE IF NOT EXISTS tugas (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            matkul TEXT,
-            deskripsi TEXT NOT NULL,
-            deadline DATE NOT NULL,
-            prioritas TEXT NOT NULL,
-            status TEXT NOT NULL
-        );
-        """
-        print("-> Membuat tabel 'tugas' (jika belum ada)...")
-        cursor.execute(sql_create_table)
-        conn.commit()
-        print("-> Tabel 'tugas' siap.")
+        # Lewat database.get_db_connection agar pragma (auto_vacuum INCREMENTAL, WAL) sudah aktif
+        # sebelum tabel pertama dibuat; keduanya tidak bisa diubah lagi tanpa VACUUM penuh
+        conn = database.get_db_connection(DB_PATH)
+        if conn is None:
+            return False
+        print(f"-> Versi skema saat ini: {migrasi.versi_skema(conn)}")
+        print("-> Menjalankan migrasi skema (jika ada yang baru)...")
+        versi = migrasi.jalankan_migrasi(conn)
+        migrasi.sinkronkan_kode(conn)
+        print(f"-> Skema database siap (versi {versi}).")
         return True
     except sqlite3.Error as e:
         print(f"-> Error SQLite saat setup: {e}")
@@ -0,0 +1,229 @@
+# shard.py
+"""Multi-tenant: satu file database SQLite per tenant (pemilik data).
+
+SQLite hanya mengizinkan satu penulis per file, jadi dengan satu database bersama
+semua pengguna antre di kunci tulis yang sama. `RouterShard` memetakan setiap tenant
+ke file sendiri (`<SHARD_FOLDER>/tenant_<id>.db`) dengan `BasisData` (pool koneksi,
+snapshot baca, migrasi) dan `ManajerTugas` sendiri, sehingga penulisan tenant yang
+berbeda berjalan paralel dan throughput tulis naik seiring jumlah tenant.
+
+Isolasi data berasal dari file yang terpisah; skema setiap shard sama persis dengan
+database utama (migrasi dijalankan saat shard pertama kali dibuka). Laporan admin
+lintas tenant dijalankan paralel ke semua shard (fan-out) lalu digabung.
+
+Contoh:
+    router = RouterShard()
+    router.manajer("andi").tambah_tugas(tugas)
+    laporan = router.ringkasan_semua()
+
+    python shard.py --buat andi budi             # Daftarkan tenant baru (aplikasi tidak membuat shard sendiri)
+    python shard.py --daftar
+    python shard.py --ringkasan
+    python shard.py --total --tenant andi budi
+    python shard.py --terjadwal                  # Untuk cron: pemeliharaan semua shard yang jatuh tempo
+"""
+
+import argparse
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+import database
+from manajer_tugas import ManajerTugas, RingkasanTugas
+from pencatatan import get_logger
+from konfigurasi import SHARD_FOLDER, SHARD_POOL_UKURAN, SHARD_PEKERJA, SHARD_MAKS_TERBUKA
+
+_log = get_logger("shard")
+
+T = TypeVar("T")
+
+_POLA_TENANT = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9_.-]{0,63}$")  # Aman dipakai sebagai nama file
+_POLA_FILE = re.compile(r"^tenant_(.+)\.db$")
+
+def validasi_tenant(tenant: str) -> str:
+    """Kembalikan ID tenant jika valid (huruf, angka, `_`, `-`, `.`; maks. 64 karakter), selain itu ValueError."""
+    if not isinstance(tenant, str) or not _POLA_TENANT.match(tenant):
+        raise ValueError(f"ID tenant tidak valid: {tenant!r}")
+    return tenant
+
+class RingkasanLintasTenant:
+    """Hasil `RouterShard.ringkasan_semua`: ringkasan per tenant, gabungannya dan tenant yang gagal dibaca."""
+
+    def __init__(self, per_tenant: dict[str, RingkasanTugas], gagal: dict[str, Exception]):
+        self.per_tenant = per_tenant
+        self.gagal = gagal
+        silang: dict[tuple[str, str], int] = {}
+        for ringkasan in per_tenant.values():
+            for kunci, jumlah in ringkasan.silang.items():
+                silang[kunci] = silang.get(kunci, 0) + jumlah
+        self.gabungan = RingkasanTugas(silang)
+
+    def __repr__(self) -> str:
+        return (f"RingkasanLintasTenant(tenant:{len(self.per_tenant)}, total:{self.gabungan.total}, "
+                f"gagal:{sorted(self.gagal)})")
+
+class RouterShard:
+    """Memetakan tenant ke file database sendiri dan menyimpan `ManajerTugas` per tenant.
+
+    Pool koneksi shard dibuka saat dipakai; jika lebih dari `maks_terbuka` shard terbuka,
+    pool (dan cache query) shard yang paling lama tidak dipakai ditutup. Objeknya tetap
+    disimpan, jadi pemakaian berikutnya cukup membuka koneksi lagi."""
+
+    def __init__(self, folder: str = SHARD_FOLDER, ukuran_pool: int = SHARD_POOL_UKURAN,
+                 maks_terbuka: int = SHARD_MAKS_TERBUKA, **opsi_manajer):
+        """`opsi_manajer` diteruskan ke setiap `ManajerTugas` (misalnya `ukuran_cache=0`)."""
+        self.folder = folder
+        self.ukuran_pool = ukuran_pool
+        self.maks_terbuka = maks_terbuka
+        self._opsi_manajer = opsi_manajer
+        self._manajer: OrderedDict[str, ManajerTugas] = OrderedDict()  # Urutan = terakhir dipakai
+        self._lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+
+    def path_untuk(self, tenant: str) -> str:
+        return os.path.join(self.folder, f"tenant_{validasi_tenant(tenant)}.db")
+
+    def manajer(self, tenant: str, buat: bool = True) -> ManajerTugas:
+        """`ManajerTugas` untuk tenant ini. Shard baru dibuat (dan dimigrasi) saat pertama kali dipakai;
+        dengan `buat=False`, tenant yang belum punya file shard menghasilkan KeyError."""
+        path = self.path_untuk(tenant)
+        with self._lock:
+            manajer = self._manajer.get(tenant)
+            if manajer is not None:
+                self._manajer.move_to_end(tenant)
+            elif not buat and not os.path.exists(path):
+                raise KeyError(f"Tenant tidak dikenal: {tenant}")
+            else:
+                basis_data = database.BasisData(path, ukuran_pool=self.ukuran_pool)
+                manajer = ManajerTugas(basis_data=basis_data, **self._opsi_manajer)
+                self._manajer[tenant] = manajer
+                _log.info("Shard dibuka", extra={"kv": {"tenant": tenant, "db": path}})
+            self._tutup_yang_lama()
+        return manajer
+
+    def basis_data(self, tenant: str) -> database.BasisData:
+        return self.manajer(tenant).db
+
+    def _tutup_yang_lama(self) -> None:
+        # Dipanggil dengan self._lock dipegang
+        terbuka = [t for t, m in self._manajer.items() if m.db._pool is not None]
+        for tenant in terbuka[:max(0, len(terbuka) - self.maks_terbuka)]:
+            manajer = self._manajer[tenant]
+            manajer.kosongkan_cache()
+            manajer.db.tutup()
+
+    def daftar_tenant(self) -> list[str]:
+        """Semua tenant yang punya file shard di folder, terurut."""
+        hasil = []
+        for nama in os.listdir(self.folder):
+            cocok = _POLA_FILE.match(nama)
+            if cocok and _POLA_TENANT.match(cocok.group(1)):
+                hasil.append(cocok.group(1))
+        return sorted(hasil)
+
+    # ---- Fan-out lintas tenant (laporan admin) ----
+    def untuk_semua(self, fungsi: Callable[[ManajerTugas], T],
+                    daftar: list[str] | None = None) -> tuple[dict[str, T], dict[str, Exception]]:
+        """Jalankan `fungsi(manajer)` untuk setiap tenant secara paralel. Tidak pernah membuat shard baru:
+        tenant di `daftar` yang tidak punya file shard masuk error (KeyError), begitu juga ID yang tidak valid.
+        Return (hasil per tenant, error per tenant); satu shard yang gagal tidak menggagalkan yang lain."""
+        daftar = self.daftar_tenant() if daftar is None else daftar
+        hasil: dict[str, T] = {}
+        gagal: dict[str, Exception] = {}
+        if not daftar:
+            return hasil, gagal
+
+        def jalankan(tenant: str):
+            return fungsi(self.manajer(tenant, buat=False))
+
+        with ThreadPoolExecutor(max_workers=min(SHARD_PEKERJA, len(daftar)), thread_name_prefix="shard") as executor:
+            futures = {tenant: executor.submit(jalankan, tenant) for tenant in daftar}
+            for tenant, future in futures.items():
+                try:
+                    hasil[tenant] = future.result()
+                except Exception as e:
+                    _log.error("Fan-out gagal di shard", extra={"kv": {"tenant": tenant, "error": e}})
+                    gagal[tenant] = e
+        return hasil, gagal
+
+    def ringkasan_semua(self, daftar: list[str] | None = None, **opsi) -> RingkasanLintasTenant:
+        """`ManajerTugas.ringkasan(**opsi)` di setiap shard beserta gabungannya."""
+        return RingkasanLintasTenant(*self.untuk_semua(lambda m: m.ringkasan(**opsi), daftar))
+
+    def hitung_total_semua(self, daftar: list[str] | None = None, **opsi) -> dict[str, int]:
+        """`ManajerTugas.hitung_total_tugas(**opsi)` per tenant (shard yang gagal dilewati dan dicatat di log)."""
+        return self.untuk_semua(lambda m: m.hitung_total_tugas(**opsi), daftar)[0]
+
+    def pemeliharaan_semua(self, daftar: list[str] | None = None, **opsi) -> dict[str, dict | None]:
+        """`ManajerTugas.pemeliharaan_terjadwal(**opsi)` di setiap shard (None = belum jatuh tempo)."""
+        return self.untuk_semua(lambda m: m.pemeliharaan_terjadwal(**opsi), daftar)[0]
+
+    def tutup(self) -> None:
+        """Tutup pool koneksi semua shard."""
+        with self._lock:
+            for manajer in self._manajer.values():
+                manajer.db.tutup()
+
+    def __repr__(self) -> str:
+        terbuka = sum(1 for m in self._manajer.values() if m.db._pool is not None)
+        return f"RouterShard({self.folder!r}, tenant dimuat:{len(self._manajer)}, pool terbuka:{terbuka})"
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Laporan dan pemeliharaan lintas tenant (satu file database per tenant).")
+    parser.add_argument("--folder", default=SHARD_FOLDER, help="Folder file shard")
+    parser.add_argument("--tenant", nargs="+", metavar="ID", help="Batasi ke tenant ini (default: semua)")
+    parser.add_argument("--buat", nargs="+", metavar="ID", help="Buat (dan migrasi) shard untuk tenant baru")
+    parser.add_argument("--daftar", action="store_true", help="Tampilkan semua tenant")
+    parser.add_argument("--ringkasan", action="store_true", help="Jumlah tugas per status/prioritas, per tenant dan gabungan")
+    parser.add_argument("--total", action="store_true", help="Jumlah tugas per tenant")
+    parser.add_argument("--terjadwal", action="store_true", help="Arsip + pemeliharaan di shard yang sudah jatuh tempo")
+    args = parser.parse_args(argv)
+
+    try:
+        daftar = [validasi_tenant(t) for t in args.tenant] if args.tenant else None
+    except ValueError as e:
+        print(e)
+        return 1
+    router = RouterShard(args.folder, ukuran_pool=1)
+    try:
+        if args.buat:
+            for tenant in args.buat:
+                try:
+                    ada = os.path.exists(router.path_untuk(tenant))
+                    router.manajer(tenant)
+                except ValueError as e:
+                    print(e)
+                    return 1
+                print(f"{tenant:<24} {'sudah ada' if ada else 'dibuat'}")
+        if args.daftar:
+            for tenant in router.daftar_tenant():
+                print(tenant)
+        if args.ringkasan:
+            laporan = router.ringkasan_semua(daftar)
+            for tenant, ringkasan in laporan.per_tenant.items():
+                print(f"{tenant:<24} {ringkasan.total:>8}  {ringkasan.per_status}")
+            print(f"{'GABUNGAN':<24} {laporan.gabungan.total:>8}  {laporan.gabungan.per_status}")
+            print(f"{'':<24} {'':>8}  {laporan.gabungan.per_prioritas}")
+            for tenant, error in laporan.gagal.items():
+                print(f"GAGAL {tenant}: {error}")
+        if args.total:
+            total, gagal = router.untuk_semua(lambda m: m.hitung_total_tugas(), daftar)
+            for tenant, jumlah in total.items():
+                print(f"{tenant:<24} {jumlah:>8}")
+            print(f"{'GABUNGAN':<24} {sum(total.values()):>8}")
+            for tenant, error in gagal.items():
+                print(f"GAGAL {tenant}: {error}")
+        if args.terjadwal:
+            hasil_pemeliharaan, gagal = router.untuk_semua(lambda m: m.pemeliharaan_terjadwal(), daftar)
+            for tenant, hasil in hasil_pemeliharaan.items():
+                print(f"{tenant:<24} {'Belum jatuh tempo.' if hasil is None else hasil}")
+            for tenant, error in gagal.items():
+                print(f"GAGAL {tenant}: {error}")
+    finally:
+        router.tutup()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+# tests/conftest.py
+"""Fixture bersama: setiap test memakai file database sementara, bukan todolist.db."""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database  # noqa: E402
+from manajer_tugas import ManajerTugas  # noqa: E402
+from model import Tugas  # noqa: E402
+
+TANGGAL = datetime.date(2026, 3, 10)
+
+@pytest.fixture(autouse=True)
+def db_utama(tmp_path):
+    """Arahkan database utama (fungsi modul `database.*`) ke file sementara selama satu test."""
+    path_lama = database.get_basis_data().db_path
+    path = str(tmp_path / "utama.db")
+    database.ganti_database(path)
+    yield path
+    database.ganti_database(path_lama)
+
+@pytest.fixture
+def basis_data(tmp_path):
+    bd = database.BasisData(str(tmp_path / "tugas.db"), ukuran_pool=3, timeout=2)
+    assert bd.setup_database_initial()
+    yield bd
+    bd.tutup()
+
+@pytest.fixture
+def manajer(basis_data):
+    return ManajerTugas(basis_data=basis_data)
+
+@pytest.fixture
+def manajer_tanpa_cache(basis_data):
+    return ManajerTugas(ukuran_peta_identitas=0, ukuran_cache=0, basis_data=basis_data)
+
+def buat_tugas(i: int = 0, deadline: datetime.date = TANGGAL, prioritas: str = "Medium",
+               status: str = "Pending", matkul: str = "Basis Data") -> Tugas:
+    return Tugas(matkul, f"Tugas nomor {i}", deadline, prioritas, status)
+
+def isi(manajer: ManajerTugas, jumlah: int, **kwargs) -> list[int]:
+    """Tambahkan `jumlah` tugas lalu kembalikan ID-nya (urut naik)."""
+    assert manajer.tambah_tugas_batch([buat_tugas(i, **kwargs) for i in range(jumlah)]) == jumlah
+    with manajer.db.koneksi() as conn:
+        return [row[0] for row in conn.execute("SELECT id FROM tugas_data ORDER BY id")][-jumlah:]
@@ -0,0 +1,113 @@
+# tests/test_arsip.py
+import datetime
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import arsip
+import konfigurasi
+import migrasi
+import setup_db_tugas
+from conftest import isi
+
+LAMA = datetime.date.today() - datetime.timedelta(days=400)
+BARU = datetime.date.today() - datetime.timedelta(days=5)
+
+def jumlah(conn, tabel: str) -> int:
+    return conn.execute(f"SELECT COUNT(*) FROM {tabel}").fetchone()[0]
+
+def daftar_id(conn, tabel: str) -> list[int]:
+    return [row[0] for row in conn.execute(f"SELECT id FROM {tabel} ORDER BY id")]
+
+def test_arsipkan_hanya_complete_yang_lama(manajer):
+    isi(manajer, 3, deadline=LAMA, status="Complete")
+    isi(manajer, 2, deadline=LAMA)
+    isi(manajer, 2, deadline=BARU, status="Complete")
+    with manajer.db.koneksi() as conn:
+        assert arsip.arsipkan(conn, umur_hari=120, ukuran_chunk=2) == 3
+        assert (jumlah(conn, "tugas_data"), jumlah(conn, "tugas_arsip_data")) == (4, 3)
+        assert conn.execute("SELECT SUM(jumlah) FROM rekap_harian").fetchone()[0] == 4
+        assert conn.execute("SELECT COUNT(*) FROM tugas_fts WHERE tugas_fts MATCH 'nomor'").fetchone()[0] == 4
+
+def test_data_arsip_tetap_bisa_dibaca_dan_dipulihkan(manajer):
+    ids = isi(manajer, 2, deadline=LAMA, status="Complete")
+    assert manajer.arsipkan_selesai(umur_hari=120) == 2
+    assert manajer.get_tugas(ids[0]) is None
+    assert manajer.get_tugas(ids[0], sertakan_arsip=True).status == "Complete"
+    assert manajer.hitung_total_tugas() == 0
+    assert manajer.hitung_total_tugas(sertakan_arsip=True) == 2
+    assert len(manajer.get_dataframe_tugas(sertakan_arsip=True)) == 2
+    assert manajer.ringkasan(sertakan_arsip=True).total == 2
+    with manajer.db.koneksi() as conn:
+        assert arsip.pulihkan(conn, [ids[0]]) == 1
+        assert daftar_id(conn, "tugas_data") == [ids[0]]
+
+def test_arsipkan_menunggu_penulis_lain_sebelum_memilih(manajer):
+    a, b = isi(manajer, 2, deadline=LAMA, status="Complete")
+    penulis = sqlite3.connect(manajer.db.db_path, isolation_level=None)
+    penulis.execute("BEGIN IMMEDIATE")
+    penulis.execute("UPDATE tugas_data SET kode_status = (SELECT kode FROM status_tugas WHERE nama = 'Pending') "
+                    "WHERE id = ?", (a,))  # Tugas dibuka kembali, belum di-commit
+    hasil = []
+    with manajer.db.koneksi() as conn:
+        t = threading.Thread(target=lambda: hasil.append(arsip.arsipkan(conn, umur_hari=120)))
+        t.start()
+        time.sleep(0.2)
+        penulis.execute("COMMIT")
+        t.join(5)
+        assert hasil == [1]
+        assert daftar_id(conn, "tugas_data") == [a]
+        assert daftar_id(conn, "tugas_arsip_data") == [b]
+    penulis.close()
+
+def test_klaim_jadwal_sekali_per_interval(manajer):
+    with manajer.db.koneksi() as conn:
+        assert arsip.klaim_jadwal(conn, interval_jam=24)
+        assert not arsip.klaim_jadwal(conn, interval_jam=24)
+        assert arsip.klaim_jadwal(conn, interval_jam=0)
+
+def test_pemeliharaan_terjadwal(manajer):
+    isi(manajer, 3, deadline=LAMA, status="Complete")
+    hasil = manajer.pemeliharaan_terjadwal(interval_jam=24, umur_hari=120)
+    assert hasil["diarsipkan"] == 3 and "incremental_vacuum" in hasil
+    assert manajer.pemeliharaan_terjadwal(interval_jam=24, umur_hari=120) is None
+    with manajer.db.koneksi() as conn:
+        info = arsip.status(conn)
+    assert info["jumlah_arsip"] == 3 and info["pemeliharaan_terakhir"]
+
+def test_pemeliharaan_tanpa_arsip(manajer):
+    isi(manajer, 3, deadline=LAMA, status="Complete")
+    hasil = manajer.pemeliharaan_terjadwal(interval_jam=24, umur_hari=None)
+    assert hasil["diarsipkan"] == 0 and "analyze" in hasil
+    assert manajer.hitung_total_tugas() == 3
+
+def test_arsip_otomatis_dijelaskan_di_halaman_daftar(monkeypatch):
+    testing = pytest.importorskip("streamlit.testing.v1")
+    path_app = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main_app.py")
+
+    def keterangan():
+        at = testing.AppTest.from_file(path_app, default_timeout=30)
+        at.run()
+        at.sidebar.radio[0].set_value("Daftar Tugas").run()
+        assert not at.exception
+        return [c.value for c in at.caption if "arsip" in c.value]
+
+    monkeypatch.setattr(konfigurasi, "ARSIP_OTOMATIS", False)
+    assert keterangan() == []
+    monkeypatch.setattr(konfigurasi, "ARSIP_OTOMATIS", True)
+    assert any("dipindah otomatis ke arsip" in teks for teks in keterangan())
+
+def test_setup_db_tugas_menerapkan_pragma(tmp_path, monkeypatch, capsys):
+    path = str(tmp_path / "baru.db")
+    monkeypatch.setattr(setup_db_tugas, "DB_PATH", path)
+    assert setup_db_tugas.setup_database()
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert migrasi.versi_skema(conn) == migrasi.VERSI_TERBARU
+    finally:
+        conn.close()
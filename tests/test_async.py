@@ -0,0 +1,72 @@
+# tests/test_async.py
+import asyncio
+import time
+
+import pytest
+
+from conftest import buat_tugas, isi
+from manajer_tugas_async import AsyncManajerTugas
+
+def jalankan(coro):
+    return asyncio.run(coro)
+
+def test_operasi_dasar(manajer):
+    async def skenario():
+        async with AsyncManajerTugas(manajer) as am:
+            assert am.jumlah_pekerja == manajer.db.pool.ukuran
+            assert await am.tambah_tugas(buat_tugas(1))
+            assert await am.tambah_tugas_batch([buat_tugas(i) for i in range(4)]) == 4
+            total = await am.hitung_total_tugas()
+            df = await am.get_dataframe_tugas()
+            return total, len(df)
+    assert jalankan(skenario()) == (5, 5)
+
+def test_banyak_iterator_bersamaan_tidak_menghabiskan_pool(manajer):
+    ids = isi(manajer, 30)
+
+    async def kumpulkan(am):
+        return [t.id async for t in am.iter_tugas(ukuran_chunk=4)]
+
+    async def skenario():
+        async with AsyncManajerTugas(manajer) as am:
+            # Jauh lebih banyak iterator daripada koneksi pool (3); timeout pool 2 detik
+            return await asyncio.wait_for(asyncio.gather(*(kumpulkan(am) for _ in range(12))), 10)
+    mulai = time.perf_counter()
+    hasil = jalankan(skenario())
+    assert time.perf_counter() - mulai < 5
+    assert all(sorted(h) == ids for h in hasil)
+    assert manajer.db.pool._tersedia.qsize() == manajer.db.pool._jumlah_dibuat  # Semua koneksi kembali
+
+def test_iter_tugas_dengan_filter(manajer):
+    isi(manajer, 3, prioritas="High")
+    isi(manajer, 2, prioritas="Low")
+
+    async def skenario():
+        async with AsyncManajerTugas(manajer) as am:
+            return [t.prioritas async for t in am.iter_tugas({"prioritas_filter": "Low"}, ukuran_chunk=1)]
+    assert jalankan(skenario()) == ["Low", "Low"]
+
+def test_timeout_per_operasi(manajer, monkeypatch):
+    monkeypatch.setattr(manajer, "hitung_total_tugas", lambda *a: time.sleep(0.5) or 0)
+
+    async def skenario():
+        async with AsyncManajerTugas(manajer, timeout=0.05) as am:
+            await am.hitung_total_tugas()
+    with pytest.raises(asyncio.TimeoutError):
+        jalankan(skenario())
+
+def test_pembatalan_sebelum_mulai_tidak_menyentuh_database(manajer, monkeypatch):
+    dijalankan = []
+    monkeypatch.setattr(manajer, "tambah_tugas", lambda tugas: dijalankan.append(tugas) or True)
+
+    async def skenario():
+        async with AsyncManajerTugas(manajer, jumlah_pekerja=1, batas_antrean=1) as am:
+            pertama = asyncio.ensure_future(am.tambah_tugas(buat_tugas(1)))
+            kedua = asyncio.ensure_future(am.tambah_tugas(buat_tugas(2)))  # Menunggu semaphore
+            await asyncio.sleep(0)
+            kedua.cancel()
+            await pertama
+            with pytest.raises(asyncio.CancelledError):
+                await kedua
+    jalankan(skenario())
+    assert [t.deskripsi for t in dijalankan] == ["Tugas nomor 1"]
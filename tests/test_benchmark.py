@@ -0,0 +1,72 @@
+# tests/test_benchmark.py
+import datetime
+import sqlite3
+
+import pytest
+
+from benchmark import dataset, suite
+from benchmark.__main__ import main
+from manajer_tugas import ManajerTugas
+
+def test_dataset_deterministik():
+    assert list(dataset.baris_tugas(50, seed=1)) == list(dataset.baris_tugas(50, seed=1))
+    assert list(dataset.baris_tugas(50, seed=1)) != list(dataset.baris_tugas(50, seed=2))
+
+def test_distribusi_dataset_masuk_akal():
+    baris = list(dataset.baris_tugas(2000))
+    lewat = [b for b in baris if datetime.date.fromisoformat(b[2]) < datetime.date(2025, 5, 15)]
+    assert sum(b[4] == "Complete" for b in lewat) / len(lewat) > 0.7
+    prioritas = [b[3] for b in baris]
+    assert max(set(prioritas), key=prioritas.count) == "Medium"
+
+def test_buat_dataset(tmp_path, capsys):
+    path = str(tmp_path / "bench.db")
+    dataset.buat_dataset(path, 300)
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM tugas").fetchone()[0] == 300
+        assert conn.execute("SELECT SUM(jumlah) FROM rekap_harian").fetchone()[0] == 300
+    finally:
+        conn.close()
+    with pytest.raises(ValueError):
+        dataset.buat_dataset(path, 10)  # File yang sudah berisi tugas tidak ditimpa
+
+def test_jalankan_suite_tidak_mengubah_dataset(tmp_path, capsys):
+    path = str(tmp_path / "bench.db")
+    dataset.buat_dataset(path, 300)
+    with open(path, "rb") as f:
+        isi_awal = f.read()
+    hasil = suite.jalankan(path, ulang=2, pemanasan=0)
+    assert hasil["meta"]["jumlah_tugas"] == 300
+    assert hasil["hasil"] and all({"p50_ms", "p95_ms", "p99_ms"} <= set(h) for h in hasil["hasil"].values())
+    with open(path, "rb") as f:
+        assert f.read() == isi_awal
+
+def test_persentil_nearest_rank():
+    data = list(range(100, 0, -1))  # 1..100, tidak terurut
+    assert suite.persentil(data, 50) == 50
+    assert suite.persentil(data, 95) == 95
+    assert suite.persentil(data, 99) == 99
+    assert suite.persentil(data, 100) == 100
+    assert suite.persentil(data, 0) == 1
+    assert suite.persentil([3.0, 1.0, 2.0, 4.0], 50) == 2.0
+    assert suite.persentil([7.0], 99) == 7.0
+
+def test_setiap_method_publik_punya_kasus(manajer):
+    konteks = suite.Konteks.__new__(suite.Konteks)  # Nama kasus tidak bergantung isi dataset
+    kasus = {nama.split("[")[0] for nama in suite.daftar_kasus(manajer, konteks)}
+    publik = {nama for nama in dir(ManajerTugas) if not nama.startswith("_")}
+    assert publik - kasus == set(suite.DIKECUALIKAN)
+
+def test_bandingkan_menandai_regresi(tmp_path, capsys):
+    lama = {"hasil": {"a": {"p50_ms": 1.0, "p95_ms": 2.0}, "b": {"p50_ms": 1.0, "p95_ms": 1.0}}}
+    baru = {"hasil": {"a": {"p50_ms": 1.1, "p95_ms": 3.0}, "b": {"p50_ms": 0.5, "p95_ms": 1.0},
+                      "c": {"p50_ms": 9.0, "p95_ms": 9.0}}}
+    regresi = suite.bandingkan(lama, baru, ambang=0.15)
+    assert [(r["kasus"], r["metrik"]) for r in regresi] == [("a", "p95_ms")]
+
+    suite.simpan_json(lama, str(tmp_path / "lama.json"))
+    suite.simpan_json(baru, str(tmp_path / "baru.json"))
+    assert main(["bandingkan", str(tmp_path / "lama.json"), str(tmp_path / "baru.json")]) == 1
+    assert "REGRESI a" in capsys.readouterr().out
+    assert main(["bandingkan", str(tmp_path / "lama.json"), str(tmp_path / "lama.json")]) == 0
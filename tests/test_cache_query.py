@@ -0,0 +1,94 @@
+# tests/test_cache_query.py
+import sqlite3
+import time
+
+from conftest import buat_tugas, isi
+from cache_query import CacheQuery
+
+def test_generasi_baru_membuat_entri_basi():
+    cache = CacheQuery(ukuran=4, ttl=None)
+    cache.simpan("a", 1, "nilai")
+    assert cache.ambil("a", 1) == (True, "nilai")
+    assert cache.ambil("a", 2) == (False, None)
+    assert len(cache) == 0  # Entri basi langsung dibuang
+
+def test_ttl_kedaluwarsa():
+    cache = CacheQuery(ukuran=4, ttl=0.01)
+    cache.simpan("a", 0, 1)
+    time.sleep(0.02)
+    assert cache.ambil("a", 0) == (False, None)
+
+def test_lru_membuang_yang_paling_lama_tidak_dipakai():
+    cache = CacheQuery(ukuran=2, ttl=None)
+    cache.simpan("a", 0, 1)
+    cache.simpan("b", 0, 2)
+    cache.ambil("a", 0)
+    cache.simpan("c", 0, 3)
+    assert cache.ambil("b", 0)[0] is False
+    assert cache.ambil("a", 0)[0] and cache.ambil("c", 0)[0]
+
+def test_ukuran_nol_tidak_menyimpan():
+    cache = CacheQuery(ukuran=0)
+    assert cache.ambil_atau_hitung("a", 0, lambda: 5) == 5
+    assert len(cache) == 0
+
+def test_query_kedua_dari_cache(manajer, monkeypatch):
+    isi(manajer, 3)
+    panggilan = []
+    asli = manajer._baca_dataframe
+    monkeypatch.setattr(manajer, "_baca_dataframe", lambda *a, **kw: panggilan.append(a) or asli(*a, **kw))
+    assert len(manajer.berikutnya(10, dari=buat_tugas().deadline)) == 3
+    assert len(manajer.berikutnya(10, dari=buat_tugas().deadline)) == 3
+    assert len(panggilan) == 1
+
+def test_penulisan_menaikkan_generasi_dan_membuang_cache(manajer):
+    isi(manajer, 2)
+    dari = buat_tugas().deadline
+    assert len(manajer.berikutnya(10, dari=dari)) == 2
+    generasi = manajer.generasi
+    assert manajer.tambah_tugas(buat_tugas(9))
+    assert manajer.generasi == generasi + 1
+    assert len(manajer.berikutnya(10, dari=dari)) == 3
+
+def test_hasil_cache_tidak_ikut_berubah(manajer):
+    isi(manajer, 2)
+    df = manajer.berikutnya(10, dari=buat_tugas().deadline)
+    df.drop(df.index, inplace=True)  # Pemanggil mendapat salinan
+    assert len(manajer.berikutnya(10, dari=buat_tugas().deadline)) == 2
+
+def test_kosongkan_cache(manajer):
+    isi(manajer, 1)
+    manajer.berikutnya(10, dari=buat_tugas().deadline)
+    assert len(manajer._cache) > 0
+    manajer.kosongkan_cache()
+    assert len(manajer._cache) == 0
+
+def test_hasil_gagal_tidak_disimpan_di_cache(manajer, monkeypatch):
+    isi(manajer, 3)
+    dari = buat_tugas().deadline
+
+    def rusak(*a, **kw):
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(manajer, "_baca_dataframe", rusak)
+    assert manajer.berikutnya(10, dari=dari).empty
+    assert manajer.get_halaman_tugas(ukuran=10).data.empty
+    assert manajer.get_dataframe_tugas(sertakan_arsip=True).empty
+    assert len(manajer._cache) == 0
+    monkeypatch.undo()
+    assert len(manajer.berikutnya(10, dari=dari)) == 3
+    assert len(manajer.get_halaman_tugas(ukuran=10).data) == 3
+    assert len(manajer.get_dataframe_tugas(sertakan_arsip=True)) == 3
+
+def test_ringkasan_dan_total_gagal_tidak_disimpan_di_cache(manajer, monkeypatch):
+    isi(manajer, 3)
+    asli = manajer.db.koneksi_baca
+
+    def rusak():
+        raise TimeoutError("pool penuh")
+    monkeypatch.setattr(manajer.db, "koneksi_baca", rusak)
+    assert manajer.ringkasan().total == 0
+    assert manajer.hitung_total_tugas() == 0
+    assert len(manajer._cache) == 0
+    monkeypatch.setattr(manajer.db, "koneksi_baca", asli)
+    assert manajer.ringkasan().total == 3
+    assert manajer.hitung_total_tugas() == 3
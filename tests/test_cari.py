@@ -0,0 +1,42 @@
+# tests/test_cari.py
+from conftest import buat_tugas, isi
+from manajer_tugas import _query_fts
+from model import Tugas
+
+def test_query_fts_aman_dari_sintaks_pengguna():
+    assert _query_fts('jaringan "komp') == '"jaringan"* "komp"*'
+    assert _query_fts('   "" * OR ') == '"OR"*'
+    assert _query_fts(" ** ") is None
+
+def test_cari_prefix_di_matkul_dan_deskripsi(manajer):
+    manajer.tambah_tugas(Tugas("Jaringan Komputer", "Laporan praktikum routing", buat_tugas().deadline, "High", "Pending"))
+    manajer.tambah_tugas(Tugas("Basis Data", "Normalisasi tabel", buat_tugas().deadline, "Low", "Pending"))
+    assert manajer.cari("jaring")["matkul"].tolist() == ["Jaringan Komputer"]
+    assert manajer.cari("normal tab")["deskripsi"].tolist() == ["Normalisasi tabel"]
+    assert manajer.cari("routing basis").empty  # Semua kata harus ada
+    hasil = manajer.cari("rout", penanda=("<", ">"))
+    assert "<routing>" in hasil["cuplikan"].iloc[0]
+
+def test_cari_dengan_filter(manajer):
+    isi(manajer, 2, prioritas="High")
+    isi(manajer, 3, prioritas="Low")
+    assert len(manajer.cari("tugas")) == 5
+    assert len(manajer.cari("tugas", filters={"prioritas_filter": "Low"})) == 3
+    assert len(manajer.cari("tugas", limit=2)) == 2
+
+def test_query_kosong_mengembalikan_dataframe_kosong(manajer):
+    isi(manajer, 1)
+    hasil = manajer.cari("!!")
+    assert hasil.empty and {"cuplikan", "skor"} <= set(hasil.columns)
+
+def test_indeks_mengikuti_update_dan_hapus(manajer):
+    id_tugas = isi(manajer, 1)[0]
+    assert len(manajer.cari("nomor")) == 1
+    lama = manajer.get_tugas(id_tugas)
+    manajer.update_tugas(Tugas(lama.matkul, "Kuis aljabar", lama.deadline, lama.prioritas, lama.status, id_tugas))
+    assert manajer.cari("nomor").empty
+    assert manajer.cari("aljabar")["id"].tolist() == [id_tugas]
+    manajer.hapus_tugas(id_tugas)
+    assert manajer.cari("aljabar").empty
+    with manajer.db.koneksi() as conn:
+        conn.execute("INSERT INTO tugas_fts(tugas_fts, rank) VALUES ('integrity-check', 1)")
@@ -0,0 +1,50 @@
+# tests/test_dataframe.py
+import datetime
+
+import pandas as pd
+import pytest
+
+from conftest import isi, TANGGAL
+from konfigurasi import DAFTAR_PRIORITAS, STATUS_TUGAS
+from model import format_tanggal_kolom, tipekan_dataframe
+
+def test_dtype_dataframe_tugas(manajer):
+    isi(manajer, 3, prioritas="High")
+    df = manajer.get_dataframe_tugas()
+    assert df["id"].dtype == "int64"
+    assert pd.api.types.is_datetime64_any_dtype(df["deadline"])
+    assert list(df["status"].cat.categories) == STATUS_TUGAS
+    assert list(df["prioritas"].cat.categories) == DAFTAR_PRIORITAS
+    assert df["deadline"].dt.date.tolist() == [TANGGAL] * 3
+
+def test_kategori_menyimpan_nilai_di_luar_konfigurasi():
+    df = tipekan_dataframe(pd.DataFrame({"status": ["Pending", "Ditunda"], "prioritas": ["Low", None]}))
+    assert df["status"].tolist() == ["Pending", "Ditunda"]
+    assert list(df["status"].cat.categories) == STATUS_TUGAS + ["Ditunda"]
+    assert pd.isna(df["prioritas"].iloc[1])
+
+def test_tipekan_pyarrow():
+    pytest.importorskip("pyarrow")
+    df = tipekan_dataframe(pd.DataFrame({"id": [1], "matkul": ["A"], "deadline": ["2026-03-10"]}), pyarrow=True)
+    assert str(df["id"].dtype) == "int64[pyarrow]"
+    assert str(df["deadline"].dtype) == "date32[day][pyarrow]"
+    assert str(df["matkul"].dtype) == "string"
+
+def test_format_tanggal_kolom():
+    seri = pd.Series(pd.to_datetime(["2026-03-10", None, "2026-03-10", "2026-01-02"]), index=[5, 6, 7, 8], name="deadline")
+    hasil = format_tanggal_kolom(seri)
+    assert hasil.tolist() == ["10-03-2026", None, "10-03-2026", "02-01-2026"]
+    assert list(hasil.index) == [5, 6, 7, 8] and hasil.name == "deadline"
+    assert format_tanggal_kolom(seri, "%Y/%m/%d").iloc[3] == "2026/01/02"
+
+def test_format_tanggal_kolom_date_objek_dan_kosong():
+    seri = pd.Series([datetime.date(2026, 3, 10), datetime.date(2026, 3, 11)])
+    assert format_tanggal_kolom(seri).tolist() == ["10-03-2026", "11-03-2026"]
+    assert format_tanggal_kolom(pd.Series([], dtype="datetime64[ns]")).tolist() == []
+
+def test_halaman_dan_berikutnya_bertipe(manajer):
+    isi(manajer, 3)
+    halaman = manajer.get_halaman_tugas(ukuran=2)
+    assert pd.api.types.is_datetime64_any_dtype(halaman.data["deadline"])
+    assert halaman.kunci_akhir == (TANGGAL.strftime("%Y-%m-%d"), int(halaman.data["id"].iloc[-1]))
+    assert manajer.berikutnya(5, dari=TANGGAL)["status"].dtype == "category"
@@ -0,0 +1,84 @@
+# tests/test_ekspor.py
+import csv
+import itertools
+import json
+import sqlite3
+
+import pytest
+
+import ekspor_tugas
+from conftest import isi
+
+def test_iter_tugas_berurutan_dan_lengkap(manajer):
+    ids = isi(manajer, 23)
+    assert [t.id for t in manajer.iter_tugas(ukuran_chunk=5)] == ids
+
+def test_iter_tugas_dihentikan_mengembalikan_koneksi(manajer):
+    isi(manajer, 20)
+    generator = manajer.iter_tugas(ukuran_chunk=5)
+    list(itertools.islice(generator, 3))
+    assert manajer.db.pool.statistik()["menganggur"] == 0
+    generator.close()
+    statistik = manajer.db.pool.statistik()
+    assert statistik["menganggur"] == statistik["dibuat"]
+
+def test_iter_dataframe_per_chunk(manajer):
+    isi(manajer, 12)
+    ukuran = [len(df) for df in manajer.iter_dataframe_tugas(ukuran_chunk=5)]
+    assert ukuran == [5, 5, 2]
+
+def test_chunk_gagal_di_tengah_dilempar_ulang(basis_data, manajer):
+    isi(manajer, 30)
+    chunks = basis_data.get_dataframe("SELECT * FROM tugas ORDER BY hari, id", chunksize=10)
+    next(chunks)
+    with pytest.raises(sqlite3.OperationalError):
+        chunks.throw(sqlite3.OperationalError("disk rusak"))
+
+def test_iter_dataframe_dengan_filter(manajer):
+    isi(manajer, 6)
+    isi(manajer, 4, status="Complete")
+    filters = {"status_filter": "Complete"}
+    assert sum(len(df) for df in manajer.iter_dataframe_tugas(filters, ukuran_chunk=3)) == 4
+
+@pytest.mark.parametrize("nama", ["a.csv", "a.ndjson"])
+def test_ekspor_file(manajer, tmp_path, nama):
+    isi(manajer, 7)
+    path = tmp_path / nama
+    assert ekspor_tugas.ekspor_file(str(path), manajer, ukuran_chunk=3) == 7
+    teks = path.read_text(encoding="utf-8")
+    if nama.endswith(".csv"):
+        baris = list(csv.DictReader(teks.splitlines()))
+    else:
+        baris = [json.loads(b) for b in teks.splitlines()]
+    assert len(baris) == 7 and baris[0]["deadline"] == "2026-03-10"
+
+def test_ekspor_parquet(manajer, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    isi(manajer, 4)
+    path = tmp_path / "a.parquet"
+    assert ekspor_tugas.ekspor_file(str(path), manajer, ukuran_chunk=3) == 4
+    assert pq.read_table(path).num_rows == 4
+
+def test_ekspor_gagal_tidak_meninggalkan_file(manajer, tmp_path, monkeypatch):
+    isi(manajer, 10)
+    asli = manajer.iter_dataframe_tugas
+
+    def rusak(filters=None, ukuran_chunk=3):
+        for i, df in enumerate(asli(filters, ukuran_chunk)):
+            if i == 2:
+                raise sqlite3.OperationalError("disk rusak")
+            yield df
+
+    monkeypatch.setattr(manajer, "iter_dataframe_tugas", rusak)
+    path = tmp_path / "a.csv"
+    with pytest.raises(sqlite3.OperationalError):
+        ekspor_tugas.ekspor_file(str(path), manajer, ukuran_chunk=3)
+    assert not path.exists()
+
+def test_format_tidak_dikenal(manajer, tmp_path):
+    with pytest.raises(ValueError):
+        ekspor_tugas.ekspor_file(str(tmp_path / "a.xlsx"), manajer)
+
+def test_cli_gagal_keluar_dengan_kode_1(tmp_path, capsys):
+    assert ekspor_tugas.main([str(tmp_path / "tidak_ada" / "a.csv")]) == 1
+    assert "GAGAL" in capsys.readouterr().out
@@ -0,0 +1,44 @@
+# tests/test_grafik.py
+import pytest
+
+import grafik
+
+@pytest.fixture(autouse=True)
+def cache_kosong():
+    grafik.statistik_cache().kosongkan()
+    yield
+    grafik.statistik_cache().kosongkan()
+
+def test_pie_png_dirender_sekali(monkeypatch):
+    render = []
+    asli = grafik._render_pie
+    monkeypatch.setattr(grafik, "_render_pie", lambda *a: render.append(a) or asli(*a))
+    png = grafik.pie_png(["Pending", "Complete"], [3, 1])
+    assert png.startswith(b"\x89PNG")
+    assert grafik.pie_png(("Pending", "Complete"), (3, 1)) is png
+    assert len(render) == 1
+
+def test_kunci_mengikuti_data_dan_tema(monkeypatch):
+    render = []
+    monkeypatch.setattr(grafik, "_render_pie", lambda *a: render.append(a) or b"png")
+    grafik.pie_png(["A", "B"], [1, 2])
+    grafik.pie_png(["A", "B"], [1, 3])
+    grafik.pie_png(["A", "B"], [1, 2], tema="light")
+    grafik.pie_png(["A", "B"], [1, 2])
+    assert [a[2] for a in render] == ["white", "white", "black"]
+
+def test_pie_tidak_memakai_pyplot():
+    grafik.pie_png(["A"], [1])
+    import sys
+    if "matplotlib.pyplot" in sys.modules:
+        assert sys.modules["matplotlib.pyplot"].get_fignums() == []
+
+def test_spesifikasi_pie():
+    spesifikasi = grafik.spesifikasi_pie("status", "jumlah")
+    assert spesifikasi["mark"]["type"] == "arc"
+    assert spesifikasi["encoding"]["theta"]["field"] == "jumlah"
+    assert spesifikasi["encoding"]["color"]["field"] == "status"
+
+def test_sidik_jari_stabil():
+    assert grafik.sidik_jari("pie", (1, 2)) == grafik.sidik_jari("pie", (1, 2))
+    assert grafik.sidik_jari("pie", (1, 2)) != grafik.sidik_jari("pie", (2, 1))
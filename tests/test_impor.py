@@ -0,0 +1,104 @@
+# tests/test_impor.py
+import json
+
+import impor_tugas
+from conftest import buat_tugas
+
+def _tulis_csv(path, baris):
+    path.write_text("matkul,deskripsi,deadline,prioritas,status\n" + "".join(b + "\n" for b in baris), encoding="utf-8")
+    return str(path)
+
+def test_tambah_tugas_batch_per_chunk(manajer):
+    assert manajer.tambah_tugas_batch((buat_tugas(i) for i in range(25)), ukuran_chunk=10) == 25
+    assert manajer.hitung_total_tugas() == 25
+
+def test_dict_tidak_valid_dilaporkan_lewat_saat_gagal(manajer):
+    gagal = []
+    data = [buat_tugas(0), {"deskripsi": "x", "foo": 1}, buat_tugas(2)]
+    assert manajer.tambah_tugas_batch(data, saat_gagal=lambda i, item, e: gagal.append((i, item))) == 2
+    assert gagal == [(1, data[1])]
+
+def test_item_rusak_tidak_menghentikan_sisa_batch(manajer):
+    gagal = []
+    data = [buat_tugas(i) for i in range(8)]
+    data[3] = {"matkul": 5, "deskripsi": "x", "deadline": "2026-03-10", "prioritas": "Low", "status": "Pending"}
+    data[6] = "bukan tugas"
+    total = manajer.tambah_tugas_batch(data, ukuran_chunk=2,
+                                       saat_gagal=lambda i, item, e: gagal.append((i, type(e).__name__)))
+    assert total == 6 and manajer.hitung_total_tugas() == 6
+    assert gagal == [(3, "AttributeError"), (6, "TypeError")]
+
+def test_chunk_gagal_dicoba_per_baris(manajer):
+    with manajer.db.koneksi() as conn:
+        conn.execute("CREATE TRIGGER tolak BEFORE INSERT ON tugas_data WHEN NEW.deskripsi = 'Tugas nomor 3' "
+                     "BEGIN SELECT RAISE(ABORT, 'ditolak'); END")
+        conn.commit()
+    gagal = []
+    total = manajer.tambah_tugas_batch([buat_tugas(i) for i in range(8)], ukuran_chunk=5,
+                                       saat_gagal=lambda i, item, e: gagal.append((i, str(e))))
+    assert total == 7
+    assert gagal == [(3, "ditolak")]
+
+def test_tambah_tugas_batch_dari_dict(manajer):
+    data = [{"matkul": "PBO", "deskripsi": "Kuis", "deadline": "2026-03-01", "prioritas": "High", "status": "Pending"},
+            {"deskripsi": "x", "kolom_asing": 1},  # Tidak bisa menjadi Tugas, dilewati
+            buat_tugas(2)]
+    assert manajer.tambah_tugas_batch(data) == 2
+    assert sorted(t.deskripsi for t in manajer.get_semua_tugas_obj()) == ["Kuis", "Tugas nomor 2"]
+
+def test_impor_csv_mencatat_nomor_baris(manajer, tmp_path):
+    path = _tulis_csv(tmp_path / "a.csv", [
+        "PBO,Kuis 1,2026-03-01,High,Pending",
+        "PBO,,2026-03-01,High,Pending",
+        "PBO,Kuis 3,01-03-2026,High,Pending",
+        "PBO,Kuis 4,2026-03-01,Sangat,Pending",
+        "PBO,Kuis 5,2026-03-01,,",
+    ])
+    hasil = impor_tugas.impor_file(path, manajer)
+    assert (hasil.jumlah_dibaca, hasil.jumlah_berhasil, hasil.jumlah_gagal) == (5, 2, 3)
+    assert [nomor for nomor, _ in hasil.kesalahan] == [3, 4, 5]
+    assert manajer.get_dataframe_tugas()["prioritas"].astype(str).tolist() == ["High", "Medium"]
+
+def test_impor_baris_yang_ditolak_database_tercatat(manajer, tmp_path):
+    with manajer.db.koneksi() as conn:
+        conn.execute("CREATE TRIGGER tolak BEFORE INSERT ON tugas_data WHEN NEW.deskripsi LIKE 'RUSAK%' "
+                     "BEGIN SELECT RAISE(ABORT, 'ditolak'); END")
+        conn.commit()
+    path = _tulis_csv(tmp_path / "a.csv", [f"MK,{'RUSAK' if i in (2, 7) else 'ok'} {i},2026-03-01,High,Pending"
+                                           for i in range(12)])
+    hasil = impor_tugas.impor_file(path, manajer, ukuran_chunk=5)
+    assert (hasil.jumlah_berhasil, hasil.jumlah_gagal) == (10, 2)
+    assert [nomor for nomor, _ in hasil.kesalahan] == [4, 9]
+    assert all("ditolak" in pesan for _, pesan in hasil.kesalahan)
+
+def test_impor_ndjson(manajer, tmp_path):
+    path = tmp_path / "a.ndjson"
+    path.write_text(json.dumps({"matkul": "A", "deskripsi": "satu", "deadline": "2026-03-01"}) + "\n\n"
+                    + "{rusak\n"
+                    + json.dumps({"deskripsi": "dua", "deadline": "2026-03-02T10:00:00", "status": "Complete"}) + "\n",
+                    encoding="utf-8")
+    hasil = impor_tugas.impor_file(str(path), manajer)
+    assert (hasil.jumlah_dibaca, hasil.jumlah_berhasil) == (3, 2)
+    assert hasil.kesalahan[0][0] == 3
+
+def test_impor_ndjson_kolom_bukan_teks(manajer, tmp_path):
+    path = tmp_path / "a.ndjson"
+    baris = [{"matkul": "A", "deskripsi": 5, "deadline": "2026-03-01"},
+             {"matkul": 101, "deskripsi": "dua", "deadline": "2026-03-01"},
+             {"deskripsi": "tiga", "deadline": 20260301},
+             {"deskripsi": "empat", "deadline": "2026-03-01", "prioritas": ["High"]},
+             {"matkul": None, "deskripsi": "lima", "deadline": "2026-03-01"}]
+    path.write_text("".join(json.dumps(b) + "\n" for b in baris), encoding="utf-8")
+    hasil = impor_tugas.impor_file(str(path), manajer)
+    assert (hasil.jumlah_berhasil, hasil.jumlah_gagal) == (1, 4)
+    assert [nomor for nomor, _ in hasil.kesalahan] == [1, 2, 3, 4]
+    for (_, pesan), kolom in zip(hasil.kesalahan, ["deskripsi", "matkul", "deadline", "prioritas"]):
+        assert f"Kolom '{kolom}' harus berupa teks" in pesan
+    assert manajer.get_dataframe_tugas()["matkul"].tolist() == ["Umum"]
+
+def test_cli_exit_code(tmp_path, capsys):
+    bersih = _tulis_csv(tmp_path / "bersih.csv", ["PBO,Kuis,2026-03-01,High,Pending"])
+    assert impor_tugas.main([bersih]) == 0
+    kotor = _tulis_csv(tmp_path / "kotor.csv", ["PBO,,2026-03-01,High,Pending"])
+    assert impor_tugas.main([kotor]) == 1
+    assert "Baris 2:" in capsys.readouterr().out
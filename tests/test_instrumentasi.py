@@ -0,0 +1,78 @@
+# tests/test_instrumentasi.py
+import sqlite3
+
+import pytest
+
+import database
+import metrik
+from conftest import isi
+
+@pytest.fixture
+def peristiwa():
+    daftar = []
+    database.tambah_hook(daftar.append)
+    yield daftar
+    database.hapus_hook(daftar.append)
+
+def test_hook_menerima_peristiwa(basis_data, peristiwa):
+    basis_data.execute_query("INSERT INTO tugas (matkul, deskripsi, deadline, prioritas, status) VALUES (?, ?, ?, ?, ?)",
+                             ("A", "B", "2026-03-10", "Low", "Pending"))
+    assert basis_data.fetch_query("SELECT * FROM tugas")
+    operasi = [p.operasi for p in peristiwa]
+    assert "INSERT" in operasi and "SELECT" in operasi
+    p = next(p for p in peristiwa if p.operasi == "SELECT")
+    assert p.jumlah_baris == 1 and p.error is None and p.durasi >= 0
+
+def test_hook_mencatat_error(basis_data, peristiwa):
+    assert basis_data.fetch_query("SELECT * FROM tabel_tidak_ada") is None
+    assert isinstance(peristiwa[-1].error, sqlite3.OperationalError)
+
+def test_hook_yang_gagal_tidak_merusak_query(basis_data, peristiwa):
+    def rusak(p):
+        raise RuntimeError("hook rusak")
+    database.tambah_hook(rusak)
+    try:
+        assert basis_data.fetch_query("SELECT 1 AS satu")[0]["satu"] == 1
+    finally:
+        database.hapus_hook(rusak)
+
+def test_iter_baris_melapor_sekali(basis_data, peristiwa):
+    from manajer_tugas import ManajerTugas
+    isi(ManajerTugas(basis_data=basis_data), 7)
+    peristiwa.clear()
+    with basis_data.koneksi() as conn:
+        chunk = list(database.iter_baris(conn, "SELECT id FROM tugas", ukuran_chunk=3))
+    assert [len(c) for c in chunk] == [3, 3, 1]
+    assert len(peristiwa) == 1 and peristiwa[0].jumlah_baris == 7
+
+def test_log_query_lambat_dengan_rencana(basis_data, monkeypatch):
+    database.kosongkan_query_lambat()
+    monkeypatch.setattr(database, "ambang_query_lambat_ms", 0)
+    basis_data.fetch_query("SELECT * FROM tugas WHERE deadline >= ?", ("2026-01-01",))
+    entri = database.query_lambat()[0]
+    assert entri["operasi"] == "SELECT" and entri["params"] == ("2026-01-01",)
+    assert entri["rencana"] and all(isinstance(baris, str) for baris in entri["rencana"])
+    database.kosongkan_query_lambat()
+    assert database.query_lambat() == []
+
+def test_metrik_query_dan_ekspor_prometheus(basis_data):
+    counter = metrik.registri.cari("todolist_query_total")
+    sebelum = counter.nilai(operasi="SELECT", status="ok")
+    basis_data.fetch_query("SELECT 1")
+    assert counter.nilai(operasi="SELECT", status="ok") == sebelum + 1
+    teks = metrik.registri.ekspor_prometheus()
+    assert "# TYPE todolist_query_total counter" in teks
+    assert 'todolist_query_durasi_detik_bucket{operasi="SELECT",le="+Inf"}' in teks
+
+def test_registri_metrik():
+    registri = metrik.RegistriMetrik()
+    assert registri.counter("a", "A") is registri.counter("a", "A")
+    with pytest.raises(ValueError):
+        registri.gauge("a", "A")
+    h = registri.histogram("durasi", "D", batas=(0.1, 1.0))
+    h.amati(0.05, op="x")
+    h.amati(0.5, op="x")
+    assert h.ringkas(op="x") == (2, 0.55)
+    teks = registri.ekspor_prometheus()
+    assert 'durasi_bucket{op="x",le="0.1"} 1' in teks and 'durasi_bucket{op="x",le="+Inf"} 2' in teks
+    assert registri.gauge("g", "G", fungsi=lambda: 3).sampel() == [("g", (), 3)]
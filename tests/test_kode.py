@@ -0,0 +1,69 @@
+# tests/test_kode.py
+import sqlite3
+
+import pytest
+
+import migrasi
+from conftest import buat_tugas, isi, TANGGAL
+from konfigurasi import DAFTAR_PRIORITAS, STATUS_TUGAS
+from model import nomor_hari
+
+def test_tabel_kode_mengikuti_urutan_konfigurasi(basis_data):
+    with basis_data.koneksi() as conn:
+        assert [r[0] for r in conn.execute("SELECT nama FROM prioritas_tugas ORDER BY kode")] == DAFTAR_PRIORITAS
+        assert [r[0] for r in conn.execute("SELECT nama FROM status_tugas ORDER BY kode")] == STATUS_TUGAS
+
+def test_baris_disimpan_berkode(manajer):
+    id_tugas = isi(manajer, 1, prioritas="Urgent", status="In Progress")[0]
+    with manajer.db.koneksi() as conn:
+        row = conn.execute("SELECT hari, kode_prioritas, kode_status FROM tugas_data WHERE id = ?", (id_tugas,)).fetchone()
+        assert tuple(row) == (nomor_hari(TANGGAL), 1, 1)
+        view = conn.execute("SELECT deadline, prioritas, status FROM tugas WHERE id = ?", (id_tugas,)).fetchone()
+        assert tuple(view) == (TANGGAL.isoformat(), "Urgent", "In Progress")
+
+def test_kode_tidak_dikenal_ditolak(manajer):
+    assert not manajer.tambah_tugas(buat_tugas(status="Tidak Ada"))
+    with manajer.db.koneksi() as conn:
+        with pytest.raises(sqlite3.IntegrityError):
+            with conn:
+                conn.execute("INSERT INTO tugas_data (matkul, deskripsi, hari, kode_prioritas, kode_status) "
+                             "VALUES ('A', 'B', 0, 99, 1)")
+        assert conn.execute("SELECT COUNT(*) FROM tugas_data").fetchone()[0] == 0
+
+def test_tulis_lewat_view(manajer):
+    with manajer.db.koneksi() as conn:
+        with conn:
+            conn.execute("INSERT INTO tugas (matkul, deskripsi, deadline, prioritas, status) "
+                         "VALUES ('A', 'B', '2026-03-10', 'Low', 'Pending')")
+            conn.execute("UPDATE tugas SET status = 'Complete', deadline = '2026-03-12' WHERE matkul = 'A'")
+        row = conn.execute("SELECT deadline, prioritas, status FROM tugas").fetchone()
+        assert (str(row[0]), row[1], row[2]) == ("2026-03-12", "Low", "Complete")
+        with conn:
+            conn.execute("DELETE FROM tugas WHERE matkul = 'A'")
+        assert conn.execute("SELECT COUNT(*) FROM tugas_data").fetchone()[0] == 0
+
+def test_filter_nilai_tidak_dikenal_tidak_cocok(manajer):
+    isi(manajer, 2)
+    assert manajer.get_dataframe_tugas(status_filter="Tidak Ada").empty
+    assert manajer.hitung_total_tugas() == 2
+
+def test_sinkronkan_kode_menambah_nilai_baru(manajer, monkeypatch):
+    monkeypatch.setitem(migrasi.TABEL_KODE, "status_tugas", STATUS_TUGAS + ["Ditunda"])
+    with manajer.db.koneksi() as conn:
+        assert migrasi.sinkronkan_kode(conn) == 1
+        assert migrasi.sinkronkan_kode(conn) == 0
+        assert conn.execute("SELECT kode FROM status_tugas WHERE nama = 'Ditunda'").fetchone()[0] == len(STATUS_TUGAS) + 1
+    assert manajer.tambah_tugas(buat_tugas(status="Ditunda"))
+    assert manajer.get_dataframe_tugas(status_filter="Ditunda")["status"].tolist() == ["Ditunda"]
+
+def test_urutan_prioritas_disinkronkan_ulang_dari_konfigurasi(manajer, monkeypatch):
+    isi(manajer, 1, prioritas="Urgent")
+    isi(manajer, 1, prioritas="Low")
+    assert manajer.berikutnya(2, dari=TANGGAL)["prioritas"].tolist() == ["Urgent", "Low"]
+    monkeypatch.setitem(migrasi.TABEL_KODE, "prioritas_tugas", list(reversed(DAFTAR_PRIORITAS)))
+    with manajer.db.koneksi() as conn:
+        assert migrasi.sinkronkan_kode(conn) == 0  # Tidak ada kode baru, hanya urutan yang berubah
+        kode = dict(conn.execute("SELECT nama, kode FROM prioritas_tugas").fetchall())
+    assert kode["Urgent"] == 1  # Kode yang dirujuk tugas_data tetap
+    manajer.kosongkan_cache()
+    assert manajer.berikutnya(2, dari=TANGGAL)["prioritas"].tolist() == ["Low", "Urgent"]
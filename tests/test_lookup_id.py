@@ -0,0 +1,48 @@
+# tests/test_lookup_id.py
+from conftest import buat_tugas, isi
+from model import Tugas
+
+def test_get_tugas_lewat_id(manajer):
+    ids = isi(manajer, 5)
+    tugas = manajer.get_tugas(ids[2])
+    assert tugas.id == ids[2] and tugas.deskripsi == "Tugas nomor 2"
+    assert manajer.get_tugas(999999) is None
+
+def test_peta_identitas_menyimpan_objek(manajer):
+    id_tugas = isi(manajer, 1)[0]
+    assert manajer.get_tugas(id_tugas) is manajer.get_tugas(id_tugas)
+
+def test_update_membuang_entri_peta(manajer):
+    id_tugas = isi(manajer, 1)[0]
+    lama = manajer.get_tugas(id_tugas)
+    assert manajer.update_tugas(Tugas(lama.matkul, "Sudah diubah", lama.deadline, "High", "In Progress", id_tugas))
+    baru = manajer.get_tugas(id_tugas)
+    assert baru is not lama
+    assert (baru.deskripsi, baru.prioritas, baru.status) == ("Sudah diubah", "High", "In Progress")
+
+def test_hapus_dan_tandai_selesai_membuang_entri_peta(manajer):
+    a, b = isi(manajer, 2)
+    manajer.get_tugas(a), manajer.get_tugas(b)
+    assert manajer.tandai_selesai(a)
+    assert manajer.get_tugas(a).status == "Complete"
+    assert manajer.hapus_tugas(b)
+    assert manajer.get_tugas(b) is None
+    assert not manajer.hapus_tugas(b)
+
+def test_get_tugas_many(manajer):
+    ids = isi(manajer, 4)
+    manajer.get_tugas(ids[0])  # Sebagian dari peta, sebagian dari database
+    hasil = manajer.get_tugas_many([ids[3], ids[0], 123456, ids[3]])
+    assert set(hasil) == {ids[0], ids[3]}
+    assert hasil[ids[3]].deskripsi == "Tugas nomor 3"
+
+def test_peta_identitas_dibatasi(basis_data):
+    from manajer_tugas import ManajerTugas
+    manajer = ManajerTugas(ukuran_peta_identitas=2, basis_data=basis_data)
+    ids = isi(manajer, 3)
+    for id_tugas in ids:
+        manajer.get_tugas(id_tugas)
+    assert list(manajer._peta_identitas) == ids[1:]
+
+def test_tambah_tugas_tidak_valid(manajer):
+    assert not manajer.tambah_tugas(buat_tugas(status="Tidak Ada"))
@@ -0,0 +1,94 @@
+# tests/test_migrasi.py
+import datetime
+import sqlite3
+
+import database
+import migrasi
+from conftest import buat_tugas
+from manajer_tugas import ManajerTugas
+
+def _koneksi(tmp_path) -> sqlite3.Connection:
+    return database.get_db_connection(str(tmp_path / "m.db"))
+
+def test_database_baru_sampai_versi_terbaru(tmp_path):
+    conn = _koneksi(tmp_path)
+    assert migrasi.versi_skema(conn) == 0
+    assert migrasi.jalankan_migrasi(conn) == migrasi.VERSI_TERBARU
+    assert migrasi.jalankan_migrasi(conn) == migrasi.VERSI_TERBARU  # Idempoten
+    indeks = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_tugas_data_status_prioritas_hari", "idx_tugas_data_hari_id", "idx_tugas_data_status_hari"} <= indeks
+    conn.close()
+
+def test_data_versi_1_terbawa_sampai_versi_terbaru(tmp_path, monkeypatch):
+    conn = _koneksi(tmp_path)
+    monkeypatch.setattr(migrasi, "MIGRASI", migrasi.MIGRASI[:1])
+    assert migrasi.jalankan_migrasi(conn) == 1
+    with conn:
+        conn.executemany("INSERT INTO tugas (matkul, deskripsi, deadline, prioritas, status) VALUES (?, ?, ?, ?, ?)",
+                         [("Jarkom", "Laporan praktikum", "2026-03-01", "High", "Pending"),
+                          ("PBO", "Kuis", "2026-03-05", "Low", "Complete")])
+    monkeypatch.undo()
+    assert migrasi.jalankan_migrasi(conn) == migrasi.VERSI_TERBARU
+    rows = conn.execute("SELECT matkul, deskripsi, deadline, prioritas, status FROM tugas ORDER BY id").fetchall()
+    assert [tuple(r) for r in rows] == [("Jarkom", "Laporan praktikum", "2026-03-01", "High", "Pending"),
+                                        ("PBO", "Kuis", "2026-03-05", "Low", "Complete")]
+    assert conn.execute("SELECT SUM(jumlah) FROM rekap_harian").fetchone()[0] == 2
+    assert conn.execute("SELECT rowid FROM tugas_fts WHERE tugas_fts MATCH 'laporan'").fetchall()[0][0] == 1
+    # ID baru melanjutkan urutan lama, bukan memakai ulang ID
+    with conn:
+        conn.execute("INSERT INTO tugas (matkul, deskripsi, deadline, prioritas, status) "
+                     "VALUES ('X', 'Y', '2026-04-01', 'Medium', 'Pending')")
+    assert conn.execute("SELECT MAX(id) FROM tugas").fetchone()[0] == 3
+    conn.close()
+
+def test_deadline_lama_rusak_dikarantina(tmp_path, monkeypatch):
+    conn = _koneksi(tmp_path)
+    monkeypatch.setattr(migrasi, "MIGRASI", migrasi.MIGRASI[:8])
+    assert migrasi.jalankan_migrasi(conn) == 8
+    with conn:
+        conn.executemany("INSERT INTO tugas (matkul, deskripsi, deadline, prioritas, status) VALUES (?, ?, ?, ?, ?)",
+                         [("Jarkom", "Laporan", "2026-03-01", "High", "Pending"),
+                          ("PBO", "Kuis", "besok", "Low", "Pending"),
+                          ("Basdat", "ERD", "2026-03-05 23:59", "Low", "Pending")])
+        conn.execute("INSERT INTO tugas_arsip (id, matkul, deskripsi, deadline, prioritas, status) "
+                     "VALUES (10, 'Kalkulus', 'PR', '', 'Low', 'Complete')")
+    monkeypatch.undo()
+    assert migrasi.jalankan_migrasi(conn) == migrasi.VERSI_TERBARU
+    rows = conn.execute("SELECT matkul, deadline FROM tugas ORDER BY id").fetchall()
+    assert [tuple(r) for r in rows] == [("Jarkom", "2026-03-01"), ("Basdat", "2026-03-05")]
+    karantina = conn.execute("SELECT id, asal, deadline FROM tugas_karantina ORDER BY id").fetchall()
+    assert [tuple(r) for r in karantina] == [(2, "tugas", "besok"), (10, "tugas_arsip", "")]
+    rekap = conn.execute("SELECT tanggal, jumlah FROM rekap_harian ORDER BY tanggal").fetchall()
+    assert [tuple(r) for r in rekap] == [("2026-03-01", 1), ("2026-03-05", 1)]
+    conn.close()
+
+def test_migrasi_gagal_dirollback(tmp_path, monkeypatch):
+    conn = _koneksi(tmp_path)
+    monkeypatch.setattr(migrasi, "MIGRASI", migrasi.MIGRASI[:1] + [(2, "rusak", ["CREATE TABLE a (x)", "SINTAKS SALAH"])])
+    try:
+        migrasi.jalankan_migrasi(conn)
+    except sqlite3.Error:
+        pass
+    assert migrasi.versi_skema(conn) == 1
+    assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'a'").fetchone() is None
+    conn.close()
+
+def test_filter_tanggal_memakai_indeks(manajer):
+    where_sql = "SELECT id FROM tugas_data WHERE hari >= ? AND hari < ?"
+    with manajer.db.koneksi() as conn:
+        rencana = " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + where_sql, (1, 2)))
+    assert rencana.startswith("SEARCH tugas_data USING") and "INDEX" in rencana
+
+def test_filter_tanggal_tidak_ikut_hari_berikutnya(manajer):
+    hari = datetime.date(2026, 3, 10)
+    for deadline in (hari - datetime.timedelta(days=1), hari, hari + datetime.timedelta(days=1)):
+        manajer.tambah_tugas(buat_tugas(deadline=deadline))
+    df = manajer.get_dataframe_tugas(tanggal=hari)
+    assert len(df) == 1 and df["deadline"].iloc[0].date() == hari
+
+def test_setup_sekali_per_database(basis_data, monkeypatch):
+    assert basis_data.skema_siap
+    dipanggil = []
+    monkeypatch.setattr(basis_data, "setup_database_initial", lambda: dipanggil.append(1) or True)
+    ManajerTugas(basis_data=basis_data)
+    assert dipanggil == []
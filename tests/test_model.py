@@ -0,0 +1,51 @@
+# tests/test_model.py
+import datetime
+
+import pytest
+
+from conftest import buat_tugas, isi, TANGGAL
+from model import Tugas, TugasBatch, nomor_hari
+
+def test_tugas_tanpa_dict():
+    tugas = buat_tugas()
+    assert not hasattr(tugas, "__dict__")
+    with pytest.raises(AttributeError):
+        tugas.lainnya = 1
+
+def test_konstruktor_default_dan_validasi():
+    tugas = Tugas("  Basis Data ", "", "2026-03-10", "", "")
+    assert (tugas.matkul, tugas.deskripsi, tugas.deadline) == ("Basis Data", "Tanpa Deskripsi", TANGGAL)
+    assert (tugas.prioritas, tugas.status) == ("Medium", "Pending")
+    assert Tugas("A", "B", "10/03/2026", "Low", "Pending").deadline == datetime.date.today()
+
+def test_dari_db_sama_dengan_konstruktor():
+    cepat = Tugas.dari_db(7, "Basis Data", "Tugas nomor 0", "2026-03-10", "Medium", "Pending")
+    biasa = Tugas("Basis Data", "Tugas nomor 0", TANGGAL, "Medium", "Pending", 7)
+    assert all(getattr(cepat, a) == getattr(biasa, a) for a in Tugas.__slots__)
+    assert Tugas.dari_db(7, "A", "B", TANGGAL, "Low", "Pending").deadline is TANGGAL
+
+def test_nomor_hari():
+    assert nomor_hari(datetime.date(1970, 1, 1)) == 0
+    assert nomor_hari(datetime.date(1970, 1, 31)) == 30
+
+def test_tugas_batch_kolom_dan_akses_baris():
+    batch = TugasBatch.dari_rows([
+        (1, "A", "satu", "2026-03-10", "High", "Pending"),
+        (2, "B", "dua", TANGGAL, "Urgent", "Ditunda"),  # Nilai di luar konfigurasi tetap disimpan
+    ])
+    assert len(batch) == 2
+    assert batch.deadline[0] == TANGGAL.toordinal()
+    assert batch.kode_prioritas[batch.prioritas[1]] == "Urgent"
+    assert batch.kode_status[batch.status[1]] == "Ditunda"
+    kedua = batch[1]
+    assert (kedua.id, kedua.deskripsi, kedua.deadline, kedua.prioritas, kedua.status) == (
+        2, "dua", TANGGAL, "Urgent", "Ditunda")
+    assert [t.id for t in batch] == [1, 2]
+
+def test_get_tugas_batch_dari_database(manajer):
+    ids = isi(manajer, 5, prioritas="High")
+    batch = manajer.get_tugas_batch(ukuran_chunk=2)
+    assert isinstance(batch, TugasBatch)
+    assert sorted(batch.id) == ids
+    assert {t.prioritas for t in batch} == {"High"}
+    assert manajer.get_semua_tugas_obj()[0].deadline == TANGGAL
@@ -0,0 +1,65 @@
+# tests/test_operasi_massal.py
+import datetime
+
+from conftest import buat_tugas, isi
+from model import Tugas
+
+def status_semua(manajer) -> dict[int, str]:
+    with manajer.db.koneksi() as conn:
+        return dict(conn.execute("SELECT id, status FROM tugas"))
+
+def test_tandai_selesai_banyak(manajer):
+    ids = isi(manajer, 4)
+    hasil = manajer.tandai_selesai_banyak([ids[0], ids[2], ids[2], 999999])
+    assert hasil == {ids[0]: True, ids[2]: True, 999999: False}
+    status = status_semua(manajer)
+    assert [status[i] for i in ids] == ["Complete", "Pending", "Complete", "Pending"]
+
+def test_hapus_banyak_melewati_batas_parameter_in(manajer):
+    ids = isi(manajer, 1200)
+    hasil = manajer.hapus_banyak(ids[:1100])
+    assert all(hasil.values()) and len(hasil) == 1100
+    assert sorted(status_semua(manajer)) == ids[1100:]
+
+def test_operasi_massal_membuang_peta_dan_cache(manajer):
+    ids = isi(manajer, 2)
+    manajer.get_tugas(ids[0])
+    total = manajer.hitung_total_tugas()
+    manajer.hapus_banyak([ids[0]])
+    assert manajer.get_tugas(ids[0]) is None
+    assert manajer.hitung_total_tugas() == total - 1
+
+def test_update_banyak(manajer):
+    a, b = isi(manajer, 2)
+    hasil = manajer.update_banyak([
+        Tugas("Statistika", "Diubah", datetime.date(2026, 4, 1), "High", "In Progress", a),
+        Tugas("X", "Tidak ada", datetime.date(2026, 4, 1), "Low", "Pending", 999999),
+        buat_tugas(5),  # Tanpa ID dilewati
+    ])
+    assert hasil == {a: True, 999999: False}
+    tugas = manajer.get_tugas(a)
+    assert (tugas.matkul, tugas.deskripsi, tugas.deadline, tugas.status) == (
+        "Statistika", "Diubah", datetime.date(2026, 4, 1), "In Progress")
+    assert manajer.get_tugas(b).deskripsi == "Tugas nomor 1"
+
+def test_update_banyak_atomik(manajer):
+    a, b = isi(manajer, 2)
+    hasil = manajer.update_banyak([
+        Tugas("Statistika", "Diubah", datetime.date(2026, 4, 1), "High", "In Progress", a),
+        Tugas("Statistika", "Status asing", datetime.date(2026, 4, 1), "High", "Tidak Dikenal", b),
+    ])
+    assert hasil == {a: False, b: False}
+    assert manajer.get_tugas(a).deskripsi == "Tugas nomor 0"  # Baris pertama ikut dibatalkan
+
+def test_ubah_status_dengan_filter(manajer):
+    lama = isi(manajer, 3, deadline=datetime.date(2026, 1, 5), prioritas="Low")
+    baru = isi(manajer, 2, deadline=datetime.date(2026, 6, 1), prioritas="Low")
+    isi(manajer, 2, deadline=datetime.date(2026, 1, 5), prioritas="High")
+    manajer.tandai_selesai(lama[0])
+    diubah = manajer.ubah_status_dengan_filter("Complete", {"prioritas_filter": "Low"},
+                                               sebelum=datetime.date(2026, 2, 1))
+    assert sorted(diubah) == lama[1:]  # Yang sudah Complete tidak dihitung
+    status = status_semua(manajer)
+    assert all(status[i] == "Pending" for i in baru)
+    assert manajer.ubah_status_dengan_filter("Complete", {"prioritas_filter": "Low"},
+                                             sebelum=datetime.date(2026, 2, 1)) == []
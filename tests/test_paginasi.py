@@ -0,0 +1,68 @@
+# tests/test_paginasi.py
+import datetime
+import types
+
+import manajer_tugas
+from conftest import TANGGAL, buat_tugas, isi
+
+def _isi_acak(manajer, jumlah=23):
+    # Deadline berulang agar urutan sekunder (id) ikut diuji
+    tugas = [buat_tugas(i, deadline=TANGGAL + datetime.timedelta(days=(i * 7) % 5),
+                        status="Complete" if i % 3 == 0 else "Pending") for i in range(jumlah)]
+    manajer.tambah_tugas_batch(tugas)
+    df = manajer.get_dataframe_tugas()
+    return list(zip(df["deadline"], df["id"]))
+
+def test_maju_melewati_semua_halaman(manajer):
+    urutan = _isi_acak(manajer)
+    assert urutan == sorted(urutan)
+    dilihat, halaman = [], manajer.get_halaman_tugas(ukuran=5)
+    assert not halaman.ada_sebelumnya
+    while True:
+        dilihat += halaman.data["id"].tolist()
+        if not halaman.ada_berikutnya:
+            break
+        halaman = manajer.get_halaman_tugas(setelah=halaman.kunci_akhir, ukuran=5)
+    assert dilihat == [id_tugas for _, id_tugas in urutan]
+
+def test_mundur_kembali_ke_halaman_sebelumnya(manajer):
+    _isi_acak(manajer)
+    pertama = manajer.get_halaman_tugas(ukuran=5)
+    kedua = manajer.get_halaman_tugas(setelah=pertama.kunci_akhir, ukuran=5)
+    kembali = manajer.get_halaman_tugas(sebelum=kedua.kunci_awal, ukuran=5)
+    assert kembali.data["id"].tolist() == pertama.data["id"].tolist()
+    assert not kembali.ada_sebelumnya and kembali.ada_berikutnya
+
+def test_halaman_dengan_filter_status(manajer):
+    urutan = _isi_acak(manajer)
+    semua = manajer.get_dataframe_tugas(status_filter="Complete")["id"].tolist()
+    halaman = manajer.get_halaman_tugas(status_filter="Complete", ukuran=3)
+    berikut = manajer.get_halaman_tugas(status_filter="Complete", setelah=halaman.kunci_akhir, ukuran=3)
+    assert halaman.data["id"].tolist() + berikut.data["id"].tolist() == semua[:6]
+    assert len(semua) < len(urutan)
+
+def test_tugas_baru_muncul_di_halaman(manajer):
+    _isi_acak(manajer, 3)
+    manajer.get_halaman_tugas(ukuran=5)
+    manajer.tambah_tugas(buat_tugas(99, deadline=TANGGAL - datetime.timedelta(days=1)))
+    halaman = manajer.get_halaman_tugas(ukuran=5)
+    assert halaman.data["deskripsi"].iloc[0] == "Tugas nomor 99"
+
+def test_kunci_halaman_kosong(manajer):
+    halaman = manajer.get_halaman_tugas()
+    assert halaman.data.empty and halaman.kunci_akhir is None and not halaman.ada_berikutnya
+
+def test_halaman_terlambat_mengikuti_tanggal_hari_ini(manajer, monkeypatch):
+    isi(manajer, 2)  # Deadline TANGGAL, status Pending
+    hari_ini = [TANGGAL - datetime.timedelta(days=1)]
+
+    class TanggalPalsu(datetime.date):
+        @classmethod
+        def today(cls):
+            return hari_ini[0]
+    monkeypatch.setattr(manajer_tugas, "datetime",
+                        types.SimpleNamespace(date=TanggalPalsu, timedelta=datetime.timedelta,
+                                              datetime=datetime.datetime))
+    assert manajer.get_halaman_tugas(terlambat=True).data.empty
+    hari_ini[0] = TANGGAL + datetime.timedelta(days=1)  # Tanpa penulisan apa pun di antaranya
+    assert len(manajer.get_halaman_tugas(terlambat=True).data) == 2
@@ -0,0 +1,102 @@
+# tests/test_perubahan.py
+import datetime
+import sqlite3
+import types
+
+import manajer_tugas
+from conftest import buat_tugas, isi, TANGGAL
+from model import Tugas
+
+def test_seq_dan_delta(manajer):
+    a, b, c = isi(manajer, 3)
+    seq = manajer.seq_terakhir()
+    assert seq > 0 and manajer.perubahan_sejak(seq).kosong
+    manajer.tandai_selesai(a)
+    manajer.hapus_tugas(b)
+    delta = manajer.perubahan_sejak(seq)
+    assert delta.diubah["id"].tolist() == [a] and delta.dibuang == [b]
+    assert delta.seq_akhir == manajer.seq_terakhir()
+
+def test_delta_membuang_baris_yang_tidak_lagi_cocok_filter(manajer):
+    a, b = isi(manajer, 2)
+    seq = manajer.seq_terakhir()
+    manajer.tandai_selesai(a)
+    delta = manajer.perubahan_sejak(seq, {"status_filter": "Pending"})
+    assert delta.dibuang == [a] and delta.diubah.empty
+
+def test_terapkan_sama_dengan_muat_penuh(manajer_tanpa_cache):
+    m = manajer_tanpa_cache
+    ids = isi(m, 5)
+    awal = m.get_dataframe_tugas(status_filter="Pending")
+    seq = m.seq_terakhir()
+    m.tandai_selesai(ids[1])
+    m.hapus_tugas(ids[3])
+    m.tambah_tugas(buat_tugas(9, deadline=TANGGAL - datetime.timedelta(days=1)))
+    lama = m.get_tugas(ids[0])
+    m.update_tugas(Tugas(lama.matkul, "Diubah", lama.deadline, lama.prioritas, lama.status, lama.id))
+    hasil = m.perubahan_sejak(seq, {"status_filter": "Pending"}).terapkan(awal)
+    penuh = m.get_dataframe_tugas(status_filter="Pending")
+    assert hasil.reset_index(drop=True).equals(penuh.reset_index(drop=True))
+
+def test_delta_setelah_kompaksi_minta_muat_ulang(manajer):
+    isi(manajer, 3)
+    seq = manajer.seq_terakhir()
+    isi(manajer, 3)
+    assert manajer.kompaksi_perubahan(sisakan=1) > 0
+    assert manajer.perubahan_sejak(0).perlu_muat_ulang
+    assert manajer.perubahan_sejak(seq, batas=2).perlu_muat_ulang
+
+def test_refresh_inkremental_membaca_delta_saja(manajer, monkeypatch):
+    ids = isi(manajer, 4)
+    assert len(manajer.get_dataframe_tugas()) == 4
+    muat_penuh = []
+    monkeypatch.setattr(manajer, "_muat_dataframe", lambda *a: muat_penuh.append(a))
+    manajer.tandai_selesai(ids[0])
+    manajer.tambah_tugas(buat_tugas(9))
+    df = manajer.get_dataframe_tugas()
+    assert len(df) == 5 and df.set_index("id").loc[ids[0], "status"] == "Complete"
+    assert muat_penuh == []
+
+def test_terlambat_mengikuti_tanggal_hari_ini(manajer, monkeypatch):
+    isi(manajer, 2)  # Deadline TANGGAL, status Pending
+    hari_ini = [TANGGAL - datetime.timedelta(days=1)]
+
+    class TanggalPalsu(datetime.date):
+        @classmethod
+        def today(cls):
+            return hari_ini[0]
+    monkeypatch.setattr(manajer_tugas, "datetime",
+                        types.SimpleNamespace(date=TanggalPalsu, timedelta=datetime.timedelta,
+                                              datetime=datetime.datetime))
+    assert manajer.get_dataframe_tugas(terlambat=True).empty
+    hari_ini[0] = TANGGAL + datetime.timedelta(days=1)  # Tanpa penulisan apa pun di antaranya
+    assert len(manajer.get_dataframe_tugas(terlambat=True)) == 2
+
+def test_baca_gagal_mengembalikan_dataframe_kosong_tanpa_disimpan(manajer, monkeypatch):
+    isi(manajer, 3)
+    monkeypatch.setattr(manajer, "seq_terakhir", lambda: (_ for _ in ()).throw(TimeoutError("pool penuh")))
+    assert manajer.get_dataframe_tugas().empty
+    monkeypatch.undo()
+
+    def rusak(*a, **kw):
+        raise sqlite3.OperationalError("disk I/O error")
+    monkeypatch.setattr(manajer, "_muat_dataframe", rusak)
+    assert manajer.get_dataframe_tugas().empty
+    assert not manajer._df_seq
+    monkeypatch.undo()
+    assert len(manajer.get_dataframe_tugas()) == 3
+
+def test_muat_ulang_gagal_tidak_menimpa_entri_lama(manajer, monkeypatch):
+    isi(manajer, 3)
+    assert len(manajer.get_dataframe_tugas()) == 3
+    entri = dict(manajer._df_seq)
+    isi(manajer, 2)
+    manajer.kompaksi_perubahan(sisakan=0)  # Delta tidak tersedia lagi: perlu muat ulang dari file
+
+    def rusak(*a, **kw):
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(manajer, "_muat_dataframe", rusak)
+    assert manajer.get_dataframe_tugas().empty
+    assert manajer._df_seq == entri
+    monkeypatch.undo()
+    assert len(manajer.get_dataframe_tugas()) == 5
@@ -0,0 +1,98 @@
+# tests/test_pool.py
+import sqlite3
+import threading
+
+import pytest
+
+import database
+from conftest import buat_tugas
+
+def test_pragma_wal_dan_incremental_vacuum(basis_data):
+    with basis_data.koneksi() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+def test_koneksi_dipakai_ulang(basis_data):
+    with basis_data.koneksi() as pertama:
+        pass
+    with basis_data.koneksi() as kedua:
+        assert kedua is pertama
+    assert basis_data.pool.statistik() == {"ukuran": 3, "dibuat": 1, "menganggur": 1}
+
+def test_pool_penuh_timeout(tmp_path):
+    pool = database.PoolKoneksi(str(tmp_path / "a.db"), ukuran=1, timeout=0.05)
+    conn = pool.pinjam()
+    with pytest.raises(TimeoutError):
+        pool.pinjam()
+    pool.kembalikan(conn)
+    assert pool.pinjam() is conn
+    pool.tutup()
+
+def test_ukuran_pool_minimal_satu(tmp_path):
+    with pytest.raises(ValueError):
+        database.PoolKoneksi(str(tmp_path / "a.db"), ukuran=0)
+
+def test_transaksi_terbuka_dirollback_saat_dikembalikan(basis_data):
+    with basis_data.koneksi() as conn:
+        conn.execute("CREATE TABLE t (x)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+        assert conn.in_transaction
+    with basis_data.koneksi() as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+def test_koneksi_rusak_diganti(basis_data):
+    with basis_data.koneksi() as conn:
+        conn.close()
+    with basis_data.koneksi() as baru:
+        assert baru is not conn
+        assert baru.execute("SELECT 1").fetchone()[0] == 1
+
+def test_pool_ditutup(tmp_path):
+    pool = database.PoolKoneksi(str(tmp_path / "a.db"), ukuran=2)
+    with pool.koneksi():
+        pass
+    pool.tutup()
+    assert pool.statistik()["dibuat"] == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        pool.pinjam()
+
+def test_banyak_thread_tidak_melebihi_ukuran(basis_data):
+    error = []
+
+    def kerja():
+        try:
+            for _ in range(20):
+                with basis_data.koneksi() as conn:
+                    conn.execute("SELECT 1").fetchone()
+        except Exception as e:  # pragma: no cover - dilaporkan lewat assert
+            error.append(e)
+
+    thread = [threading.Thread(target=kerja) for _ in range(8)]
+    for t in thread:
+        t.start()
+    for t in thread:
+        t.join()
+    assert not error
+    assert basis_data.pool.statistik()["dibuat"] <= basis_data.pool.ukuran
+
+def test_fungsi_modul_memakai_database_utama(db_utama):
+    assert database.setup_database_initial()
+    assert database.get_pool().db_path == db_utama
+    id_baru = database.execute_query("INSERT INTO tugas_data (matkul, deskripsi, hari, kode_prioritas, kode_status) "
+                                     "VALUES ('A', 'B', 20000, 1, 1)")
+    assert database.fetch_query("SELECT deskripsi FROM tugas WHERE id = ?", (id_baru,), fetch_all=False)[0] == "B"
+    assert database.execute_query("INSERT INTO tabel_tidak_ada VALUES (1)") is None
+
+def test_crud_manajer_lewat_pool(manajer):
+    assert manajer.tambah_tugas(buat_tugas(1))
+    id_tugas = manajer.get_semua_tugas_obj()[0].id
+    assert manajer.tandai_selesai(id_tugas)
+    assert manajer.hitung_total_tugas() == 1
+    assert manajer.hapus_tugas(id_tugas)
+    assert not manajer.hapus_tugas(id_tugas)
+    assert manajer.db.execute_query("INSERT INTO tabel_tidak_ada VALUES (1)") is None
@@ -0,0 +1,50 @@
+# tests/test_rekap_harian.py
+import datetime
+
+import rekap_harian
+from conftest import TANGGAL, buat_tugas, isi
+from model import Tugas
+
+def _rekap(manajer):
+    with manajer.db.koneksi() as conn:
+        return {(r[0], r[1], r[2]): r[3] for r in conn.execute("SELECT tanggal, status, prioritas, jumlah FROM rekap_harian")}
+
+def _cocok(manajer):
+    with manajer.db.koneksi() as conn:
+        return rekap_harian.verifikasi(conn) == []
+
+def test_trigger_menjaga_rekap(manajer):
+    a, b, c = isi(manajer, 3)
+    assert _rekap(manajer) == {("2026-03-10", "Pending", "Medium"): 3}
+    manajer.tandai_selesai(a)
+    manajer.update_tugas(Tugas("MK", "pindah", TANGGAL + datetime.timedelta(days=1), "High", "Pending", b))
+    manajer.hapus_tugas(c)
+    assert _rekap(manajer) == {("2026-03-10", "Complete", "Medium"): 1, ("2026-03-11", "Pending", "High"): 1}
+    assert _cocok(manajer)
+
+def test_baris_rekap_nol_dihapus(manajer):
+    (a,) = isi(manajer, 1)
+    manajer.hapus_tugas(a)
+    assert _rekap(manajer) == {}
+
+def test_operasi_massal_tetap_cocok(manajer):
+    ids = isi(manajer, 40)
+    manajer.tandai_selesai_banyak(ids[:15])
+    manajer.hapus_banyak(ids[10:20])
+    manajer.ubah_status_dengan_filter("In Progress", {"status_filter": "Pending"})
+    assert _cocok(manajer)
+
+def test_hitung_total_dari_rekap(manajer):
+    manajer.tambah_tugas_batch([buat_tugas(i, deadline=TANGGAL + datetime.timedelta(days=i % 4)) for i in range(20)])
+    assert manajer.hitung_total_tugas() == 20
+    assert manajer.hitung_total_tugas(TANGGAL) == 5
+    assert manajer.hitung_total_tugas(rentang=(TANGGAL, TANGGAL + datetime.timedelta(days=1))) == 10
+
+def test_bangun_ulang_memperbaiki_selisih(manajer):
+    isi(manajer, 5)
+    with manajer.db.koneksi() as conn:
+        with conn:
+            conn.execute("UPDATE rekap_harian SET jumlah = 99")
+        assert rekap_harian.verifikasi(conn) == [("2026-03-10", "Pending", "Medium", 99, 5)]
+        assert rekap_harian.bangun_ulang(conn) == 1
+        assert rekap_harian.verifikasi(conn) == []
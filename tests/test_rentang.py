@@ -0,0 +1,40 @@
+# tests/test_rentang.py
+import datetime
+
+from conftest import isi
+from manajer_tugas import rentang_ke_depan
+
+def hari(n: int) -> datetime.date:
+    return datetime.date(2026, 3, 1) + datetime.timedelta(days=n)
+
+def test_rentang_ke_depan():
+    assert rentang_ke_depan(7, hari(0)) == (hari(0), hari(6))
+    assert rentang_ke_depan(0, hari(0)) == (hari(0), hari(0))
+
+def test_rentang_inklusif_dan_terbuka(manajer):
+    for n in range(10):
+        isi(manajer, 1, deadline=hari(n))
+    assert len(manajer.get_dataframe_tugas(rentang=(hari(2), hari(4)))) == 3
+    assert len(manajer.get_dataframe_tugas(rentang=(hari(7), None))) == 3
+    assert len(manajer.get_dataframe_tugas(rentang=(None, hari(1)))) == 2
+    assert manajer.hitung_total_tugas(rentang=(hari(2), hari(4))) == 3
+    assert manajer.ringkasan(rentang=(hari(2), hari(4))).total == 3
+
+def test_filter_rentang_memakai_indeks(manajer):
+    from manajer_tugas import _bangun_filter
+    where, params = _bangun_filter(rentang=(hari(2), hari(4)))
+    with manajer.db.koneksi() as conn:
+        rencana = " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN SELECT id FROM tugas_data" + where, params))
+    assert "USING" in rencana and "INDEX" in rencana
+
+def test_berikutnya_urut_deadline_lalu_prioritas(manajer):
+    isi(manajer, 1, deadline=hari(3), prioritas="Low")
+    isi(manajer, 1, deadline=hari(2), prioritas="Low")
+    isi(manajer, 1, deadline=hari(2), prioritas="High")
+    isi(manajer, 1, deadline=hari(1), prioritas="High", status="Complete")
+    isi(manajer, 1, deadline=hari(-1), prioritas="High")
+    df = manajer.berikutnya(3, dari=hari(0))
+    assert list(zip(df["deadline"].dt.date, df["prioritas"])) == [(hari(2), "High"), (hari(2), "Low"), (hari(3), "Low")]
+    semua = manajer.berikutnya(10, dari=hari(0), termasuk_selesai=True)
+    assert semua["deadline"].dt.date.iloc[0] == hari(1)
+    assert len(manajer.berikutnya(10, dari=hari(0), prioritas_filter="Low")) == 2
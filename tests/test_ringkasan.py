@@ -0,0 +1,49 @@
+# tests/test_ringkasan.py
+import datetime
+import itertools
+
+from conftest import TANGGAL, buat_tugas
+from konfigurasi import DAFTAR_PRIORITAS, STATUS_TUGAS
+
+def _isi_campuran(manajer):
+    kombinasi = list(itertools.product(STATUS_TUGAS, DAFTAR_PRIORITAS, range(3)))
+    tugas = [buat_tugas(i, deadline=TANGGAL + datetime.timedelta(days=hari), prioritas=prioritas, status=status)
+             for i, (status, prioritas, hari) in enumerate(kombinasi)]
+    manajer.tambah_tugas_batch(tugas)
+    return tugas
+
+def _hitung(tugas, saring=lambda t: True):
+    silang = {}
+    for t in filter(saring, tugas):
+        silang[(t.status, t.prioritas)] = silang.get((t.status, t.prioritas), 0) + 1
+    return silang
+
+def test_ringkasan_sama_dengan_hitungan_python(manajer):
+    tugas = _isi_campuran(manajer)
+    ringkasan = manajer.ringkasan()
+    assert ringkasan.total == len(tugas)
+    assert ringkasan.silang == _hitung(tugas)
+    assert ringkasan.per_status == {s: len(DAFTAR_PRIORITAS) * 3 for s in sorted(STATUS_TUGAS)}
+
+def test_ringkasan_per_tanggal_dan_rentang(manajer):
+    tugas = _isi_campuran(manajer)
+    besok = TANGGAL + datetime.timedelta(days=1)
+    assert manajer.ringkasan(tanggal=besok).silang == _hitung(tugas, lambda t: t.deadline == besok)
+    assert manajer.ringkasan(rentang=(besok, besok + datetime.timedelta(days=5))).total == len(tugas) * 2 // 3
+
+def test_ringkasan_kosong(manajer):
+    ringkasan = manajer.ringkasan()
+    assert ringkasan.total == 0 and ringkasan.df_status().empty
+
+def test_dataframe_ringkasan(manajer):
+    _isi_campuran(manajer)
+    ringkasan = manajer.ringkasan()
+    assert ringkasan.df_status()["Jumlah Tugas"].sum() == ringkasan.total
+    assert ringkasan.df_prioritas()["Jumlah"].sum() == ringkasan.total
+    assert ringkasan.df_silang().values.sum() == ringkasan.total
+
+def test_ringkasan_mengikuti_penulisan(manajer):
+    _isi_campuran(manajer)
+    sebelum = manajer.ringkasan().per_status["Complete"]
+    manajer.tandai_selesai(int(manajer.get_dataframe_tugas(status_filter="Pending")["id"].iloc[0]))
+    assert manajer.ringkasan().per_status["Complete"] == sebelum + 1
@@ -0,0 +1,125 @@
+# tests/test_shard.py
+import os
+
+import pytest
+
+import konfigurasi
+import shard
+from conftest import isi
+from shard import RouterShard, validasi_tenant
+
+FOLDER_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def router(tmp_path):
+    r = RouterShard(str(tmp_path / "tenant"), ukuran_pool=1, maks_terbuka=2)
+    yield r
+    r.tutup()
+
+def test_validasi_tenant():
+    assert validasi_tenant("andi_01") == "andi_01"
+    for buruk in ("", "../x", "a/b", ".tersembunyi", "x" * 65, None):
+        with pytest.raises(ValueError):
+            validasi_tenant(buruk)
+
+def test_data_tenant_terpisah(router):
+    isi(router.manajer("andi"), 3)
+    isi(router.manajer("budi"), 1)
+    assert router.manajer("andi").hitung_total_tugas() == 3
+    assert router.manajer("budi").hitung_total_tugas() == 1
+    assert router.manajer("andi") is router.manajer("andi")
+    assert router.daftar_tenant() == ["andi", "budi"]
+    assert os.path.exists(router.path_untuk("andi"))
+
+def test_shard_lama_ditutup_lalu_dibuka_lagi(router):
+    for tenant in ("a", "b", "c"):
+        isi(router.manajer(tenant), 1)
+    terbuka = [t for t, m in router._manajer.items() if m.db._pool is not None]
+    assert terbuka == ["b", "c"]
+    assert router.manajer("a").hitung_total_tugas() == 1  # Pool dibuat ulang saat dipakai
+    router.manajer("c")
+    assert router._manajer["b"].db._pool is None  # Sekarang "b" yang paling lama tidak dipakai
+
+def test_manajer_tanpa_buat(router):
+    with pytest.raises(KeyError):
+        router.manajer("baru", buat=False)
+    assert not os.path.exists(router.path_untuk("baru"))
+
+def test_fan_out_tidak_membuat_shard_dan_mengumpulkan_error(router):
+    isi(router.manajer("andi"), 2)
+    isi(router.manajer("budi"), 3, status="Complete")
+    hasil, gagal = router.untuk_semua(lambda m: m.hitung_total_tugas(), ["andi", "budi", "hantu", "../x"])
+    assert hasil == {"andi": 2, "budi": 3}
+    assert isinstance(gagal["hantu"], KeyError) and isinstance(gagal["../x"], ValueError)
+    assert router.daftar_tenant() == ["andi", "budi"]
+
+def test_ringkasan_semua(router):
+    isi(router.manajer("andi"), 2)
+    isi(router.manajer("budi"), 3, status="Complete")
+    laporan = router.ringkasan_semua()
+    assert laporan.gabungan.total == 5 and not laporan.gagal
+    assert laporan.gabungan.per_status == {"Complete": 3, "Pending": 2}
+    assert router.hitung_total_semua() == {"andi": 2, "budi": 3}
+
+def test_cli(router, capsys):
+    isi(router.manajer("andi"), 2)
+    router.tutup()
+    assert shard.main(["--folder", router.folder, "--daftar", "--total", "--tenant", "andi", "hantu"]) == 0
+    keluaran = capsys.readouterr().out
+    assert "andi" in keluaran and "GAGAL hantu" in keluaran
+    assert not os.path.exists(router.path_untuk("hantu"))
+    assert shard.main(["--folder", router.folder, "--total", "--tenant", "../x"]) == 1
+
+def test_cli_buat_tenant(router, capsys):
+    assert shard.main(["--folder", router.folder, "--buat", "andi"]) == 0
+    assert shard.main(["--folder", router.folder, "--buat", "andi", "budi"]) == 0
+    keluaran = capsys.readouterr().out.split("\n")
+    assert keluaran[0].split() == ["andi", "dibuat"] and keluaran[1].split() == ["andi", "sudah", "ada"]
+    assert router.daftar_tenant() == ["andi", "budi"]
+    assert router.manajer("budi", buat=False).hitung_total_tugas() == 0
+    assert shard.main(["--folder", router.folder, "--buat", "../x"]) == 1
+
+def test_app_tidak_membuat_shard_untuk_tenant_asing(router, monkeypatch):
+    testing = pytest.importorskip("streamlit.testing.v1")
+    import streamlit as st
+    path_app = os.path.join(FOLDER_REPO, "main_app.py")
+    monkeypatch.setattr(konfigurasi, "MODE_TENANT", True)
+    monkeypatch.setattr(konfigurasi, "SHARD_FOLDER", router.folder)
+    isi(router.manajer("andi"), 2)
+
+    def jalankan(tenant):
+        st.cache_resource.clear()  # Router baru dengan SHARD_FOLDER di atas
+        at = testing.AppTest.from_file(path_app, default_timeout=30)
+        at.query_params["tenant"] = tenant
+        at.run()
+        assert not at.exception
+        return at
+
+    try:
+        assert "belum terdaftar" in jalankan("hantu").error[0].value
+        assert not os.path.exists(router.path_untuk("hantu"))
+        assert not jalankan("andi").error
+        # Dengan header tepercaya, ?tenant= di URL diabaikan
+        monkeypatch.setattr(konfigurasi, "TENANT_HEADER", "X-Forwarded-User")
+        assert "Identitas tenant" in jalankan("andi").error[0].value
+    finally:
+        st.cache_resource.clear()
+
+def test_halaman_diagnostik_butuh_token(monkeypatch):
+    testing = pytest.importorskip("streamlit.testing.v1")
+    path_app = os.path.join(FOLDER_REPO, "main_app.py")
+
+    def jalankan(token_url):
+        at = testing.AppTest.from_file(path_app, default_timeout=30)
+        if token_url is not None:
+            at.query_params["diagnostik"] = token_url
+        at.run()
+        assert not at.exception
+        return [h.value for h in at.header]
+
+    monkeypatch.setattr(konfigurasi, "DIAGNOSTIK_TOKEN", "")
+    assert "🩺 Diagnostik" not in jalankan("apa saja")
+    monkeypatch.setattr(konfigurasi, "DIAGNOSTIK_TOKEN", "rahasia")
+    assert "🩺 Diagnostik" not in jalankan(None)
+    assert "🩺 Diagnostik" not in jalankan("salah")
+    assert "🩺 Diagnostik" in jalankan("rahasia")
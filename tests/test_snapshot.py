@@ -0,0 +1,123 @@
+# tests/test_snapshot.py
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import database
+from conftest import buat_tugas, isi
+
+@pytest.fixture
+def snapshot(basis_data):
+    snap = database.SnapshotBaca(basis_data.db_path, basi_maks=0, jumlah_salinan=2)
+    yield snap
+    snap.tutup()
+
+def hitung(conn) -> int:
+    return conn.execute("SELECT COUNT(*) FROM tugas").fetchone()[0]
+
+def test_snapshot_mengikuti_commit_setelah_basi_maks(manajer, snapshot):
+    isi(manajer, 2)
+    with snapshot.koneksi() as conn:
+        assert hitung(conn) == 2
+    versi = snapshot.versi
+    isi(manajer, 1)
+    with snapshot.koneksi() as conn:
+        assert hitung(conn) == 3
+    assert snapshot.versi == versi + 1
+    with snapshot.koneksi() as conn:
+        hitung(conn)
+    assert snapshot.versi == versi + 1  # Tanpa commit baru tidak disalin ulang
+
+def test_snapshot_tidak_disalin_sebelum_basi_maks(manajer, basis_data):
+    snap = database.SnapshotBaca(basis_data.db_path, basi_maks=3600)
+    try:
+        isi(manajer, 1)
+        with snap.koneksi() as conn:
+            assert hitung(conn) == 1
+        isi(manajer, 1)
+        with snap.koneksi() as conn:
+            assert hitung(conn) == 1
+        assert snap.info()["ada_perubahan"]
+        assert snap.segarkan(paksa=True)
+        with snap.koneksi() as conn:
+            assert hitung(conn) == 2
+    finally:
+        snap.tutup()
+
+def test_salinan_pembaca_hanya_baca(manajer, snapshot):
+    isi(manajer, 1)
+    with snapshot.koneksi() as conn:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM tugas_data")
+    with manajer.db.koneksi() as conn:
+        assert hitung(conn) == 1
+
+def test_pembaca_bersamaan_tidak_saling_menunggu(manajer, snapshot):
+    isi(manajer, 3)
+    dipinjam, lepas = threading.Event(), threading.Event()
+
+    def laporan_lambat():
+        with snapshot.koneksi() as conn:
+            hitung(conn)
+            dipinjam.set()
+            lepas.wait(5)
+
+    t = threading.Thread(target=laporan_lambat)
+    t.start()
+    try:
+        assert dipinjam.wait(5)
+        mulai = time.perf_counter()
+        with snapshot.koneksi() as conn:
+            assert hitung(conn) == 3
+        assert time.perf_counter() - mulai < 1
+        assert snapshot.info()["salinan"]["dibuat"] == 2
+    finally:
+        lepas.set()
+        t.join()
+
+def test_pembaca_menunggu_jika_semua_salinan_dipinjam(manajer, basis_data):
+    snap = database.SnapshotBaca(basis_data.db_path, jumlah_salinan=1)
+    hasil = []
+
+    def baca():
+        with snap.koneksi() as conn:
+            hasil.append(hitung(conn))
+
+    try:
+        with snap.koneksi():
+            t = threading.Thread(target=baca)
+            t.start()
+            time.sleep(0.1)
+            assert hasil == []
+        t.join(5)
+        assert hasil == [0]
+    finally:
+        snap.tutup()
+
+def test_pemakaian_bertingkat_memakai_koneksi_yang_sama(snapshot):
+    with snapshot.koneksi() as luar:
+        with snapshot.koneksi() as dalam:
+            assert dalam is luar
+    assert snapshot.info()["salinan"]["dibuat"] == 1
+
+def test_tutup(manajer, snapshot):
+    isi(manajer, 1)
+    with snapshot.koneksi() as conn:
+        snapshot.tutup()
+        assert hitung(conn) == 1  # Salinan yang dipinjam tetap bisa dipakai sampai dikembalikan
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    with pytest.raises(sqlite3.ProgrammingError):
+        with snapshot.koneksi():
+            pass
+    assert snapshot.info()["salinan"]["dibuat"] == 0
+
+def test_koneksi_baca_basis_data(manajer, basis_data, monkeypatch):
+    monkeypatch.setattr(database, "snapshot_aktif", True)
+    isi(manajer, 2)
+    with basis_data.koneksi_baca() as conn:
+        assert hitung(conn) == 2
+    assert basis_data.versi_baca() == basis_data.snapshot.versi >= 1
+    assert manajer.tambah_tugas(buat_tugas(5))
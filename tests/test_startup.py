@@ -0,0 +1,42 @@
+# tests/test_startup.py
+import os
+import subprocess
+import sys
+
+import database
+import profil_startup
+from manajer_tugas import ManajerTugas
+
+FOLDER_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_import_modul_aplikasi_tanpa_pandas(tmp_path):
+    skrip = ("import sys, konfigurasi, model, database, manajer_tugas, manajer_tugas_async;"
+             "print(sorted(m for m in ('pandas', 'matplotlib', 'numpy') if m in sys.modules))")
+    proses = subprocess.run([sys.executable, "-c", skrip], cwd=tmp_path, capture_output=True, text=True,
+                            env=dict(os.environ, PYTHONPATH=FOLDER_REPO))
+    assert proses.returncode == 0, proses.stderr
+    assert proses.stdout.strip() == "[]"
+
+def test_skema_dicek_sekali_per_database(tmp_path, monkeypatch):
+    bd = database.BasisData(str(tmp_path / "sekali.db"), ukuran_pool=1)
+    panggilan = []
+    asli = bd.setup_database_initial
+    monkeypatch.setattr(bd, "setup_database_initial", lambda: panggilan.append(1) or asli())
+    try:
+        ManajerTugas(basis_data=bd)
+        ManajerTugas(basis_data=bd)
+        assert bd.skema_siap and len(panggilan) == 1
+    finally:
+        bd.tutup()
+
+def test_ganti_database_mengulang_pengecekan_skema(tmp_path):
+    database.ganti_database(str(tmp_path / "lain.db"))
+    assert not database.get_basis_data().skema_siap
+    ManajerTugas()
+    assert database.get_basis_data().skema_siap
+
+def test_pola_importtime():
+    cocok = profil_startup._POLA_IMPORTTIME.match("import time:       512 |       2048 | pandas")
+    assert cocok and cocok.group(2) == "2048" and cocok.group(4) == "pandas" and not cocok.group(3)
+    anak = profil_startup._POLA_IMPORTTIME.match("import time:        10 |         10 |   pandas.core")
+    assert anak and anak.group(3)